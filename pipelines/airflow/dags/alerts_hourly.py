@@ -6,16 +6,46 @@ from airflow import DAG
 from airflow.operators.python import PythonOperator
 
 def _task():
+    import pandas as pd
+
     from cdc_platform.common.io import read_csv
+    from cdc_platform.data.storage.master_store import load_master
     from cdc_platform.config.settings import settings
-    from cdc_platform.serving.jobs.hourly_alerts import run_hourly_alerts
+    from cdc_platform.serving.jobs.hourly_alerts import (
+        run_hourly_alerts,
+        run_hourly_alerts_incremental,
+        run_hourly_changepoints,
+    )
+
+    alerts_path = settings.processed_dir / "alerts.csv"
+    state_path = settings.processed_dir / "alerts_state.json"
+    df = load_master(columns=["date", "region", "cases", "surge_prob_gb", "hosp_next7_pred"])
+    if df is None:
+        return
+
+    # streaming changepoints on newly arrived days; resumes per-region detector state
+    flags = run_hourly_changepoints(df, settings.processed_dir / "changepoints_state.json")
+    if not flags.empty:
+        cp_path = settings.processed_dir / "changepoints.csv"
+        flags.to_csv(cp_path, mode="a", header=not cp_path.exists(), index=False)
+
+    # first run (or lost state): full evaluation seeds alerts.csv and the state
+    if not (alerts_path.exists() and state_path.exists()):
+        state_path.unlink(missing_ok=True)
+        run_hourly_alerts_incremental(df, state_path)
+        run_hourly_alerts(df).to_csv(alerts_path, index=False)
+        return
 
-    master_path = settings.processed_dir / "master.csv"
-    if not master_path.exists():
+    delta = run_hourly_alerts_incremental(df, state_path)
+    if delta.empty:
         return
-    df = read_csv(master_path)
-    alerts_df = run_hourly_alerts(df)
-    alerts_df.to_csv(settings.processed_dir / "alerts.csv", index=False)
+    alerts = read_csv(alerts_path)
+    key = ["region", "date"]
+    alerts = alerts.merge(delta[key], on=key, how="left", indicator=True)
+    alerts = alerts.loc[alerts["_merge"] == "left_only"].drop(columns="_merge")
+    upserts = delta.loc[delta["change"] != "cleared", alerts.columns.tolist()]
+    alerts = pd.concat([alerts, upserts], ignore_index=True).sort_values(["date", "region"], kind="stable")
+    alerts.to_csv(alerts_path, index=False)
 
 with DAG(
     dag_id="alerts_hourly",
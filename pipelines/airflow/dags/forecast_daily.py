@@ -6,24 +6,27 @@ from airflow import DAG
 from airflow.operators.python import PythonOperator
 
 def _task():
-    from cdc_platform.common.io import read_csv
+    from cdc_platform.data.storage.master_store import load_master
     from cdc_platform.config.settings import settings
-    from cdc_platform.modeling.seir.forecasting import forecast_cases_seir
+    from cdc_platform.modeling.seir.cache import default_calibration_cache
+    from cdc_platform.modeling.seir.forecasting import forecast_all_regions
+    from cdc_platform.serving.registry.model_registry import seir_calibration_cache_path
     import pandas as pd
 
-    master_path = settings.processed_dir / "master.csv"
-    if not master_path.exists():
+    df = load_master(columns=["date", "region", "cases"])
+    if df is None:
         return
-    df = read_csv(master_path)
-    df["date"] = pd.to_datetime(df["date"])
 
-    rows = []
-    for region, g in df.groupby("region"):
-        g = g.sort_values("date")
-        out = forecast_cases_seir(g["cases"], pop=1_000_000, horizon_days=28)
-        rows.append({"region": region, "rt0_est": out["rt0_est"], "forecast_sum_28d": float(sum(out["forecast"]))})
+    # all regions calibrated + simulated together; fits are shared with the API/dashboard
+    cache_path = seir_calibration_cache_path()
+    default_calibration_cache.load(cache_path)
+    bands = forecast_all_regions(df, pop=1_000_000, horizon_days=28)
+    default_calibration_cache.save(cache_path)
+    bands.to_csv(settings.processed_dir / "forecasts_quantiles.csv", index=False)
 
-    pd.DataFrame(rows).to_csv(settings.processed_dir / "forecasts_summary.csv", index=False)
+    fut = bands[bands["kind"] == "forecast"]
+    summary = fut.groupby("region").agg(rt0_est=("rt0_est", "first"), forecast_sum_28d=("q50", "sum")).reset_index()
+    summary.to_csv(settings.processed_dir / "forecasts_summary.csv", index=False)
 
 with DAG(
     dag_id="forecast_daily",
@@ -6,16 +6,17 @@ from airflow import DAG
 from airflow.operators.python import PythonOperator
 
 def _task():
-    # In real use, call your CLI or python entrypoint.
-    # Example: run nightly pipeline + write master.csv
-    from cdc_platform.serving.jobs.nightly_pipeline import run_nightly_pipeline
-    from cdc_platform.common.io import write_csv
-    from cdc_platform.config.settings import settings
+    # Upsert only new dates plus the reporting-delay revision window into the
+    # partitioned master store (the first run seeds 180 days).
+    from cdc_platform.data.storage.master_store import load_master
+    from cdc_platform.serving.jobs.nightly_pipeline import run_incremental_nightly
+    from cdc_platform.serving.snapshot import master_state
 
     end = datetime.utcnow().date().isoformat()
-    start = (datetime.utcnow().date() - timedelta(days=180)).isoformat()
-    master = run_nightly_pipeline(start, end)
-    write_csv(master, settings.processed_dir / "master.csv")
+    summary = run_incremental_nightly(end, initial_days=180)
+    # new read-only snapshot for the API workers
+    summary["snapshot"] = master_state.publish(load_master(parse_dates=True))
+    return summary
 
 with DAG(
     dag_id="ingest_daily",
@@ -6,15 +6,14 @@ from airflow import DAG
 from airflow.operators.python import PythonOperator
 
 def _task():
-    from cdc_platform.common.io import read_csv
+    from cdc_platform.data.storage.master_store import load_master
     from cdc_platform.config.settings import settings
     from cdc_platform.modeling.nowcasting.nowcast import nowcast_latest_cases
     import pandas as pd
 
-    master_path = settings.processed_dir / "master.csv"
-    if not master_path.exists():
+    df = load_master(columns=["date", "region", "cases"])
+    if df is None:
         return
-    df = read_csv(master_path)
     out = []
     for region, g in df.groupby("region"):
         out.append({"region": region, **nowcast_latest_cases(g)})
@@ -3,17 +3,15 @@ from __future__ import annotations
 from pathlib import Path
 import pandas as pd
 
-from cdc_platform.common.io import read_csv
+from cdc_platform.data.storage.master_store import load_master
 from cdc_platform.config.settings import settings
 from cdc_platform.modeling.early_warning.alert_rules import generate_alerts
 
 
 def main():
-    master_path = settings.processed_dir / "master.csv"
-    if not master_path.exists():
-        raise SystemExit("Missing master.csv. Run `cdc ingest ...` or scripts/seed_demo_data.py first.")
-
-    df = read_csv(master_path)
+    df = load_master(columns=["date", "region", "cases", "surge_prob_gb", "hosp_next7_pred"])
+    if df is None:
+        raise SystemExit("Missing master table. Run `cdc ingest ...` or scripts/seed_demo_data.py first.")
     alerts = generate_alerts(df)
     out_dir = settings.repo_root / "reports"
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,6 @@
 #!/usr/bin/env bash
 set -e
-# 1) create master.csv
+# 1) create the master table (Parquet with the [parquet] extra, else CSV)
 python -m cdc_platform.cli.main ingest --start 2025-09-01 --end 2026-01-01
 # 2) train risk model artifact
 python -m cdc_platform.cli.main train-risk
@@ -1,15 +1,15 @@
 from __future__ import annotations
 import typer
 import pandas as pd
-from ...common.io import read_csv, write_csv
+from ...common.io import write_table
+from ...data.storage.master_store import load_master
+from ...common.schema import MASTER_SCHEMA
 from ...config.settings import settings
 
 def features_cmd():
-    path = settings.processed_dir / "master.csv"
-    if not path.exists():
-        raise typer.BadParameter("Missing master.csv. Run `cdc ingest --start ... --end ...` first.")
-    df = read_csv(path)
+    df = load_master()
+    if df is None:
+        raise typer.BadParameter("Missing master table. Run `cdc ingest --start ... --end ...` first.")
     # already feature-built in nightly pipeline; in a real build you'd expand here
-    out_path = settings.processed_dir / "features.csv"
-    write_csv(df, out_path)
+    out_path = write_table(df, settings.processed_dir / "features", schema=MASTER_SCHEMA)
     typer.echo(f"Wrote: {out_path}")
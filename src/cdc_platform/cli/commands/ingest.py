@@ -1,11 +1,14 @@
 from __future__ import annotations
 import typer
 from ...serving.jobs.nightly_pipeline import run_nightly_pipeline
-from ...common.io import write_csv
-from ...config.settings import settings
+from ...data.storage.master_store import default_master_store, load_master
+from ...serving.snapshot import master_state
 
 def ingest_cmd(start: str = typer.Option(...), end: str = typer.Option(...)):
     master = run_nightly_pipeline(start, end)
-    out_path = settings.processed_dir / "master.csv"
-    write_csv(master, out_path)
-    typer.echo(f"Wrote: {out_path}")
+    store = default_master_store()
+    months = store.upsert(master)
+    typer.echo(f"Upserted {len(master)} rows ({len(months)} month partitions) into: {store.root}")
+    # running API workers pick this up on their next snapshot poll
+    version = master_state.publish(load_master(store=store, parse_dates=True))
+    typer.echo(f"Published snapshot: {version}")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from typing import List
+
+import typer
+
+from ...common.io import HAS_PARQUET, migrate_table, resolve_table
+from ...config.settings import settings
+
+def migrate_storage_cmd(
+    to: str = typer.Option("parquet", help="Target format: parquet | csv."),
+    table: List[str] = typer.Option(["master", "features"], help="Tables under processed_dir; repeat for several."),
+    keep_source: bool = typer.Option(False, help="Keep the original file next to the migrated one."),
+):
+    if to not in ("parquet", "csv"):
+        raise typer.BadParameter("--to must be 'parquet' or 'csv'.")
+    if to == "parquet" and not HAS_PARQUET:
+        raise typer.BadParameter("Parquet needs pyarrow: pip install 'cdc-surveillance-forecasting-platform[parquet]'")
+    for name in table:
+        src = resolve_table(settings.processed_dir / name)
+        if not src.exists():
+            typer.echo(f"Skip (missing): {name}")
+            continue
+        dst = migrate_table(src, fmt=to, keep_source=keep_source)
+        typer.echo(f"{src.name} -> {dst}")
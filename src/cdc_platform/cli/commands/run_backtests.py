@@ -1,28 +1,49 @@
 
 from __future__ import annotations
 
+import time
+from typing import List
+
 import typer
-import pandas as pd
 
-from ...common.io import read_csv, write_csv
+from ...common.io import ensure_dir
+from ...data.storage.master_store import load_master
 from ...config.settings import settings
-from ...modeling.evaluation.backtesting import rolling_backtest_seir
-
+from ...modeling.evaluation.parallel_backtest import iter_backtests
 
-def run_backtests_cmd(population: int = typer.Option(1_000_000), horizon_days: int = typer.Option(14)):
-    master_path = settings.processed_dir / "master.csv"
-    if not master_path.exists():
-        raise typer.BadParameter("Missing master.csv. Run `cdc ingest --start ... --end ...` first.")
-    df = read_csv(master_path)
-    df["date"] = pd.to_datetime(df["date"])
 
-    frames = []
-    for region, g in df.groupby("region"):
-        bt = rolling_backtest_seir(g, pop=int(population), horizon_days=int(horizon_days))
-        bt["region"] = region
-        frames.append(bt)
+def run_backtests_cmd(
+    population: List[int] = typer.Option([1_000_000], help="Repeat to sweep several populations."),
+    horizon_days: List[int] = typer.Option([14], help="Repeat to sweep several horizons."),
+    workers: int = typer.Option(1, help="Process pool size; 1 runs serially."),
+    chunk_size: int = typer.Option(0, help="Cutoffs per task; 0 runs each series as one task."),
+):
+    df = load_master(columns=["date", "region", "cases"], parse_dates=True)
+    if df is None:
+        raise typer.BadParameter("Missing master table. Run `cdc ingest --start ... --end ...` first.")
 
-    out = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     out_path = settings.repo_root / "reports" / "backtests.csv"
-    write_csv(out, out_path)
+    ensure_dir(out_path.parent)
+
+    # Stream results to disk as tasks complete
+    started = time.perf_counter()
+    n_done = n_cutoffs = 0
+    with out_path.open("w", newline="") as f:
+        for task, bt, total in iter_backtests(
+            df,
+            populations=population,
+            horizons=horizon_days,
+            workers=int(workers),
+            chunk_size=int(chunk_size) or None,
+        ):
+            bt.to_csv(f, header=(n_done == 0), index=False)
+            f.flush()
+            n_done += 1
+            n_cutoffs += len(bt)
+            elapsed = time.perf_counter() - started
+            typer.echo(
+                f"[{n_done}/{total}] {task.region} pop={task.population} h={task.horizon_days} "
+                f"({n_cutoffs / max(elapsed, 1e-9):.1f} cutoffs/s)"
+            )
+
     typer.echo(f"Wrote: {out_path}")
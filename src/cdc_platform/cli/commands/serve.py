@@ -1,17 +1,19 @@
 from __future__ import annotations
 import typer
 import uvicorn
-import pandas as pd
 
 from ...config.settings import settings
-from ...common.io import read_csv
+from ...data.storage.master_store import load_master
 from ...serving.api.main import app, wire_master_cache
 
-def serve_cmd():
-    # Load cache if available
-    master_path = settings.processed_dir / "master.csv"
-    if master_path.exists():
-        df = read_csv(master_path)
-        wire_master_cache(df)
+def serve_cmd(workers: int = typer.Option(1, help="Uvicorn worker processes; all map one snapshot.")):
+    # Publish the master snapshot once; workers map it read-only on startup
+    df = load_master()
+    if df is not None:
+        wire_master_cache(df, publish=True)
 
-    uvicorn.run(app, host=settings.api_host, port=settings.api_port, log_level="info")
+    if workers > 1:
+        uvicorn.run("cdc_platform.serving.api.main:app", host=settings.api_host, port=settings.api_port,
+                    workers=workers, log_level="info")
+    else:
+        uvicorn.run(app, host=settings.api_host, port=settings.api_port, log_level="info")
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import typer
 
-from ...common.io import read_csv, write_csv
+from ...common.io import write_csv
+from ...data.storage.master_store import load_master
 from ...config.settings import settings
 from ...modeling.risk_scoring.sklearn_models import train_ml_models, score_latest
 from ...serving.registry.model_registry import ml_artifacts_path
@@ -10,11 +11,9 @@ from ...serving.registry.artifacts_ml import save_ml_artifacts
 
 
 def train_ml_cmd():
-    master_path = settings.processed_dir / "master.csv"
-    if not master_path.exists():
-        raise typer.BadParameter("Missing master.csv. Run `cdc ingest --start ... --end ...` first.")
-
-    df = read_csv(master_path)
+    df = load_master()
+    if df is None:
+        raise typer.BadParameter("Missing master table. Run `cdc ingest --start ... --end ...` first.")
 
     feature_cols = [
         "cases_lag1", "cases_lag7", "cases_lag14",
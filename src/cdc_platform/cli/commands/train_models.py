@@ -2,17 +2,16 @@ from __future__ import annotations
 import typer
 import numpy as np
 import pandas as pd
-from ...common.io import read_csv
+from ...data.storage.master_store import load_master
 from ...config.settings import settings
 from ...modeling.risk_scoring.train import train_risk_model
 from ...serving.registry.model_registry import risk_model_path
 from ...serving.registry.artifacts import save_risk_model
 
 def train_risk_cmd():
-    path = settings.processed_dir / "master.csv"
-    if not path.exists():
-        raise typer.BadParameter("Missing master.csv. Run `cdc ingest --start ... --end ...` first.")
-    df = read_csv(path)
+    df = load_master()
+    if df is None:
+        raise typer.BadParameter("Missing master table. Run `cdc ingest --start ... --end ...` first.")
 
     feature_cols = [
         "cases_lag1", "cases_lag7", "cases_lag14",
@@ -7,6 +7,7 @@ from .commands.serve import serve_cmd
 from .commands.run_backtests import run_backtests_cmd
 from .commands.train_ml import train_ml_cmd
 from .commands.train_bayes import train_bayes_cmd
+from .commands.migrate_storage import migrate_storage_cmd
 
 app = typer.Typer(add_completion=False)
 
@@ -17,6 +18,7 @@ app.command("serve")(serve_cmd)
 app.command("run-backtests")(run_backtests_cmd)
 app.command("train-ml")(train_ml_cmd)
 app.command("train-bayes")(train_bayes_cmd)
+app.command("migrate-storage")(migrate_storage_cmd)
 def main():
     app()
 
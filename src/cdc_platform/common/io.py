@@ -2,6 +2,17 @@ from __future__ import annotations
 from pathlib import Path
 import pandas as pd
 
+from .schema import SCHEMAS, TableSchema
+
+try:  # optional: pip install "cdc-surveillance-forecasting-platform[parquet]"
+    import pyarrow  # noqa: F401
+    HAS_PARQUET = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAS_PARQUET = False
+
+# Preference order when a table exists in several formats
+TABLE_SUFFIXES = (".parquet", ".csv")
+
 def ensure_dir(p: Path) -> Path:
     p.mkdir(parents=True, exist_ok=True)
     return p
@@ -12,3 +23,91 @@ def read_csv(path: Path) -> pd.DataFrame:
 def write_csv(df: pd.DataFrame, path: Path) -> None:
     ensure_dir(path.parent)
     df.to_csv(path, index=False)
+
+def _format_suffix(fmt: str) -> str:
+    if fmt == "parquet" and HAS_PARQUET:
+        return ".parquet"
+    return ".csv"
+
+def resolve_table(path: Path, fmt: str | None = None) -> Path:
+    """
+    Map a table path (with or without suffix) to the file to use. An existing
+    file wins, Parquet before CSV; otherwise the suffix of `fmt` (default
+    settings.table_format, CSV when pyarrow is missing) is used for writing.
+    """
+    from ..config.settings import settings
+
+    base = path.with_suffix("") if path.suffix in TABLE_SUFFIXES else path
+    for suffix in TABLE_SUFFIXES:
+        candidate = base.with_suffix(suffix)
+        if candidate.exists() and (suffix != ".parquet" or HAS_PARQUET):
+            return candidate
+    return base.with_suffix(_format_suffix(fmt or settings.table_format))
+
+def _schema_for(path: Path, schema: TableSchema | None) -> TableSchema | None:
+    return schema if schema is not None else SCHEMAS.get(path.with_suffix("").name)
+
+def read_table(
+    path: Path,
+    columns: list[str] | None = None,
+    schema: TableSchema | None = None,
+    parse_dates: bool = False,
+) -> pd.DataFrame:
+    """
+    Read a stored table, dispatching on suffix (see resolve_table). Only
+    `columns` are read when given (Parquet skips the rest on disk); requested
+    columns the table lacks are skipped. The table's schema (looked up by
+    file stem when not passed) is applied.
+    """
+    path = resolve_table(path)
+    schema = _schema_for(path, schema)
+    if path.suffix == ".parquet":
+        if columns is not None:
+            import pyarrow.parquet as pq
+            present = set(pq.read_schema(path).names)
+            columns = [c for c in columns if c in present]
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        dtype = schema.csv_dtypes(columns) if schema is not None else None
+        wanted = None if columns is None else set(columns).__contains__
+        df = pd.read_csv(path, usecols=wanted, dtype=dtype)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return schema.coerce(df, parse_dates=parse_dates) if schema is not None else df
+
+def write_table(df: pd.DataFrame, path: Path, schema: TableSchema | None = None, fmt: str | None = None) -> Path:
+    """
+    Write df as a typed table; the format follows an explicit suffix on path,
+    else `fmt` / settings.table_format. Replaces the file atomically so
+    concurrent readers never see a partial table. Returns the written path.
+    """
+    if path.suffix not in TABLE_SUFFIXES:
+        from ..config.settings import settings
+        path = path.with_suffix(_format_suffix(fmt or settings.table_format))
+    schema = _schema_for(path, schema)
+    if schema is not None:
+        # dates are stored natively in Parquet and as ISO strings in CSV
+        df = schema.coerce(df, parse_dates=path.suffix == ".parquet")
+    ensure_dir(path.parent)
+    tmp = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        if not HAS_PARQUET:
+            raise RuntimeError("Parquet storage needs pyarrow: pip install 'cdc-surveillance-forecasting-platform[parquet]'")
+        df.to_parquet(tmp, index=False)
+    else:
+        df.to_csv(tmp, index=False)
+    tmp.replace(path)
+    return path
+
+def migrate_table(path: Path, fmt: str = "parquet", keep_source: bool = False) -> Path:
+    """Rewrite an existing table in another format; returns the new path."""
+    src = resolve_table(path)
+    if not src.exists():
+        raise FileNotFoundError(src)
+    dst = src.with_suffix(_format_suffix(fmt))
+    if dst == src:
+        return src
+    write_table(read_table(src), dst)
+    if not keep_source:
+        src.unlink()
+    return dst
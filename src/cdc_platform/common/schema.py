@@ -0,0 +1,117 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+
+# Logical column types understood by TableSchema
+DATE, STRING, INT, FLOAT = "date", "string", "int", "float"
+
+
+def _whole(s: pd.Series) -> bool:
+    """True if every value is a finite integer (safe to store as an integer dtype)."""
+    v = s.to_numpy(dtype=float)
+    return bool(np.all(np.isfinite(v) & (v == np.round(v))))
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """
+    Column -> logical type for a stored table. Columns not listed are kept
+    as-is; listed columns missing from a frame are skipped (optional features
+    such as ML scores are only present after `cdc train-ml`).
+    """
+    name: str
+    columns: dict[str, str] = field(default_factory=dict)
+
+    def coerce(self, df: pd.DataFrame, parse_dates: bool = False) -> pd.DataFrame:
+        """
+        Cast df to the schema. Dates become datetime64 when parse_dates, else
+        ISO "YYYY-MM-DD" strings (what CSV readers have always returned).
+        """
+        out = df.copy()
+        for col, kind in self.columns.items():
+            if col not in out.columns:
+                continue
+            s = out[col]
+            if kind == DATE:
+                if parse_dates:
+                    out[col] = pd.to_datetime(s)
+                elif not pd.api.types.is_string_dtype(s):
+                    out[col] = pd.to_datetime(s).dt.strftime("%Y-%m-%d")
+            elif kind == STRING:
+                out[col] = s.astype(str)
+            elif kind == INT:
+                s = pd.to_numeric(s)
+                # counts with gaps or fractional (imputed) values stay float
+                # rather than failing the cast or being truncated
+                out[col] = s.astype("int64") if _whole(s) else s.astype(float)
+            elif kind == FLOAT:
+                out[col] = pd.to_numeric(s).astype(float)
+        return out
+
+    def to_internal(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast df to the typed in-memory form passed between pipeline stages:
+        datetime64 dates, categorical strings, int32 counts and float32
+        measures. Counts with gaps or fractional (interpolated) values become
+        float32 instead; counts beyond the int32 range stay int64. Columns
+        already in their target dtype are left alone, so repeated calls are
+        cheap; strings are only produced on export (coerce).
+        """
+        out = df.copy()
+        for col, kind in self.columns.items():
+            if col not in out.columns:
+                continue
+            s = out[col]
+            if kind == DATE:
+                if not pd.api.types.is_datetime64_any_dtype(s):
+                    out[col] = pd.to_datetime(s)
+            elif kind == STRING:
+                if not isinstance(s.dtype, pd.CategoricalDtype):
+                    out[col] = s.astype("category")
+            elif kind == INT:
+                if s.dtype != np.int32:
+                    s = pd.to_numeric(s)
+                    if not _whole(s):
+                        out[col] = s.astype(np.float32)
+                    else:
+                        fits = not len(s) or s.abs().max() <= np.iinfo(np.int32).max
+                        out[col] = s.astype(np.int32 if fits else np.int64)
+            elif kind == FLOAT:
+                if s.dtype != np.float32:
+                    out[col] = pd.to_numeric(s).astype(np.float32)
+        return out
+
+    def csv_dtypes(self, columns: list[str] | None = None) -> dict[str, str]:
+        """dtype= for pd.read_csv; dates are parsed separately."""
+        kinds = {STRING: "str", FLOAT: "float64"}
+        return {
+            c: kinds[k] for c, k in self.columns.items()
+            if k in kinds and (columns is None or c in columns)
+        }
+
+
+MASTER_SCHEMA = TableSchema("master", {
+    "date": DATE,
+    "region": STRING,
+    "cases": INT,
+    "hosp": INT,
+    "ww_viral_load": FLOAT,
+    "mobility_index": FLOAT,
+    "cases_lag1": FLOAT,
+    "cases_lag7": FLOAT,
+    "cases_lag14": FLOAT,
+    "mobility_index_ma7": FLOAT,
+    "surge_prob_gb": FLOAT,
+    "surge_prob_rf": FLOAT,
+    "hosp_next7_pred": FLOAT,
+})
+
+ALERTS_SCHEMA = TableSchema("alerts", {
+    "date": DATE,
+    "region": STRING,
+    "level": STRING,
+    "reason": STRING,
+})
+
+SCHEMAS = {s.name: s for s in (MASTER_SCHEMA, ALERTS_SCHEMA)}
@@ -14,13 +14,27 @@ class Settings:
     data_dir: Path = Path(_env("DATA_DIR", "")) if _env("DATA_DIR", "") else Path(__file__).resolve().parents[3] / "data"
     processed_dir: Path = Path(_env("PROCESSED_DIR", "")) if _env("PROCESSED_DIR", "") else Path(__file__).resolve().parents[3] / "data" / "processed"
 
+    # Storage: "parquet" (needs the [parquet] extra, falls back to csv) | "csv"
+    table_format: str = _env("TABLE_FORMAT", "parquet") or "parquet"
+
     # API
     api_host: str = _env("API_HOST", "0.0.0.0") or "0.0.0.0"
     api_port: int = int(_env("API_PORT", "8000") or 8000)
+    # How often API workers check for a newly published master snapshot
+    snapshot_poll_seconds: float = float(_env("SNAPSHOT_POLL_SECONDS", "30") or 30)
+    # Memoized API responses, keyed by (snapshot version, route, params)
+    result_cache_size: int = int(_env("RESULT_CACHE_SIZE", "2048") or 2048)
+    result_cache_ttl_seconds: float = float(_env("RESULT_CACHE_TTL_SECONDS", "3600") or 3600)
+    # CPU-bound request work: pool size and distinct computations in flight before 503s
+    api_compute_workers: int = int(_env("API_COMPUTE_WORKERS", "2") or 2)
+    api_max_pending: int = int(_env("API_MAX_PENDING", "32") or 32)
 
     # Dashboard
     dashboard_title: str = _env("DASHBOARD_TITLE", "Infectious Disease Surveillance Platform") or "Infectious Disease Surveillance Platform"
 
+    # joblib mmap_mode for resident ML artifacts ("r" maps large arrays read-only; empty = load into memory)
+    artifact_mmap_mode: str | None = _env("ARTIFACT_MMAP_MODE", None)
+
     # Modeling defaults
     forecast_horizon_days: int = int(_env("FORECAST_HORIZON_DAYS", "28") or 28)
     nowcast_reporting_delay_days: int = int(_env("NOWCAST_DELAY_DAYS", "7") or 7)
@@ -4,38 +4,38 @@ import pandas as pd
 import streamlit as st
 
 from cdc_platform.config.settings import settings
-from cdc_platform.serving.jobs.nightly_pipeline import run_nightly_pipeline
-from cdc_platform.modeling.early_warning.alert_rules import generate_alerts
-from cdc_platform.modeling.seir.forecasting import forecast_cases_seir_with_uncertainty
+from cdc_platform.dashboard.data import (
+    load_shared_calibrations, load_window, region_alerts, region_forecast, window_controls,
+)
 
 st.set_page_config(page_title=settings.dashboard_title, layout="wide")
+
+load_shared_calibrations()
+
 st.title("🧬 " + settings.dashboard_title)
 
 with st.sidebar:
     st.header("Controls")
-    start = st.date_input("Start date", value=pd.Timestamp.today().date() - pd.Timedelta(days=120))
-    end = st.date_input("End date", value=pd.Timestamp.today().date())
+    start, end = window_controls(120)
     horizon = st.slider("Forecast horizon (days)", 7, 56, 28, 7)
     population = st.number_input("Population (for SEIR)", min_value=100_000, value=1_000_000, step=50_000)
     st.caption("Tip: run `cdc train-ml` to enable ML-driven alerts and dashboard risk tiles.")
 
-master = run_nightly_pipeline(str(start), str(end))
+master = load_window(start, end)
 
 st.subheader("Latest Surveillance Snapshot")
 col1, col2, col3 = st.columns(3)
-latest_date = pd.to_datetime(master["date"]).max().date().isoformat()
-col1.metric("Latest date", latest_date)
+latest = master["date"].max()
+col1.metric("Latest date", latest.date().isoformat())
 col2.metric("Regions", master["region"].nunique())
-col3.metric("Total cases (latest)", int(master[pd.to_datetime(master["date"]).dt.date.astype(str) == latest_date]["cases"].sum()))
+col3.metric("Total cases (latest)", int(master.loc[master["date"] == latest, "cases"].sum()))
 
 st.divider()
 
 regions = sorted(master["region"].unique().tolist())
 region = st.selectbox("Region", regions, index=0)
 
-g = master[master["region"] == region].copy()
-g["date"] = pd.to_datetime(g["date"])
-g = g.sort_values("date")
+g = master[master["region"] == region]  # window is sorted by (region, date)
 
 c1, c2 = st.columns([2, 1])
 
@@ -45,12 +45,12 @@ with c1:
 
 with c2:
     st.subheader("Early warning")
-    alerts = [a for a in generate_alerts(master) if a.region == region]
-    if not alerts:
+    alerts = region_alerts(start, end, region)
+    if alerts.empty:
         st.success("No active alerts.")
     else:
         st.warning(f"{len(alerts)} alerts flagged")
-        st.dataframe(pd.DataFrame([a.__dict__ for a in alerts]).sort_values(["date", "level"], ascending=[False, True]))
+        st.dataframe(alerts.sort_values(["date", "level"], ascending=[False, True]))
 
     # ML quick tile (if present)
     if "surge_prob_gb" in g.columns and "hosp_next7_pred" in g.columns:
@@ -65,14 +65,7 @@ with c2:
 st.divider()
 
 st.subheader("SEIR Forecast with Uncertainty Bands")
-out = forecast_cases_seir_with_uncertainty(
-    g["cases"],
-    pop=int(population),
-    horizon_days=int(horizon),
-    n_samples=250,
-    beta_sd_frac=0.15,
-    quantiles=(0.1, 0.5, 0.9),
-)
+out = region_forecast(start, end, region, horizon=int(horizon), pop=int(population), n_samples=250, beta_sd_frac=0.15)
 
 hist_idx = g["date"]
 fut_idx = pd.date_range(hist_idx.max() + pd.Timedelta(days=1), periods=horizon, freq="D")
@@ -0,0 +1,153 @@
+# src/cdc_platform/dashboard/data.py
+from __future__ import annotations
+
+from typing import Iterator
+
+import pandas as pd
+import streamlit as st
+
+from cdc_platform.common.schema import MASTER_SCHEMA
+from cdc_platform.dashboard.memo import RegionMemo
+from cdc_platform.data.storage.master_store import load_master, master_version
+from cdc_platform.modeling.early_warning.alert_rules import generate_alerts
+from cdc_platform.modeling.seir.cache import default_calibration_cache
+from cdc_platform.modeling.seir.forecasting import (
+    forecast_cases_seir_with_uncertainty, iter_forecast_cases_seir_with_uncertainty,
+)
+from cdc_platform.serving.jobs.nightly_pipeline import run_nightly_pipeline
+from cdc_platform.serving.registry.model_registry import seir_calibration_cache_path
+
+# (window, data version) results kept per server process, shared by all pages and sessions
+WINDOW_CACHE_ENTRIES = 8
+ALERT_COLS = ["date", "region", "level", "reason"]
+# Per-region results (alerts, forecast bands) kept in memory, and how many of
+# the most-viewed regions are precomputed in the background
+REGION_MEMO_ENTRIES = 512
+PREFETCH_TOP_REGIONS = 5
+BAND_QUANTILES = (0.1, 0.5, 0.9)
+# Progressive bands stop sampling once successive batches move them by less
+# than this fraction of their peak
+BAND_TOLERANCE = 0.05
+
+
+@st.cache_resource
+def load_shared_calibrations() -> int:
+    # SEIR fits persisted by the forecast DAG / API; loaded once per server process
+    return default_calibration_cache.load(seir_calibration_cache_path())
+
+
+@st.cache_data(max_entries=WINDOW_CACHE_ENTRIES, show_spinner="Loading surveillance data...")
+def _window(start: str, end: str, version: str | None) -> pd.DataFrame:
+    # version is part of the cache key only: a new nightly upsert means new entries
+    master = load_master(start=start, end=end, parse_dates=True) if version else None
+    if master is None or master.empty:
+        # nothing persisted for this window yet: build it once, then serve from cache
+        master = run_nightly_pipeline(start, end)
+    # same typed frame (datetime64 dates, categorical regions) whichever path built it
+    master = MASTER_SCHEMA.to_internal(master)
+    return master.sort_values(["region", "date"], kind="stable").reset_index(drop=True)
+
+
+@st.cache_data(max_entries=WINDOW_CACHE_ENTRIES, show_spinner="Evaluating alerts...")
+def _window_alerts(start: str, end: str, version: str | None) -> pd.DataFrame:
+    alerts = generate_alerts(_window(start, end, version))
+    return pd.DataFrame([a.__dict__ for a in alerts], columns=ALERT_COLS)
+
+
+def data_version() -> str | None:
+    return master_version()
+
+
+def load_window(start, end) -> pd.DataFrame:
+    """Master rows for [start, end] from the processed store, memoized by (window, data version)."""
+    return _window(str(start), str(end), data_version())
+
+
+def load_window_alerts(start, end) -> pd.DataFrame:
+    """All-region alerts for the window (ALERT_COLS), computed once per (window, data version)."""
+    return _window_alerts(str(start), str(end), data_version())
+
+
+def _region_alerts(region_frame: pd.DataFrame, params: tuple) -> pd.DataFrame:
+    # rules are evaluated per region, so the region's rows alone give the same alerts
+    alerts = generate_alerts(region_frame)
+    return pd.DataFrame([a.__dict__ for a in alerts], columns=ALERT_COLS)
+
+
+def _region_forecast(region_frame: pd.DataFrame, params: tuple) -> dict:
+    horizon, pop, n_samples, beta_sd_frac = params
+    return forecast_cases_seir_with_uncertainty(
+        region_frame["cases"],
+        pop=pop,
+        horizon_days=horizon,
+        n_samples=n_samples,
+        beta_sd_frac=beta_sd_frac,
+        quantiles=BAND_QUANTILES,
+    )
+
+
+@st.cache_resource
+def _alert_memo() -> RegionMemo:
+    return RegionMemo(_region_alerts, maxsize=REGION_MEMO_ENTRIES, prefetch_top=PREFETCH_TOP_REGIONS)
+
+
+@st.cache_resource
+def _forecast_memo() -> RegionMemo:
+    return RegionMemo(_region_forecast, maxsize=REGION_MEMO_ENTRIES, prefetch_top=PREFETCH_TOP_REGIONS)
+
+
+def region_alerts(start, end, region: str) -> pd.DataFrame:
+    """One region's alerts for the window, memoized per (data version, window, region)."""
+    context = (data_version(), str(start), str(end))
+    return _alert_memo().get(load_window(start, end), region, context=context).copy()
+
+
+def region_forecast(start, end, region: str, horizon: int, pop: int, n_samples: int,
+                    beta_sd_frac: float = 0.15) -> dict:
+    """
+    SEIR quantile bands (BAND_QUANTILES) for one region, memoized per
+    (data version, window, region, horizon, pop, n_samples, beta_sd_frac).
+    The result is shared; treat it as read-only.
+    """
+    context = (data_version(), str(start), str(end))
+    params = (int(horizon), int(pop), int(n_samples), round(float(beta_sd_frac), 4))
+    return _forecast_memo().get(load_window(start, end), region, params, context=context)
+
+
+def region_forecast_progressive(start, end, region: str, horizon: int, pop: int, n_samples: int,
+                                beta_sd_frac: float = 0.15) -> Iterator[dict]:
+    """
+    Like region_forecast, but yields refined bands after each sample batch
+    (see iter_forecast_cases_seir_with_uncertainty) and may stop early once
+    they settle. The final bands are memoized, so revisits yield once.
+    """
+    context = (data_version(), str(start), str(end))
+    params = (int(horizon), int(pop), int(n_samples), round(float(beta_sd_frac), 4), "progressive")
+    memo = _forecast_memo()
+    cached = memo.peek(region, params, context)
+    if cached is not None:
+        yield cached
+        return
+
+    master = load_window(start, end)
+    out = None
+    for out in iter_forecast_cases_seir_with_uncertainty(
+        master.loc[master["region"] == region, "cases"],
+        pop=params[1],
+        horizon_days=params[0],
+        n_samples=params[2],
+        beta_sd_frac=params[3],
+        quantiles=BAND_QUANTILES,
+        tol=BAND_TOLERANCE,
+    ):
+        yield out
+    if out is not None:
+        memo.store(region, out, params, context)
+
+
+def window_controls(default_days: int = 120) -> tuple:
+    """Sidebar start/end date inputs; call inside `with st.sidebar`."""
+    today = pd.Timestamp.today().date()
+    start = st.date_input("Start date", value=today - pd.Timedelta(days=default_days))
+    end = st.date_input("End date", value=today)
+    return start, end
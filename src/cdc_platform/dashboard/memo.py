@@ -0,0 +1,101 @@
+# src/cdc_platform/dashboard/memo.py
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+from cdc_platform.common.cache import LRUCache
+
+_MISSING = object()
+
+
+class RegionMemo:
+    """
+    Per-region memo for dashboard computations (alerts, forecast bands).
+
+    Results are keyed by (context, region, params) - context identifies the
+    data (version + window) - and held in an LRU. Every view is counted per
+    region; after serving one, the most-viewed regions that are not cached
+    yet for the same (context, params) are computed on a background thread,
+    so switching between frequently used regions is a cache hit. A request
+    for a key already being prefetched waits for that job instead of
+    starting another.
+
+    compute(region_frame, params) must be pure; region_frame holds only the
+    region's rows.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[pd.DataFrame, tuple], Any],
+        maxsize: int = 512,
+        prefetch_top: int = 5,
+    ):
+        self.compute = compute
+        self.cache = LRUCache(maxsize=maxsize)
+        self.prefetch_top = prefetch_top
+        self.views: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="region-prefetch")
+
+    @staticmethod
+    def _slice(frame: pd.DataFrame, region: str) -> pd.DataFrame:
+        return frame[frame["region"] == region]
+
+    def get(self, frame: pd.DataFrame, region: str, params: tuple = (), context: Hashable = None) -> Any:
+        key = (context, region, params)
+        with self._lock:
+            self.views[region] += 1
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            with self._lock:
+                fut = self._inflight.get(key)
+            if fut is not None:
+                value = fut.result()
+            else:
+                value = self.compute(self._slice(frame, region), params)
+                self.cache.put(key, value)
+        if self.prefetch_top:
+            self.prefetch(frame, self.most_viewed(self.prefetch_top), params, context)
+        return value
+
+    def peek(self, region: str, params: tuple = (), context: Hashable = None) -> Any:
+        """Cached value or None; does not count a view or compute."""
+        return self.cache.get((context, region, params))
+
+    def store(self, region: str, value: Any, params: tuple = (), context: Hashable = None) -> None:
+        """Insert a value computed elsewhere (e.g. the last step of a progressive run)."""
+        self.cache.put((context, region, params), value)
+
+    def most_viewed(self, n: int) -> list[str]:
+        with self._lock:
+            return [r for r, _ in self.views.most_common(n)]
+
+    def prefetch(self, frame: pd.DataFrame, regions: list[str], params: tuple = (), context: Hashable = None) -> list[Future]:
+        """Schedule background computation of regions missing from the cache."""
+        futures = []
+        for region in regions:
+            key = (context, region, params)
+            if key in self.cache:
+                continue
+            with self._lock:
+                if key in self._inflight:
+                    continue
+                fut = self._pool.submit(self._fill, key, frame, region, params)
+                self._inflight[key] = fut
+            futures.append(fut)
+        return futures
+
+    def _fill(self, key: Hashable, frame: pd.DataFrame, region: str, params: tuple) -> Any:
+        try:
+            value = self.compute(self._slice(frame, region), params)
+            self.cache.put(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
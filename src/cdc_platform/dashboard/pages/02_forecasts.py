@@ -3,9 +3,9 @@ from __future__ import annotations
 import pandas as pd
 import streamlit as st
 
-from cdc_platform.modeling.seir.forecasting import forecast_cases_seir_with_uncertainty
-from cdc_platform.modeling.early_warning.alert_rules import generate_alerts
-from cdc_platform.serving.jobs.nightly_pipeline import run_nightly_pipeline
+from cdc_platform.dashboard.data import (
+    load_window, region_alerts, region_forecast, region_forecast_progressive, window_controls,
+)
 
 
 def _recommend_actions(surge_prob: float | None, hosp_pred: float | None, alert_level: str | None) -> list[str]:
@@ -51,13 +51,40 @@ def _recommend_actions(surge_prob: float | None, hosp_pred: float | None, alert_
     return out
 
 
+def _band_chart(g: pd.DataFrame, out: dict, horizon: int) -> pd.DataFrame:
+    hist_idx = g["date"]
+    fut_idx = pd.date_range(hist_idx.max() + pd.Timedelta(days=1), periods=int(horizon), freq="D")
+
+    hist_df = pd.DataFrame(
+        {
+            "date": hist_idx,
+            "observed": g["cases"].astype(float).values,
+            "q10 (best case)": out["history"][0.1],
+            "q50 (most likely)": out["history"][0.5],
+            "q90 (worst case)": out["history"][0.9],
+        }
+    ).set_index("date")
+
+    fut_df = pd.DataFrame(
+        {
+            "date": fut_idx,
+            "observed": [None] * len(fut_idx),
+            "q10 (best case)": out["forecast"][0.1],
+            "q50 (most likely)": out["forecast"][0.5],
+            "q90 (worst case)": out["forecast"][0.9],
+        }
+    ).set_index("date")
+
+    chart_df = pd.concat([hist_df, fut_df], axis=0)
+    return chart_df[["observed", "q10 (best case)", "q50 (most likely)", "q90 (worst case)"]]
+
+
 def render():
     st.header("Forecasts + Mitigation Decision Support")
 
     with st.sidebar:
         st.subheader("Data window")
-        start = st.date_input("Start date", value=pd.Timestamp.today().date() - pd.Timedelta(days=180))
-        end = st.date_input("End date", value=pd.Timestamp.today().date())
+        start, end = window_controls(180)
 
         st.subheader("Forecasting")
         horizon = st.slider("Horizon (days)", 7, 56, 28, 7)
@@ -66,16 +93,16 @@ def render():
         st.subheader("Uncertainty")
         n_samples = st.slider("SEIR samples (bands)", 50, 600, 250, 50)
         beta_sd_frac = st.slider("Beta uncertainty (fraction)", 0.05, 0.40, 0.15, 0.01)
+        progressive = st.toggle("Progressive bands", value=True,
+                                help="Draw bands from the first samples and refine them; stop once they settle.")
 
         st.caption("Tip: run `cdc train-ml` so this page can display ML surge & hospitalization risk.")
 
-    master = run_nightly_pipeline(str(start), str(end))
+    master = load_window(start, end)
     regions = sorted(master["region"].unique().tolist())
     region = st.selectbox("Region", regions)
 
-    g = master[master["region"] == region].copy()
-    g["date"] = pd.to_datetime(g["date"])
-    g = g.sort_values("date")
+    g = master[master["region"] == region]  # window is sorted by (region, date)
 
     if g.empty:
         st.warning("No data for selected region.")
@@ -92,9 +119,7 @@ def render():
         hosp_pred = float(latest["hosp_next7_pred"])
 
     # --- Alerts (already includes ML escalation if columns exist) ---
-    all_alerts = generate_alerts(master)
-    region_alerts = [a for a in all_alerts if a.region == region]
-    region_alerts_df = pd.DataFrame([a.__dict__ for a in region_alerts]) if region_alerts else pd.DataFrame()
+    region_alerts_df = region_alerts(start, end, region)
 
     alert_level = None
     if not region_alerts_df.empty:
@@ -109,19 +134,9 @@ def render():
         pick["sev"] = pick["level"].map(sev).fillna(0)
         alert_level = pick.sort_values(["sev", "date"], ascending=[False, False]).iloc[0]["level"]
 
-    # --- Forecast with uncertainty bands ---
-    out = forecast_cases_seir_with_uncertainty(
-        g["cases"],
-        pop=int(pop),
-        horizon_days=int(horizon),
-        n_samples=int(n_samples),
-        beta_sd_frac=float(beta_sd_frac),
-        quantiles=(0.1, 0.5, 0.9),
-    )
-
     # --- Layout: Metrics + risk ---
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Estimated R0 (rough)", round(float(out["rt0_est"]), 2))
+    r0_slot = c1.empty()  # filled once the forecast below has calibrated
 
     if surge_prob is not None:
         c2.metric("Surge prob (GB)", f"{surge_prob*100:.1f}%")
@@ -140,33 +155,21 @@ def render():
     # --- Charts: Observed + bands ---
     st.subheader("Cases (Observed) + SEIR Forecast Bands")
 
-    hist_idx = g["date"]
-    fut_idx = pd.date_range(hist_idx.max() + pd.Timedelta(days=1), periods=int(horizon), freq="D")
-
-    hist_df = pd.DataFrame(
-        {
-            "date": hist_idx,
-            "observed": g["cases"].astype(float).values,
-            "q10 (best case)": out["history"][0.1],
-            "q50 (most likely)": out["history"][0.5],
-            "q90 (worst case)": out["history"][0.9],
-        }
-    ).set_index("date")
-
-    fut_df = pd.DataFrame(
-        {
-            "date": fut_idx,
-            "observed": [None] * len(fut_idx),
-            "q10 (best case)": out["forecast"][0.1],
-            "q50 (most likely)": out["forecast"][0.5],
-            "q90 (worst case)": out["forecast"][0.9],
-        }
-    ).set_index("date")
-
-    chart_df = pd.concat([hist_df, fut_df], axis=0)
-
     # Streamlit line_chart doesn't do shaded bands; we show q10/q50/q90 + observed
-    st.line_chart(chart_df[["observed", "q10 (best case)", "q50 (most likely)", "q90 (worst case)"]])
+    chart_slot = st.empty()
+    status_slot = st.empty()
+    params = dict(horizon=int(horizon), pop=int(pop), n_samples=int(n_samples), beta_sd_frac=float(beta_sd_frac))
+    if progressive:
+        # early bands from the first sample batches, redrawn in place as they refine
+        for out in region_forecast_progressive(start, end, region, **params):
+            r0_slot.metric("Estimated R0 (rough)", round(float(out["rt0_est"]), 2))
+            chart_slot.line_chart(_band_chart(g, out, horizon))
+            settled = " (bands settled)" if out["converged"] else ""
+            status_slot.caption(f"{out['n_samples_used']} / {int(n_samples)} samples{settled}")
+    else:
+        out = region_forecast(start, end, region, **params)
+        r0_slot.metric("Estimated R0 (rough)", round(float(out["rt0_est"]), 2))
+        chart_slot.line_chart(_band_chart(g, out, horizon))
 
     st.caption("Bands represent uncertainty from sampling transmission rate (beta) around the calibrated SEIR model.")
 
@@ -5,6 +5,7 @@ def simple_delay_adjustment(df: pd.DataFrame, value_col: str, delay_days: int =
     """
     Placeholder nowcast adjustment:
     shifts recent values upward to approximate under-reporting.
+    The date column comes back as datetime64.
     """
     out = df.copy()
     out["date"] = pd.to_datetime(out["date"])
@@ -17,5 +18,4 @@ def simple_delay_adjustment(df: pd.DataFrame, value_col: str, delay_days: int =
         ramp = pd.Series(range(n), index=out.index[mask]).astype(float)
         ramp = 1.0 + (delay_days - ramp.values) / (delay_days * 5.0)  # mild inflation
         out.loc[mask, value_col] = (out.loc[mask, value_col].values * ramp).round()
-    out["date"] = out["date"].dt.date.astype(str)
     return out
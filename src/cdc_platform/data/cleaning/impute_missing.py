@@ -1,20 +1,94 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
+def _fill_linear(values: np.ndarray, group_start: np.ndarray, group_end: np.ndarray) -> np.ndarray:
+    """
+    Linear interpolation of NaNs in each column of values (n, k), never across
+    group boundaries; leading/trailing gaps take the nearest valid value in
+    the group (pandas interpolate(limit_direction="both") on evenly spaced rows).
+    group_start/group_end give each row's group's first/last row position.
+    """
+    n = len(values)
+    pos = np.arange(n)[:, None]
+    valid = ~np.isnan(values)
+
+    # nearest valid row at or before / at or after every row, per column
+    prev = np.maximum.accumulate(np.where(valid, pos, -1), axis=0)
+    nxt = np.minimum.accumulate(np.where(valid, pos, n)[::-1], axis=0)[::-1]
+
+    # evaluate only the gaps
+    r, c = np.nonzero(~valid)
+    p, q = prev[r, c], nxt[r, c]
+    has_prev = p >= group_start[r]
+    has_next = q <= group_end[r]
+    v_prev = values[np.clip(p, 0, n - 1), c]
+    v_next = values[np.clip(q, 0, n - 1), c]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        between = v_prev + (v_next - v_prev) * ((r - p) / (q - p))
+
+    filled = np.where(has_prev & has_next, between, np.where(has_prev, v_prev, v_next))
+    out = values.copy()
+    out[r, c] = np.where(has_prev | has_next, filled, np.nan)
+    return out
+
 def impute_missing_daily(df: pd.DataFrame, date_col="date", group_col="region", value_cols=None) -> pd.DataFrame:
-    out = df.copy()
-    out[date_col] = pd.to_datetime(out[date_col])
-    value_cols = value_cols or [c for c in out.columns if c not in [date_col, group_col]]
-
-    frames = []
-    for region, g in out.groupby(group_col):
-        g = g.sort_values(date_col)
-        full = pd.date_range(g[date_col].min(), g[date_col].max(), freq="D")
-        g2 = g.set_index(date_col).reindex(full).rename_axis(date_col).reset_index()
-        g2[group_col] = region
-        for c in value_cols:
-            g2[c] = g2[c].interpolate(limit_direction="both")
-        frames.append(g2)
-    out2 = pd.concat(frames, ignore_index=True)
-    out2[date_col] = out2[date_col].dt.date.astype(str)
-    return out2
+    """
+    Complete each group's daily calendar (its own first..last date) and fill
+    value_cols by linear interpolation within the group. Other columns are
+    NaN on inserted days. Rows come back sorted by (group, date) with a
+    datetime64 date column.
+
+    The (group x date) grid is built once from integer group codes and day
+    offsets, rows are scattered into it with one take per column, and all
+    value columns are interpolated together in array form - no per-group loop.
+    """
+    value_cols = value_cols or [c for c in df.columns if c not in [date_col, group_col]]
+    others = [c for c in df.columns if c not in (date_col, group_col)]
+
+    dates = pd.to_datetime(df[date_col])
+    codes, groups = pd.factorize(df[group_col], sort=True)
+    t = dates.to_numpy()
+    ticks = t.view(np.int64)
+    day = np.int64(np.timedelta64(1, "D") / np.timedelta64(1, np.datetime_data(t.dtype)[0]))
+
+    # each group's first/last date -> grid rows per group
+    n_groups = len(groups)
+    keep = (codes >= 0) & ~np.isnat(t)
+    first = np.full(n_groups, np.iinfo(np.int64).max)
+    last = np.full(n_groups, np.iinfo(np.int64).min)
+    np.minimum.at(first, codes[keep], ticks[keep])
+    np.maximum.at(last, codes[keep], ticks[keep])
+    lengths = np.where(last >= first, (last - first) // day + 1, 0)
+    starts = np.cumsum(lengths) - lengths
+    n = int(lengths.sum())
+
+    # grid position of every input row (rows off the daily grid are dropped, as reindex would)
+    offset = ticks - first[np.maximum(codes, 0)]
+    keep &= offset % day == 0
+    rows = np.flatnonzero(keep)
+    pos = starts[codes[rows]] + offset[rows] // day
+    if len(pos) and np.bincount(pos, minlength=n).max() > 1:
+        raise ValueError(f"duplicate ({group_col}, {date_col}) rows")
+    source = np.full(n, -1, dtype=np.int64)
+    source[pos] = rows
+
+    row_group = np.repeat(np.arange(n_groups), lengths)
+    row_start = np.repeat(starts, lengths)
+    out = pd.DataFrame({
+        date_col: (first[row_group] + (np.arange(n) - row_start) * day).view(t.dtype),
+        group_col: groups.take(row_group),
+    })
+    for c in others:
+        out[c] = pd.api.extensions.take(df[c].array, source, allow_fill=True)
+
+    numeric = [c for c in value_cols if pd.api.types.is_numeric_dtype(out[c])]
+    if numeric and n:
+        values = out[numeric].to_numpy(dtype=float)
+        gaps = np.isnan(values).any(axis=0)
+        if gaps.any():
+            ends = row_start + np.repeat(lengths, lengths) - 1
+            filled = _fill_linear(values[:, gaps], row_start, ends)
+            for j, c in enumerate(np.asarray(numeric)[gaps]):
+                out[c] = filled[:, j]
+    return out[[date_col] + [c for c in df.columns if c != date_col]]
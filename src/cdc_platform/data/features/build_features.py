@@ -1,13 +1,23 @@
 from __future__ import annotations
 import pandas as pd
+from ...common.schema import MASTER_SCHEMA
 from ..cleaning.impute_missing import impute_missing_daily
 from .lag_features import add_lags
 from .mobility_features import add_mobility_rollups
 
 def build_master_table(cases: pd.DataFrame, hosp: pd.DataFrame, ww: pd.DataFrame, mob: pd.DataFrame) -> pd.DataFrame:
+    """
+    Join the sources on (date, region) and add imputed values, lags and
+    rollups. Dates are parsed once here and stay datetime64 through every
+    stage; the result is in MASTER_SCHEMA's typed in-memory form (see
+    TableSchema.to_internal), ISO strings only appear on export.
+    """
     # Standardize types
     for df in (cases, hosp, ww, mob):
-        df["date"] = pd.to_datetime(df["date"]).dt.date.astype(str)
+        dates = df["date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        df["date"] = dates.dt.normalize()
 
     master = cases.merge(hosp, on=["date", "region"], how="left") \
                   .merge(ww, on=["date", "region"], how="left") \
@@ -16,4 +26,4 @@ def build_master_table(cases: pd.DataFrame, hosp: pd.DataFrame, ww: pd.DataFrame
     master = impute_missing_daily(master, value_cols=["cases", "hosp", "ww_viral_load", "mobility_index"])
     master = add_lags(master, group_col="region", date_col="date", value_col="cases", lags=(1,7,14))
     master = add_mobility_rollups(master, group_col="region", date_col="date", mob_col="mobility_index")
-    return master
+    return MASTER_SCHEMA.to_internal(master)
@@ -0,0 +1,173 @@
+# src/cdc_platform/data/storage/master_store.py
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from ...common.dates import utc_now_iso
+from ...common.io import ensure_dir, read_table, resolve_table, write_table
+from ...common.schema import MASTER_SCHEMA
+from ...config.settings import settings
+
+MANIFEST = "_manifest.json"
+KEY = ["region", "date"]
+
+
+def _months(dates: pd.Series) -> pd.Series:
+    return pd.to_datetime(dates).dt.strftime("%Y-%m")
+
+
+class MasterStore:
+    """
+    Month-partitioned, upsert-only store for the master table.
+
+    Layout under root:
+      _manifest.json            version, current file per month, max_date
+      month=YYYY-MM/v<N>.<ext>  immutable partition files
+
+    Writers never modify a referenced file: an upsert writes new versions of
+    the touched months, then swaps the manifest atomically. Files from the
+    previous manifest are kept one generation so in-flight readers finish.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def manifest(self) -> dict:
+        if not self.exists():
+            return {"version": 0, "partitions": {}, "max_date": None}
+        return json.loads(self.manifest_path.read_text())
+
+    def max_date(self) -> str | None:
+        return self.manifest()["max_date"]
+
+    def _partition_paths(self, manifest: dict, start: str | None = None, end: str | None = None) -> list[Path]:
+        lo = start[:7] if start else None
+        hi = end[:7] if end else None
+        return [
+            self.root / rel for month, rel in sorted(manifest["partitions"].items())
+            if (lo is None or month >= lo) and (hi is None or month <= hi)
+        ]
+
+    def read(
+        self,
+        columns: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        parse_dates: bool = False,
+    ) -> pd.DataFrame:
+        """Rows with start <= date <= end (ISO strings; None = open), only the months needed."""
+        paths = self._partition_paths(self.manifest(), start, end)
+        read_cols = None if columns is None else list(dict.fromkeys(["date", *columns]))
+        frames = [read_table(p, columns=read_cols, schema=MASTER_SCHEMA) for p in paths]
+        if not frames:
+            return pd.DataFrame(columns=columns or list(MASTER_SCHEMA.columns))
+        df = pd.concat(frames, ignore_index=True)
+        if start is not None:
+            df = df[df["date"] >= start]
+        if end is not None:
+            df = df[df["date"] <= end]
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        df = df.reset_index(drop=True)
+        return MASTER_SCHEMA.coerce(df, parse_dates=True) if parse_dates else df
+
+    def upsert(self, df: pd.DataFrame) -> list[str]:
+        """
+        Insert or replace rows by (region, date); only the months present in
+        df are rewritten. Returns the touched months.
+        """
+        if df.empty:
+            return []
+        df = MASTER_SCHEMA.coerce(df)
+        months = _months(df["date"])
+        old = self.manifest()
+        version = old["version"] + 1
+        partitions = dict(old["partitions"])
+
+        for month, rows in df.groupby(months, sort=True):
+            if month in partitions:
+                current = read_table(self.root / partitions[month], schema=MASTER_SCHEMA)
+                rows = pd.concat([current, rows], ignore_index=True)
+                rows = rows.drop_duplicates(KEY, keep="last")
+            rows = rows.sort_values(KEY, kind="stable").reset_index(drop=True)
+            path = write_table(rows, self.root / f"month={month}" / f"v{version}", schema=MASTER_SCHEMA)
+            partitions[month] = path.relative_to(self.root).as_posix()
+
+        max_date = max(filter(None, [old["max_date"], df["date"].max()]))
+        self._commit({
+            "version": version,
+            "partitions": partitions,
+            "max_date": max_date,
+            "updated_at_utc": utc_now_iso(),
+        }, previous=old)
+        return sorted(months.unique().tolist())
+
+    def _commit(self, manifest: dict, previous: dict) -> None:
+        ensure_dir(self.root)
+        tmp = self.manifest_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest, indent=2))
+        tmp.replace(self.manifest_path)
+
+        # drop files referenced by neither the new nor the previous manifest
+        live = {self.root / rel for m in (manifest, previous) for rel in m["partitions"].values()}
+        for p in self.root.glob("month=*/v*"):
+            if p not in live:
+                p.unlink(missing_ok=True)
+
+
+def default_master_store() -> MasterStore:
+    return MasterStore(settings.processed_dir / "master_store")
+
+
+def load_master(
+    columns: list[str] | None = None,
+    start: str | None = None,
+    parse_dates: bool = False,
+    store: MasterStore | None = None,
+    end: str | None = None,
+) -> pd.DataFrame | None:
+    """
+    The master table from the partitioned store, falling back to a flat
+    processed/master.{parquet,csv} written before the store existed.
+    Returns None when neither is present.
+    """
+    store = store or default_master_store()
+    if store.exists():
+        return store.read(columns=columns, start=start, end=end, parse_dates=parse_dates)
+    path = resolve_table(settings.processed_dir / "master")
+    if not path.exists():
+        return None
+    df = read_table(path, columns=columns, parse_dates=parse_dates)
+    if start is not None or end is not None:
+        dates = pd.to_datetime(df["date"])
+        keep = pd.Series(True, index=df.index)
+        if start is not None:
+            keep &= dates >= pd.Timestamp(start)
+        if end is not None:
+            keep &= dates <= pd.Timestamp(end)
+        df = df[keep].reset_index(drop=True)
+    return df
+
+
+def master_version(store: MasterStore | None = None) -> str | None:
+    """
+    Cheap identifier of the persisted master data (manifest version, or the
+    flat table's mtime); changes whenever new data lands. None if absent.
+    """
+    store = store or default_master_store()
+    if store.exists():
+        return f"store-v{store.manifest()['version']}"
+    path = resolve_table(settings.processed_dir / "master")
+    if path.exists():
+        return f"flat-{path.stat().st_mtime_ns}"
+    return None
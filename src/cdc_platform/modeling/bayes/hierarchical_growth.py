@@ -9,6 +9,8 @@ import pandas as pd
 import pymc as pm
 import arviz as az
 
+from ..seir.forecasting import quantile_label
+
 
 @dataclass(frozen=True)
 class BayesHierarchicalResult:
@@ -152,7 +154,7 @@ def forecast_posterior_predictive(result: BayesHierarchicalResult,
                 "region": region,
                 "t": int(ti),
                 "date_label": date_label,
-                **{f"q{int(q*100)}": float(qs[j, ti]) for j, q in enumerate(quantiles)}
+                **{quantile_label(q): float(qs[j, ti]) for j, q in enumerate(quantiles)}
             })
 
     return pd.DataFrame(rows)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from .changepoints import simple_changepoint_flags, rolling_growth_rate
@@ -14,69 +15,93 @@ class Alert:
     reason: str
 
 
+# thresholds (tune to taste)
+SURGE_PROB_WATCH = 0.55
+SURGE_PROB_WARNING = 0.70
+HOSP_PRED_WARNING = 25.0  # absolute placeholder; tune per disease/scale
+
+LEVELS = np.array([None, "watch", "warning"], dtype=object)
+
+# Rule flags in reason order; each contributes one bit to a row's rule pattern
+REASONS = (
+    "cases_anomaly",
+    "changepoint_growth_shift",
+    "sustained_growth",
+    f"ml_surge_prob>= {SURGE_PROB_WARNING:.2f}",
+    f"ml_surge_prob>= {SURGE_PROB_WATCH:.2f}",
+    f"ml_hosp_next7_pred>= {HOSP_PRED_WARNING:.0f}",
+)
+
+
+def evaluate_alert_rules(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized rule evaluation over all regions at once.
+    df must be sorted by (region, date) with a datetime `date` column.
+    Returns df's index with columns `level` (None|"watch"|"warning") and `reason`.
+    """
+    cases = df["cases"].astype(float)
+    by = df["region"]
+
+    growth = rolling_growth_rate(cases, window=7, by=by)
+    cp = simple_changepoint_flags(cases, by=by).to_numpy(dtype=bool)
+    anom = anomaly_flags(cases, threshold=3.0, by=by).to_numpy(dtype=bool)
+    sustained = (growth > 0.05).to_numpy(dtype=bool)
+
+    # 0 = no alert, 1 = watch, 2 = warning; later rules escalate earlier ones
+    code = np.where(anom, 1, 0)
+    code = np.where(cp | sustained, 2, code)
+
+    n = len(df)
+    surge_warn = surge_watch = hosp_warn = np.zeros(n, dtype=bool)
+    if ("surge_prob_gb" in df.columns) and ("hosp_next7_pred" in df.columns):
+        surge = df["surge_prob_gb"].astype(float).to_numpy()
+        hosp = df["hosp_next7_pred"].astype(float).to_numpy()
+        with np.errstate(invalid="ignore"):
+            surge_warn = surge >= SURGE_PROB_WARNING
+            surge_watch = (surge >= SURGE_PROB_WATCH) & ~surge_warn & (code == 0)
+            hosp_warn = hosp >= HOSP_PRED_WARNING
+        code = np.where(surge_warn, 2, code)
+        code = np.where(surge_watch, 1, code)
+        code = np.where(hosp_warn, 2, code)
+
+    flags = (anom, cp, sustained, surge_warn, surge_watch, hosp_warn)
+    pattern = np.zeros(n, dtype=np.int64)
+    for bit, f in enumerate(flags):
+        pattern |= f.astype(np.int64) << bit
+
+    # one reason string per distinct rule pattern (at most 2**len(REASONS))
+    uniq, inverse = np.unique(pattern, return_inverse=True)
+    labels = np.array(
+        [";".join(r for bit, r in enumerate(REASONS) if p >> bit & 1) for p in uniq], dtype=object
+    )
+    return pd.DataFrame({"level": LEVELS[code], "reason": labels[inverse.reshape(-1)]}, index=df.index)
+
+
 def generate_alerts(master: pd.DataFrame) -> list[Alert]:
     """
     Rule-based alerting using cases, growth, anomalies, changepoints,
     PLUS optional ML features if present:
       - surge_prob_gb (0..1)
       - hosp_next7_pred (float)
+    Rules are evaluated as whole-column masks across all regions at once.
     """
-    alerts: list[Alert] = []
     df = master.copy()
     df["date"] = pd.to_datetime(df["date"])
-
-    # thresholds (tune to taste)
-    SURGE_PROB_WATCH = 0.55
-    SURGE_PROB_WARNING = 0.70
-    HOSP_PRED_WARNING = 25.0  # absolute placeholder; tune per disease/scale
-
-    has_ml = ("surge_prob_gb" in df.columns) and ("hosp_next7_pred" in df.columns)
-
-    for region, g in df.groupby("region"):
-        g = g.sort_values("date")
-        cases = g["cases"].astype(float)
-
-        growth = rolling_growth_rate(cases, window=7)
-        cp = simple_changepoint_flags(cases)
-        anom = anomaly_flags(cases, threshold=3.0)
-
-        for i in range(len(g)):
-            d = g.iloc[i]["date"].date().isoformat()
-            level = None
-            reasons = []
-
-            # Base rules
-            if anom.iloc[i]:
-                level = "watch"
-                reasons.append("cases_anomaly")
-
-            if cp.iloc[i]:
-                level = "warning"
-                reasons.append("changepoint_growth_shift")
-
-            if pd.notna(growth.iloc[i]) and growth.iloc[i] > 0.05:
-                level = "warning" if level in (None, "watch") else level
-                reasons.append("sustained_growth")
-
-            # ML escalation (if available)
-            if has_ml:
-                surge_prob = float(g.iloc[i]["surge_prob_gb"]) if pd.notna(g.iloc[i]["surge_prob_gb"]) else None
-                hosp_pred = float(g.iloc[i]["hosp_next7_pred"]) if pd.notna(g.iloc[i]["hosp_next7_pred"]) else None
-
-                if surge_prob is not None:
-                    if surge_prob >= SURGE_PROB_WARNING:
-                        level = "warning"
-                        reasons.append(f"ml_surge_prob>= {SURGE_PROB_WARNING:.2f}")
-                    elif surge_prob >= SURGE_PROB_WATCH and level is None:
-                        level = "watch"
-                        reasons.append(f"ml_surge_prob>= {SURGE_PROB_WATCH:.2f}")
-
-                if hosp_pred is not None and hosp_pred >= HOSP_PRED_WARNING:
-                    level = "warning"
-                    reasons.append(f"ml_hosp_next7_pred>= {HOSP_PRED_WARNING:.0f}")
-
-            if level:
-                alerts.append(Alert(date=d, region=region, level=level, reason=";".join(reasons)))
+    df = df.sort_values(["region", "date"], kind="stable")
+
+    rules = evaluate_alert_rules(df)
+    hit = rules["level"].notna().to_numpy()
+    fired = df.loc[hit]
+
+    alerts = [
+        Alert(date=d, region=r, level=l, reason=s)
+        for d, r, l, s in zip(
+            fired["date"].dt.strftime("%Y-%m-%d"),
+            fired["region"],
+            rules["level"].to_numpy()[hit],
+            rules["reason"].to_numpy()[hit],
+        )
+    ]
 
     dedup = {(a.date, a.region, a.level, a.reason): a for a in alerts}
     return list(dedup.values())
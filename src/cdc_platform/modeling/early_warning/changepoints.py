@@ -1,19 +1,124 @@
 from __future__ import annotations
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
-def rolling_growth_rate(series: pd.Series, window: int = 7, eps: float = 1e-6) -> pd.Series:
+from .windows import rolling, shift, ungroup
+
+def rolling_growth_rate(series: pd.Series, window: int = 7, eps: float = 1e-6, by=None) -> pd.Series:
     s = series.astype(float).clip(lower=0.0)
-    ma = s.rolling(window, min_periods=max(2, window//2)).mean()
-    g = np.log((ma + eps) / (ma.shift(1) + eps))
+    ma = ungroup(rolling(s, window, max(2, window//2), by).mean(), s, by)
+    g = np.log((ma + eps) / (shift(ma, 1, by) + eps))
     return g
 
-def simple_changepoint_flags(series: pd.Series, z_thresh: float = 2.5) -> pd.Series:
+def simple_changepoint_flags(series: pd.Series, z_thresh: float = 2.5, by=None) -> pd.Series:
     """
     Detect sudden shifts in growth rate via z-score of rolling growth.
+    `by` evaluates many series (e.g. regions) at once, see windows.rolling.
     """
-    g = rolling_growth_rate(series)
-    mu = g.rolling(28, min_periods=10).mean()
-    sd = g.rolling(28, min_periods=10).std().replace(0, np.nan)
+    g = rolling_growth_rate(series, by=by)
+    mu = ungroup(rolling(g, 28, 10, by).mean(), g, by)
+    sd = ungroup(rolling(g, 28, 10, by).std(), g, by).replace(0, np.nan)
     z = (g - mu) / sd
     return (z.abs() >= z_thresh).fillna(False)
+
+
+class _WindowMoments:
+    """Mean/variance of the last `window` non-NaN-aware values; O(1) add/remove (Welford)."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque[float] = deque()
+        self.nobs = 0
+        self.mean = 0.0
+        self.ssqdm = 0.0
+
+    def push(self, x: float) -> None:
+        self.values.append(x)
+        if not np.isnan(x):
+            self.nobs += 1
+            delta = x - self.mean
+            self.mean += delta / self.nobs
+            self.ssqdm += (self.nobs - 1) * delta * delta / self.nobs
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if not np.isnan(old):
+                self.nobs -= 1
+                if self.nobs:
+                    delta = old - self.mean
+                    self.mean -= delta / self.nobs
+                    self.ssqdm -= (self.nobs + 1) * delta * delta / self.nobs
+                else:
+                    self.mean = self.ssqdm = 0.0
+
+    def std(self) -> float:
+        if self.nobs < 2:
+            return np.nan
+        return float(np.sqrt(max(self.ssqdm, 0.0) / (self.nobs - 1)))
+
+
+class OnlineChangepointDetector:
+    """
+    Streaming form of simple_changepoint_flags for one series: feed daily
+    cases one at a time, O(1) work per observation. State is a 7-value moving
+    average window plus running moments of the last 28 growth rates, and
+    round-trips through to_dict/from_dict so jobs can resume between runs.
+    """
+
+    MA_WINDOW = 7
+    GROWTH_WINDOW = 28
+    GROWTH_MIN_PERIODS = 10
+
+    def __init__(self, z_thresh: float = 2.5, eps: float = 1e-6):
+        self.z_thresh = z_thresh
+        self.eps = eps
+        self._cases: deque[float] = deque()
+        self._prev_ma = np.nan
+        self._growth = _WindowMoments(self.GROWTH_WINDOW)
+
+    def _moving_average(self) -> float:
+        vals = [v for v in self._cases if not np.isnan(v)]
+        if len(vals) < max(2, self.MA_WINDOW // 2):
+            return np.nan
+        return sum(vals) / len(vals)
+
+    def update(self, cases: float) -> bool:
+        x = float(cases)
+        self._cases.append(np.nan if np.isnan(x) else max(x, 0.0))
+        if len(self._cases) > self.MA_WINDOW:
+            self._cases.popleft()
+        ma = self._moving_average()
+        g = float(np.log((ma + self.eps) / (self._prev_ma + self.eps)))
+        self._prev_ma = ma
+        self._growth.push(g)
+
+        m = self._growth
+        if np.isnan(g) or m.nobs < self.GROWTH_MIN_PERIODS:
+            return False
+        sd = m.std()
+        if not sd:  # 0 or NaN
+            return False
+        return bool(abs((g - m.mean) / sd) >= self.z_thresh)
+
+    def to_dict(self) -> dict:
+        def enc(vals):
+            return [None if np.isnan(v) else v for v in vals]
+        m = self._growth
+        return {
+            "z_thresh": self.z_thresh, "eps": self.eps,
+            "cases": enc(self._cases), "prev_ma": enc([self._prev_ma])[0],
+            "growth": enc(m.values), "nobs": m.nobs, "mean": m.mean, "ssqdm": m.ssqdm,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "OnlineChangepointDetector":
+        def dec(vals):
+            return [np.nan if v is None else float(v) for v in vals]
+        det = cls(z_thresh=d["z_thresh"], eps=d["eps"])
+        det._cases = deque(dec(d["cases"]))
+        det._prev_ma = dec([d["prev_ma"]])[0]
+        m = det._growth
+        m.values = deque(dec(d["growth"]))
+        m.nobs, m.mean, m.ssqdm = int(d["nobs"]), float(d["mean"]), float(d["ssqdm"])
+        return det
@@ -0,0 +1,252 @@
+from __future__ import annotations
+import json
+from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from ...common.io import ensure_dir
+from .alert_rules import evaluate_alert_rules
+from .changepoints import OnlineChangepointDetector
+
+# Rows of history a rule needs before the evaluated date: changepoints look at
+# 28 growth values, each built from a 7-day mean and its previous value.
+CONTEXT_ROWS = 28 + 7 - 1
+# Last rows per region whose revisions are re-scored; each keeps CONTEXT_ROWS
+# of stored history before it
+REVISION_ROWS = 14
+TAIL_ROWS = CONTEXT_ROWS + REVISION_ROWS
+
+STATE_COLS = ["date", "region", "cases", "surge_prob_gb", "hosp_next7_pred"]
+ALERT_COLS = ["date", "region", "level", "reason"]
+
+
+@dataclass
+class AlertState:
+    """
+    Per-region rolling state for incremental alerting:
+      tail   - last TAIL_ROWS input rows per region (rule inputs only): the
+               REVISION_ROWS revisable rows plus CONTEXT_ROWS of history
+      alerts - alerts currently emitted for the dates in tail
+    """
+    tail: pd.DataFrame
+    alerts: pd.DataFrame
+
+    def save(self, path: Path) -> None:
+        ensure_dir(path.parent)
+        payload = {
+            "tail": _to_records(self.tail),
+            "alerts": _to_records(self.alerts),
+        }
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "AlertState | None":
+        if not path.exists():
+            return None
+        payload = json.loads(path.read_text())
+        tail = pd.DataFrame(payload["tail"])
+        alerts = pd.DataFrame(payload["alerts"], columns=ALERT_COLS)
+        tail["date"] = pd.to_datetime(tail["date"])
+        alerts["date"] = pd.to_datetime(alerts["date"])
+        return cls(tail=tail, alerts=alerts)
+
+
+def _to_records(df: pd.DataFrame) -> dict:
+    out = df.copy()
+    out["date"] = out["date"].dt.strftime("%Y-%m-%d")
+    return {c: [None if pd.isna(v) else v for v in out[c].tolist()] for c in out.columns}
+
+
+def _prepare(master: pd.DataFrame) -> pd.DataFrame:
+    df = master[[c for c in STATE_COLS if c in master.columns]].copy()
+    df["date"] = pd.to_datetime(df["date"])
+    for c in STATE_COLS[2:]:
+        if c in df.columns:
+            df[c] = df[c].astype(float)
+    return df
+
+
+def _tail(df: pd.DataFrame) -> pd.DataFrame:
+    return df.groupby("region", sort=False, observed=True).tail(TAIL_ROWS).reset_index(drop=True)
+
+
+def _region_date(regions: pd.Series, by_region: pd.Series) -> pd.Series:
+    """Map each row's region to a per-region date; unknown regions get Timestamp.min."""
+    if by_region.empty:
+        return pd.Series(pd.Timestamp.min, index=regions.index)
+    return regions.map(by_region).fillna(pd.Timestamp.min)
+
+
+def _revisable_from(tail: pd.DataFrame) -> pd.Series:
+    """
+    Per region, the first stored date that can be re-scored with a full
+    CONTEXT_ROWS of history: the tail's (CONTEXT_ROWS+1)-th row once it is
+    full, else its first row (the tail then holds the whole history).
+    """
+    if tail.empty:
+        return pd.Series(dtype="datetime64[ns]")
+    g = tail.groupby("region", sort=False, observed=True)["date"]
+    full = g.transform("size") >= TAIL_ROWS
+    pos = g.cumcount()
+    first = tail.loc[(pos == CONTEXT_ROWS) | (~full & (pos == 0))]
+    return first.set_index("region")["date"]
+
+
+def _fired(frame: pd.DataFrame, rules: pd.DataFrame) -> pd.DataFrame:
+    hit = rules["level"].notna().to_numpy()
+    return pd.DataFrame({
+        "date": frame["date"].to_numpy()[hit],
+        "region": frame["region"].to_numpy()[hit],
+        "level": rules["level"].to_numpy()[hit],
+        "reason": rules["reason"].to_numpy()[hit],
+    })
+
+
+def update_alerts(master: pd.DataFrame, state: AlertState | None = None) -> tuple[pd.DataFrame, AlertState]:
+    """
+    Incremental "latest-window" alerting.
+
+    master may be the full table or just newly arrived rows. Only dates that
+    are new (after the region's last seen date) or revised (values differ from
+    the stored tail) are evaluated, each with CONTEXT_ROWS of preceding rows,
+    so cost is proportional to new data rather than history. Results for
+    evaluated dates match generate_alerts on the full history.
+
+    Revisions are re-scored from the last REVISION_ROWS stored dates on. An
+    edit to an older stored row updates the context of those dates, but its
+    own date (and any date before the revision window) keeps its previous
+    alerts, since it can no longer be scored with full history; edits before
+    the stored tail are ignored.
+
+    Returns (delta, new_state); delta has ALERT_COLS plus `change`
+    ("new" | "changed" | "cleared"; cleared rows have level None).
+    """
+    df = _prepare(master)
+    if state is None:
+        tail = pd.DataFrame(columns=df.columns).astype({"date": "datetime64[ns]"})
+        prev_alerts = pd.DataFrame(columns=ALERT_COLS).astype({"date": "datetime64[ns]"})
+    else:
+        tail, prev_alerts = state.tail, state.alerts
+
+    # rows older than a region's stored tail can neither be new nor revised
+    tail_start = tail.groupby("region", observed=True)["date"].min()
+    df = df[df["date"] >= _region_date(df["region"], tail_start)]
+
+    # combine stored context with incoming rows (incoming wins on overlap)
+    combined = pd.concat([tail, df], ignore_index=True)
+    combined = combined.drop_duplicates(["region", "date"], keep="last")
+    combined = combined.sort_values(["region", "date"], kind="stable").reset_index(drop=True)
+
+    # dirty = new dates, or dates in the stored tail whose inputs changed
+    value_cols = [c for c in df.columns if c not in ("date", "region")]
+    last_seen = tail.groupby("region", observed=True)["date"].max()
+    merged = df.merge(tail, on=["region", "date"], how="left", suffixes=("", "_prev"), indicator=True)
+    is_new = merged["date"] > _region_date(merged["region"], last_seen)
+    revised = np.zeros(len(merged), dtype=bool)
+    for c in value_cols:
+        if f"{c}_prev" in merged.columns:
+            a, b = merged[c].to_numpy(dtype=float), merged[f"{c}_prev"].to_numpy(dtype=float)
+            revised |= ~((a == b) | (np.isnan(a) & np.isnan(b)))
+    revised &= (merged["_merge"] == "both").to_numpy()
+    dirty = merged.loc[is_new.to_numpy() | revised, ["region", "date"]]
+    first_dirty = dirty.groupby("region", observed=True)["date"].min()
+    # never evaluate a date without CONTEXT_ROWS of stored history before it
+    floor = _region_date(pd.Series(first_dirty.index, index=first_dirty.index), _revisable_from(tail))
+    first_dirty = first_dirty.where(first_dirty >= floor, floor)
+
+    if first_dirty.empty:
+        empty = pd.DataFrame(columns=ALERT_COLS + ["change"])
+        return empty, AlertState(tail=_tail(combined), alerts=prev_alerts)
+
+    # evaluation frame: dirty dates plus CONTEXT_ROWS of history per region
+    start = combined["region"].map(first_dirty)
+    pos = combined.groupby("region", sort=False, observed=True).cumcount()
+    first_pos = pos.where(combined["date"] >= start).groupby(combined["region"], observed=True).transform("min")
+    frame = combined[start.notna() & (pos >= first_pos - CONTEXT_ROWS)].reset_index(drop=True)
+
+    rules = evaluate_alert_rules(frame)
+    evaluated = (frame["date"] >= frame["region"].map(first_dirty)).to_numpy()
+    current = _fired(frame[evaluated], rules[evaluated])
+
+    # previous alerts on the evaluated dates, to classify the delta
+    prev = prev_alerts.merge(frame.loc[evaluated, ["region", "date"]], on=["region", "date"])
+    cmp = current.merge(prev, on=["region", "date"], how="outer", suffixes=("", "_prev"), indicator=True)
+    change = np.select(
+        [cmp["_merge"] == "left_only", cmp["_merge"] == "right_only",
+         (cmp["level"] != cmp["level_prev"]) | (cmp["reason"] != cmp["reason_prev"])],
+        ["new", "cleared", "changed"],
+        default="",
+    )
+    cmp["change"] = change
+    delta = cmp.loc[change != "", ALERT_COLS + ["change"]].copy()
+    delta.loc[delta["change"] == "cleared", ["level", "reason"]] = None
+    delta = delta.sort_values(["region", "date"], kind="stable").reset_index(drop=True)
+
+    # roll state forward
+    new_tail = _tail(combined)
+    kept = prev_alerts.merge(frame.loc[evaluated, ["region", "date"]], on=["region", "date"],
+                             how="left", indicator=True)
+    kept = kept.loc[kept["_merge"] == "left_only", ALERT_COLS]
+    alerts = pd.concat([kept, current], ignore_index=True) if len(kept) else current
+    alerts = alerts.merge(new_tail[["region", "date"]], on=["region", "date"])
+
+    delta["date"] = delta["date"].dt.strftime("%Y-%m-%d")
+    return delta, AlertState(tail=new_tail, alerts=alerts)
+
+
+@dataclass
+class ChangepointState:
+    """Per-region OnlineChangepointDetector state and the last date fed to it."""
+    detectors: dict
+    last_date: dict
+
+    def save(self, path: Path) -> None:
+        ensure_dir(path.parent)
+        payload = {
+            "detectors": {r: d.to_dict() for r, d in self.detectors.items()},
+            "last_date": self.last_date,
+        }
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ChangepointState | None":
+        if not path.exists():
+            return None
+        payload = json.loads(path.read_text())
+        detectors = {r: OnlineChangepointDetector.from_dict(d) for r, d in payload["detectors"].items()}
+        return cls(detectors=detectors, last_date=payload["last_date"])
+
+
+def update_changepoints(master: pd.DataFrame, state: ChangepointState | None = None) -> tuple[pd.DataFrame, ChangepointState]:
+    """
+    Streaming changepoint detection: rows after each region's last fed date
+    are pushed through that region's detector, O(1) per new observation.
+    Appended data only - revisions of already-fed dates are ignored (the
+    batch path in update_alerts re-scores those).
+
+    Returns (flags, new_state); flags has `date`, `region` for flagged rows.
+    """
+    state = state or ChangepointState(detectors={}, last_date={})
+    df = master[["date", "region", "cases"]].copy()
+    df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
+    df = df.sort_values(["region", "date"], kind="stable")
+
+    flagged = []
+    for region, g in df.groupby("region", sort=False, observed=True):
+        last = state.last_date.get(region)
+        if last is not None:
+            g = g[g["date"] > last]
+        if g.empty:
+            continue
+        det = state.detectors.setdefault(region, OnlineChangepointDetector())
+        for d, c in zip(g["date"], g["cases"].to_numpy(dtype=float)):
+            if det.update(c):
+                flagged.append((d, region))
+        state.last_date[region] = g["date"].iloc[-1]
+
+    return pd.DataFrame(flagged, columns=["date", "region"]), state
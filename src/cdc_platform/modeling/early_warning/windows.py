@@ -0,0 +1,144 @@
+from __future__ import annotations
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+def rolling(s: pd.Series, window: int, min_periods: int, by=None):
+    """
+    Rolling window over s. When `by` (keys aligned with s) is given, the window
+    restarts per group, so many regions are handled in one vectorized pass.
+    Rows of each group must already be in date order.
+    """
+    if by is None:
+        return s.rolling(window, min_periods=min_periods)
+    return s.groupby(by, sort=False, observed=True).rolling(window, min_periods=min_periods)
+
+def ungroup(r: pd.Series, like: pd.Series, by=None) -> pd.Series:
+    """Align a (possibly group-indexed) rolling result back onto like.index."""
+    if by is None:
+        return r
+    return r.droplevel(0).reindex(like.index)
+
+def shift(s: pd.Series, periods: int = 1, by=None) -> pd.Series:
+    if by is None:
+        return s.shift(periods)
+    return s.groupby(by, sort=False, observed=True).shift(periods)
+
+# rows per chunk in rolling_quartiles is chosen so chunk * window stays near this
+QUARTILE_CHUNK_ELEMENTS = 2_000_000
+
+
+def _quartiles(win: np.ndarray, min_periods: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Median, q25, q75 of each row of win (NaN = absent), pandas' linear interpolation."""
+    a = np.sort(win, axis=1)  # NaNs sort last
+    cnt = np.count_nonzero(~np.isnan(a), axis=1)
+    rows = np.arange(len(a))
+    safe = np.maximum(cnt, 1)
+
+    def order(k):
+        return a[rows, np.clip(k, 0, a.shape[1] - 1)]
+
+    def quantile(q):
+        pos = q * (safe - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.ceil(pos).astype(np.int64)
+        vlo = order(lo)
+        return vlo + (order(hi) - vlo) * (pos - lo)
+
+    half = safe // 2
+    med = np.where(safe % 2 == 1, order(half), (order(half) + order(half - 1)) / 2)
+    q1, q3 = quantile(0.25), quantile(0.75)
+    short = cnt < max(min_periods, 1)
+    for v in (med, q1, q3):
+        v[short] = np.nan
+    return med, q1, q3
+
+
+def rolling_quartiles(s: pd.Series, window: int, min_periods: int, by=None) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Rolling (median, q25, q75) of s in one pass; same values as three separate
+    rolling(...).median()/.quantile() calls, with NaNs skipped like pandas.
+    Each row's window is sorted once and all three order statistics read from
+    it. `by` restarts the window per group (rows of each group in date order).
+    """
+    x = s.to_numpy(dtype=float)
+    n = len(x)
+    if by is None:
+        order = None
+        starts = np.zeros(n, dtype=np.int64)
+    else:
+        codes = pd.factorize(np.asarray(by))[0]
+        order = np.argsort(codes, kind="stable")
+        x, codes = x[order], codes[order]
+        new_group = np.r_[True, codes[1:] != codes[:-1]][:n]
+        starts = np.maximum.accumulate(np.where(new_group, np.arange(n), 0))
+
+    padded = np.concatenate([np.full(window - 1, np.nan), x])
+    view = np.lib.stride_tricks.sliding_window_view(padded, window)
+    offsets = np.arange(window)
+    out = np.full((3, n), np.nan)
+    chunk = max(1, QUARTILE_CHUNK_ELEMENTS // window)
+    for lo in range(0, n, chunk):
+        hi = min(n, lo + chunk)
+        win = view[lo:hi].copy()
+        # window slot k holds row i - window + 1 + k; blank slots before the group start
+        first_slot = starts[lo:hi] - (np.arange(lo, hi) - window + 1)
+        win[offsets[None, :] < first_slot[:, None]] = np.nan
+        out[:, lo:hi] = _quartiles(win, min_periods)
+
+    if order is not None:
+        unsorted = np.empty_like(out)
+        unsorted[:, order] = out
+        out = unsorted
+    return tuple(pd.Series(v, index=s.index) for v in out)
+
+
+class RollingQuartiles:
+    """
+    Streaming counterpart of rolling_quartiles for one series: push one
+    observation at a time and get (median, q25, q75) of the trailing window.
+    The window is kept sorted (bisect), so each update is O(log w) comparisons.
+    """
+
+    def __init__(self, window: int, min_periods: int):
+        self.window = window
+        self.min_periods = min_periods
+        self._raw: deque[float] = deque()
+        self._sorted: list[float] = []
+
+    def update(self, x: float) -> tuple[float, float, float]:
+        x = float(x)
+        self._raw.append(x)
+        if not np.isnan(x):
+            insort(self._sorted, x)
+        if len(self._raw) > self.window:
+            old = self._raw.popleft()
+            if not np.isnan(old):
+                del self._sorted[bisect_left(self._sorted, old)]
+        return self.quartiles()
+
+    def quartiles(self) -> tuple[float, float, float]:
+        a, n = self._sorted, len(self._sorted)
+        if n < max(self.min_periods, 1):
+            return (np.nan, np.nan, np.nan)
+
+        def quantile(q):
+            pos = q * (n - 1)
+            lo, hi = int(np.floor(pos)), int(np.ceil(pos))
+            return a[lo] + (a[hi] - a[lo]) * (pos - lo)
+
+        med = a[n // 2] if n % 2 else (a[n // 2] + a[n // 2 - 1]) / 2
+        return (med, quantile(0.25), quantile(0.75))
+
+    def to_dict(self) -> dict:
+        return {"window": self.window, "min_periods": self.min_periods,
+                "values": [None if np.isnan(v) else v for v in self._raw]}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "RollingQuartiles":
+        rq = cls(d["window"], d["min_periods"])
+        for v in d["values"]:
+            rq.update(np.nan if v is None else v)
+        return rq
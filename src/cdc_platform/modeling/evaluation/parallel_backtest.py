@@ -0,0 +1,123 @@
+# src/cdc_platform/modeling/evaluation/parallel_backtest.py
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from .backtesting import incremental_backtest_seir
+
+
+@dataclass(frozen=True)
+class BacktestTask:
+    region: str
+    population: int
+    horizon_days: int
+    cutoff_indices: tuple[int, ...]
+
+
+def plan_backtest_tasks(
+    master: pd.DataFrame,
+    populations=(1_000_000,),
+    horizons=(14,),
+    min_history_days: int = 60,
+    step_days: int = 7,
+    chunk_size: int | None = None,
+) -> tuple[list[BacktestTask], dict[str, pd.DataFrame]]:
+    """
+    Expand (region x population x horizon) into tasks of at most chunk_size
+    consecutive cutoffs each (None keeps all cutoffs of a series in one task,
+    which is cheapest since cutoffs are fitted in lockstep; smaller chunks
+    stream results sooner and are warm-started in sequence). Returns the
+    tasks and the per-region series (date, cases) they refer to.
+    """
+    df = master[["date", "region", "cases"]].copy()
+    df["date"] = pd.to_datetime(df["date"])
+    series = {region: g.sort_values("date").reset_index(drop=True) for region, g in df.groupby("region")}
+
+    tasks: list[BacktestTask] = []
+    for region, g in series.items():
+        for pop, horizon in itertools.product(populations, horizons):
+            cutoffs = list(range(min_history_days, len(g) - horizon, step_days))
+            step = chunk_size or max(len(cutoffs), 1)
+            for i in range(0, len(cutoffs), step):
+                tasks.append(BacktestTask(region, int(pop), int(horizon), tuple(cutoffs[i : i + step])))
+    return tasks, series
+
+
+def run_backtest_task(task: BacktestTask, df_region: pd.DataFrame, beta_init: float | None = None) -> pd.DataFrame:
+    bt = incremental_backtest_seir(
+        df_region,
+        pop=task.population,
+        horizon_days=task.horizon_days,
+        cutoff_indices=list(task.cutoff_indices),
+        beta_init=beta_init,
+    )
+    bt.insert(0, "region", task.region)
+    bt.insert(1, "population", task.population)
+    return bt
+
+
+def _series_chains(tasks: list[BacktestTask]) -> list[deque]:
+    """Tasks grouped per (region, population, horizon), chunks in cutoff order."""
+    chains: dict[tuple, deque] = {}
+    for task in tasks:
+        chains.setdefault((task.region, task.population, task.horizon_days), deque()).append(task)
+    return list(chains.values())
+
+
+def _last_beta(bt: pd.DataFrame) -> float | None:
+    return float(bt["beta"].iloc[-1]) if len(bt) else None
+
+
+def iter_backtests(
+    master: pd.DataFrame,
+    populations=(1_000_000,),
+    horizons=(14,),
+    workers: int = 1,
+    chunk_size: int | None = None,
+    min_history_days: int = 60,
+    step_days: int = 7,
+) -> Iterator[tuple[BacktestTask, pd.DataFrame, int]]:
+    """
+    Run the backtest sweep, yielding (task, result, total_tasks) as each task
+    completes. Chunks of one series run in cutoff order, each warm-started
+    from the previous chunk's last fitted beta, so serial and parallel runs
+    give the same rows. workers > 1 fans series out to a process pool
+    (results arrive in completion order); workers <= 1 runs serially
+    in-process. chunk_size only sets how often results are streamed.
+    """
+    tasks, series = plan_backtest_tasks(master, populations, horizons, min_history_days, step_days, chunk_size)
+    total = len(tasks)
+    chains = _series_chains(tasks)
+    if workers <= 1:
+        for chain in chains:
+            beta = None
+            for task in chain:
+                bt = run_backtest_task(task, series[task.region], beta)
+                beta = _last_beta(bt) or beta
+                yield task, bt, total
+        return
+
+    with ProcessPoolExecutor(max_workers=int(workers)) as pool:
+        running = {}
+
+        def submit(chain: deque, beta: float | None) -> None:
+            task = chain.popleft()
+            running[pool.submit(run_backtest_task, task, series[task.region], beta)] = (task, chain, beta)
+
+        for chain in chains:
+            submit(chain, None)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                task, chain, beta = running.pop(fut)
+                bt = fut.result()
+                if chain:
+                    submit(chain, _last_beta(bt) or beta)
+                yield task, bt, total
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from ...common.cache import LRUCache
+from ...common.io import ensure_dir
+from .calibration import BETA_BOUNDS, CalibResult, calibrate_seir_to_cases
+from .model import SEIRParams
+
+def series_hash(values) -> str:
+    """Stable hash of a case series (NaN treated as 0, as in calibration)."""
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    return hashlib.sha1(np.ascontiguousarray(y).tobytes()).hexdigest()
+
+def calib_key(values, pop, incubation_days: float = 4.0, infectious_days: float = 6.0,
+              method: str = "golden", beta_bounds: tuple[float, float] = BETA_BOUNDS,
+              fit_periods: bool = False, fit_initial: bool = False) -> tuple:
+    """
+    Key of one fit: the series and population plus every setting that changes
+    the fitted parameters (search method and bounds, joint refinement), so
+    fits made different ways never share an entry.
+    """
+    return (series_hash(values), int(pop), float(incubation_days), float(infectious_days),
+            str(method), float(beta_bounds[0]), float(beta_bounds[1]), bool(fit_periods), bool(fit_initial))
+
+class CalibrationCache:
+    """
+    Shared SEIR calibration cache keyed on calib_key: (region series hash,
+    pop, incubation_days, infectious_days, fit method and bounds).
+    Can be persisted to JSON so separate processes (API, DAGs, dashboard)
+    reuse the same fits instead of recalibrating the same series.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self._lru = LRUCache(maxsize=maxsize)
+
+    def get(self, key: tuple) -> CalibResult | None:
+        return self._lru.get(key)
+
+    def put(self, key: tuple, result: CalibResult) -> None:
+        self._lru.put(key, result)
+
+    def calibrate(self, daily_cases: pd.Series, pop: int,
+                  incubation_days: float = 4.0, infectious_days: float = 6.0,
+                  method: str = "golden", fit_periods: bool = False, fit_initial: bool = False) -> CalibResult:
+        key = calib_key(daily_cases.fillna(0).astype(float).values, pop, incubation_days, infectious_days,
+                        method=method, fit_periods=fit_periods, fit_initial=fit_initial)
+        return self._lru.get_or_compute(
+            key,
+            lambda: calibrate_seir_to_cases(daily_cases, pop=pop, incubation_days=incubation_days,
+                                            infectious_days=infectious_days, method=method,
+                                            fit_periods=fit_periods, fit_initial=fit_initial),
+        )
+
+    def save(self, path: Path) -> None:
+        ensure_dir(path.parent)
+        payload = [{"key": list(k), "result": asdict(v)} for k, v in self._lru.items()]
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(path)
+
+    def load(self, path: Path) -> int:
+        if not path.exists():
+            return 0
+        payload = json.loads(path.read_text())
+        for entry in payload:
+            r = dict(entry["result"])
+            params = SEIRParams(**r.pop("params"))
+            self._lru.put(tuple(entry["key"]), CalibResult(params=params, **r))
+        return len(payload)
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+default_calibration_cache = CalibrationCache()
@@ -2,7 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 import numpy as np
 import pandas as pd
-from .model import SEIRParams, simulate_seir
+from scipy.optimize import minimize
+from .model import SEIRParams, simulate_seir, simulate_seir_batch
 
 @dataclass(frozen=True)
 class CalibResult:
@@ -12,44 +13,239 @@ class CalibResult:
     i0: float
     r0: float
     pop: int
+    loss: float = float("nan")  # MSE of the fitted case curve
+    n_sims: int = 0             # SEIR simulations spent on the fit
+
+@dataclass(frozen=True)
+class BatchCalibResult:
+    """Per-region calibration arrays, all shaped (n_regions,)."""
+    beta: np.ndarray
+    sigma: np.ndarray
+    gamma: np.ndarray
+    s0: np.ndarray
+    e0: np.ndarray
+    i0: np.ndarray
+    r0: np.ndarray
+    pop: np.ndarray
+    loss: np.ndarray
+    n_sims: np.ndarray
+
+    @classmethod
+    def from_results(cls, results: list[CalibResult]) -> "BatchCalibResult":
+        def arr(fn, dtype=float):
+            return np.array([fn(r) for r in results], dtype=dtype)
+        return cls(
+            beta=arr(lambda r: r.params.beta), sigma=arr(lambda r: r.params.sigma), gamma=arr(lambda r: r.params.gamma),
+            s0=arr(lambda r: r.s0), e0=arr(lambda r: r.e0), i0=arr(lambda r: r.i0), r0=arr(lambda r: r.r0),
+            pop=arr(lambda r: r.pop), loss=arr(lambda r: r.loss), n_sims=arr(lambda r: r.n_sims, int),
+        )
+
+    def region(self, idx: int) -> CalibResult:
+        return CalibResult(
+            params=SEIRParams(beta=float(self.beta[idx]), sigma=float(self.sigma[idx]), gamma=float(self.gamma[idx])),
+            s0=float(self.s0[idx]), e0=float(self.e0[idx]), i0=float(self.i0[idx]), r0=float(self.r0[idx]),
+            pop=int(self.pop[idx]), loss=float(self.loss[idx]), n_sims=int(self.n_sims[idx]),
+        )
+
+# Upper bound on elements per simulated compartment array, used to chunk batches
+SIM_CHUNK_ELEMENTS = 4_000_000
+
+BETA_BOUNDS = (0.05, 1.0)
+GRID_POINTS = 60       # legacy grid search
+SEED_POINTS = 8        # coarse bracket before golden-section refinement
+WARM_WIDTH = 0.25      # warm-start bracket: beta_init * (1 +/- WARM_WIDTH)
+_INVPHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+def _case_losses(y: np.ndarray, lengths: np.ndarray, pop, s0, e0, i0, r0,
+                 beta: np.ndarray, sigma, gamma) -> np.ndarray:
+    """
+    MSE between observed cases and k * I for each region/candidate.
+    y: (n_regions, T); beta: (n_regions, n_candidates). The remaining
+    per-region parameters are (n_regions,) arrays. k is solved in closed form.
+    Returns losses shaped like beta.
+    """
+    n_regions, days = y.shape
+    mask = np.arange(days)[None, :] < lengths[:, None]
+    beta = np.asarray(beta, dtype=float)
+    losses = np.empty(beta.shape)
+    col = (slice(None), None)
+    step = max(1, SIM_CHUNK_ELEMENTS // (beta.shape[1] * max(days, 1)))
+    for lo in range(0, n_regions, step):
+        sl = slice(lo, lo + step)
+        if beta[sl].size == 1:
+            # a single trajectory is cheaper through the scalar integrator
+            params = SEIRParams(beta=float(beta[sl][0, 0]), sigma=float(sigma[sl][0]), gamma=float(gamma[sl][0]))
+            sim = simulate_seir(pop=float(pop[sl][0]), S0=float(s0[sl][0]), E0=float(e0[sl][0]), I0=float(i0[sl][0]),
+                                R0=float(r0[sl][0]), params=params, days=days-1)
+            sim = {"I": sim["I"][None, None, :]}
+        else:
+            sim = simulate_seir_batch(pop=pop[sl][col], S0=s0[sl][col], E0=e0[sl][col], I0=i0[sl][col],
+                                      R0=r0[sl][col], beta=beta[sl], sigma=sigma[sl][col], gamma=gamma[sl][col],
+                                      days=days-1)
+        I = sim["I"] * mask[sl][:, None, :]  # (regions, candidates, T)
+        yc = y[sl][:, None, :]
+        # We map model infectious -> "cases" via a proportionality constant k fitted by least squares
+        k = np.einsum("rbt,rbt->rb", yc, I) / (np.einsum("rbt,rbt->rb", I, I) + 1e-9)
+        losses[sl] = np.sum((yc - k[..., None] * I) ** 2, axis=2) / np.maximum(lengths[sl], 1)[:, None]
+    return losses
+
+def _golden_section(fn, a: np.ndarray, b: np.ndarray, tol: float, max_iter: int = 100):
+    """
+    Vectorized golden-section search: minimizes fn elementwise on [a, b].
+    fn maps an (n,) array of candidates to (n,) losses; each call is one
+    batched evaluation. Returns (x, fx, n_calls).
+    """
+    c = b - _INVPHI * (b - a)
+    d = a + _INVPHI * (b - a)
+    fc, fd = fn(c), fn(d)
+    n_calls = 2
+    for _ in range(max_iter):
+        if np.all(b - a <= tol):
+            break
+        left = fc < fd  # minimum lies in [a, d]
+        a, b = np.where(left, a, c), np.where(left, d, b)
+        c, d = np.where(left, b - _INVPHI * (b - a), d), np.where(left, c, a + _INVPHI * (b - a))
+        x_new = np.where(left, c, d)
+        f_new = fn(x_new)
+        n_calls += 1
+        fc, fd = np.where(left, f_new, fd), np.where(left, fc, f_new)
+    take_c = fc <= fd
+    return np.where(take_c, c, d), np.where(take_c, fc, fd), n_calls
+
+def calibrate_seir_batch(cases: np.ndarray, lengths: np.ndarray, pop,
+                         incubation_days: float = 4.0, infectious_days: float = 6.0,
+                         method: str = "golden", beta_init=None,
+                         beta_bounds: tuple[float, float] = BETA_BOUNDS, tol: float = 1e-4) -> BatchCalibResult:
+    """
+    Fit beta for many regions at once.
+    cases: (n_regions, T) right-padded case matrix; only the first lengths[r]
+    entries of row r are observed. pop: scalar or (n_regions,) array.
+
+    method:
+      - "grid": legacy 60-point grid, all candidates simulated as one
+        (regions, betas, time) array.
+      - "golden": a coarse seed grid brackets the optimum, then a vectorized
+        golden-section search refines every region in lockstep.
+    beta_init (scalar or (n_regions,) array, e.g. yesterday's fit) warm-starts
+    "golden" from a narrow bracket around it, skipping the seed grid; regions
+    whose optimum lands on the narrow bracket edge are re-fit on the full range.
+    """
+    y = np.nan_to_num(np.asarray(cases, dtype=float))
+    lengths = np.asarray(lengths, dtype=int)
+    n_regions, days = y.shape
+    y = np.where(np.arange(days)[None, :] < lengths[:, None], y, 0.0)
+    pop = np.broadcast_to(np.asarray(pop, dtype=float), (n_regions,)).copy()
+
+    sigma = np.full(n_regions, 1.0 / incubation_days)
+    gamma = np.full(n_regions, 1.0 / infectious_days)
+
+    # initial conditions
+    n_head = np.clip(lengths, 1, 7)
+    i0 = np.maximum(1.0, y[:, :7].sum(axis=1) / n_head)
+    e0 = i0 * 2.0
+    r0 = np.zeros(n_regions)
+    s0 = pop - e0 - i0 - r0
+
+    def losses(betas: np.ndarray) -> np.ndarray:
+        return _case_losses(y, lengths, pop, s0, e0, i0, r0, betas, sigma, gamma)
+
+    lo, hi = beta_bounds
+    if method == "grid":
+        betas = np.linspace(lo, hi, GRID_POINTS)
+        grid_loss = losses(np.broadcast_to(betas, (n_regions, len(betas))))
+        best = np.argmin(grid_loss, axis=1)
+        beta = betas[best]
+        loss = grid_loss[np.arange(n_regions), best]
+        n_sims = np.full(n_regions, GRID_POINTS)
+    elif method == "golden":
+        def subset(idx: np.ndarray):
+            return lambda betas: _case_losses(y[idx], lengths[idx], pop[idx], s0[idx], e0[idx], i0[idx],
+                                              r0[idx], betas, sigma[idx], gamma[idx])
+
+        def seeded(idx: np.ndarray):
+            # coarse grid to find the basin, then refine between its neighbours
+            seeds = np.linspace(lo, hi, SEED_POINTS)
+            fn = subset(idx)
+            seed_loss = fn(np.broadcast_to(seeds, (len(idx), SEED_POINTS)))
+            best = np.argmin(seed_loss, axis=1)
+            a = seeds[np.maximum(best - 1, 0)]
+            b = seeds[np.minimum(best + 1, SEED_POINTS - 1)]
+            x, fx, n = _golden_section(lambda v: fn(v[:, None])[:, 0], a, b, tol)
+            return x, fx, SEED_POINTS + n
+
+        beta = np.empty(n_regions)
+        loss = np.empty(n_regions)
+        n_sims = np.zeros(n_regions, dtype=int)
+        todo = np.arange(n_regions)
+        if beta_init is not None:
+            b0 = np.clip(np.broadcast_to(np.asarray(beta_init, dtype=float), (n_regions,)), lo, hi)
+            a = np.maximum(lo, b0 * (1 - WARM_WIDTH))
+            b = np.minimum(hi, b0 * (1 + WARM_WIDTH))
+            x, fx, n = _golden_section(lambda v: losses(v[:, None])[:, 0], a, b, tol)
+            beta[:], loss[:], n_sims[:] = x, fx, n
+            edge = ((x - a <= 2 * tol) & (a > lo)) | ((b - x <= 2 * tol) & (b < hi))
+            todo = np.flatnonzero(edge)
+        if len(todo):
+            x, fx, n = seeded(todo)
+            beta[todo], loss[todo] = x, fx
+            n_sims[todo] += n
+    else:
+        raise ValueError(f"Unknown calibration method: {method!r}")
+
+    return BatchCalibResult(beta=beta, sigma=sigma, gamma=gamma, s0=s0, e0=e0, i0=i0, r0=r0,
+                            pop=pop, loss=loss, n_sims=n_sims)
 
 def calibrate_seir_to_cases(daily_cases: pd.Series, pop: int,
-                            incubation_days: float = 4.0, infectious_days: float = 6.0) -> CalibResult:
+                            incubation_days: float = 4.0, infectious_days: float = 6.0,
+                            method: str = "golden", beta_init: float | None = None,
+                            fit_periods: bool = False, fit_initial: bool = False,
+                            max_joint_sims: int = 300) -> CalibResult:
     """
-    Lightweight calibration: grid-search beta to match observed case curve shape.
+    Lightweight calibration: fit beta to match observed case curve shape
+    (k mapping I -> cases is solved in closed form).
     This is intentionally simple for a portfolio repo (swap with PyMC/Stan later).
+
+    method="golden" (default) uses a bounded golden-section search, optionally
+    warm-started from beta_init; method="grid" is the legacy 60-point grid.
+    fit_periods / fit_initial additionally refine incubation/infectious periods
+    and the initial infectious count jointly with beta (bounded Nelder-Mead).
+    The returned n_sims reports how many SEIR simulations the fit used.
     """
     y = daily_cases.fillna(0).astype(float).values
-    days = len(y)
+    lengths = np.array([len(y)])
+    batch = calibrate_seir_batch(y[None, :], lengths, pop, incubation_days=incubation_days,
+                                 infectious_days=infectious_days, method=method, beta_init=beta_init)
+    result = batch.region(0)
+    if not (fit_periods or fit_initial):
+        return result
 
-    sigma = 1.0 / incubation_days
-    gamma = 1.0 / infectious_days
+    # Joint refinement: theta = (beta, incubation_days, infectious_days, i0 multiplier)
+    theta0 = np.array([result.params.beta, incubation_days, infectious_days, 1.0])
+    bounds = [
+        BETA_BOUNDS,
+        (1.0, 14.0) if fit_periods else (incubation_days, incubation_days),
+        (1.0, 21.0) if fit_periods else (infectious_days, infectious_days),
+        (0.1, 10.0) if fit_initial else (1.0, 1.0),
+    ]
+    pop_arr = np.array([float(pop)])
 
-    # initial conditions
-    i0 = max(1.0, float(y[:7].mean()))
-    e0 = i0 * 2.0
-    r0 = 0.0
-    s0 = float(pop) - e0 - i0 - r0
-
-    # fit beta via coarse grid
-    betas = np.linspace(0.05, 1.0, 60)
-    best_beta = 0.2
-    best_loss = float("inf")
-
-    # We map model infectious -> "cases" via a proportionality constant k fitted by least squares
-    for beta in betas:
-        params = SEIRParams(beta=float(beta), sigma=float(sigma), gamma=float(gamma))
-        sim = simulate_seir(pop=pop, S0=s0, E0=e0, I0=i0, R0=r0, params=params, days=days-1)
-        I = sim["I"]
-        # Fit k to map I to cases
-        k = (y @ I) / (I @ I + 1e-9)
-        pred = k * I
-        loss = float(np.mean((y - pred) ** 2))
-        if loss < best_loss:
-            best_loss = loss
-            best_beta = float(beta)
+    def state(theta):
+        i0 = result.i0 * float(theta[3])
+        e0 = i0 * 2.0
+        return float(pop) - e0 - i0, e0, i0
+
+    def objective(theta):
+        s0, e0, i0 = state(theta)
+        return float(_case_losses(y[None, :], lengths, pop_arr, np.array([s0]), np.array([e0]), np.array([i0]),
+                                  np.zeros(1), np.array([[theta[0]]]), np.array([1.0 / theta[1]]),
+                                  np.array([1.0 / theta[2]]))[0, 0])
 
+    opt = minimize(objective, theta0, method="Nelder-Mead", bounds=bounds,
+                   options={"maxfev": int(max_joint_sims), "xatol": 1e-4, "fatol": 1e-8})
+    theta = opt.x if opt.fun < result.loss else theta0
+    s0, e0, i0 = state(theta)
     return CalibResult(
-        params=SEIRParams(beta=best_beta, sigma=sigma, gamma=gamma),
-        s0=s0, e0=e0, i0=i0, r0=r0, pop=pop
+        params=SEIRParams(beta=float(theta[0]), sigma=1.0 / float(theta[1]), gamma=1.0 / float(theta[2])),
+        s0=s0, e0=e0, i0=i0, r0=0.0, pop=pop,
+        loss=float(min(opt.fun, result.loss)), n_sims=result.n_sims + int(opt.nfev),
     )
@@ -1,28 +1,73 @@
 from __future__ import annotations
+from typing import Iterator
 import numpy as np
 import pandas as pd
-from .calibration import calibrate_seir_to_cases
-from .model import simulate_seir, rt_from_params
+from .cache import CalibrationCache, calib_key, default_calibration_cache
+from .calibration import BatchCalibResult, calibrate_seir_to_cases, calibrate_seir_batch, SIM_CHUNK_ELEMENTS
+from .model import simulate_seir, simulate_seir_batch, rt_from_params
 
-def forecast_cases_seir_with_uncertainty(
+def quantile_label(q: float) -> str:
+    """Band column name for quantile q: exact percentile, 0.1 -> "q10", 0.005 -> "q0.5"."""
+    return "q" + f"{q * 100:.6f}".rstrip("0").rstrip(".")
+
+def sample_betas(beta, n_samples: int, beta_sd_frac: float) -> np.ndarray:
+    """
+    Beta draws behind every uncertainty band: beta + sd * z, sd = beta_sd_frac
+    * |beta|, from one fixed normal stream (seed 123), floored at 1e-6.
+    Scalar beta -> (n_samples,); beta of shape (R,) -> (R, n_samples).
+    """
+    beta = np.asarray(beta, dtype=float)
+    z = np.random.RandomState(123).normal(size=int(n_samples))
+    sd = np.maximum(1e-6, np.abs(beta) * beta_sd_frac)
+    return np.maximum(1e-6, beta[..., None] + sd[..., None] * z)
+
+def _calibrate(daily_cases: pd.Series, pop: int, cache: CalibrationCache | None):
+    if cache is None:
+        return calibrate_seir_to_cases(daily_cases, pop=pop)
+    return cache.calibrate(daily_cases, pop=pop)
+
+def forecast_cases_seir(
     daily_cases: pd.Series,
     pop: int,
     horizon_days: int = 28,
-    n_samples: int = 200,
-    beta_sd_frac: float = 0.15,
-    quantiles=(0.1, 0.5, 0.9),
+    cache: CalibrationCache | None = default_calibration_cache,
 ) -> dict:
     """
-    Uncertainty bands via sampling beta around calibrated beta.
-    This is a lightweight, portfolio-safe approach that gives useful bands.
+    Deterministic point forecast from the calibrated SEIR model.
+    Calibration goes through the shared cache, so repeated calls on the same
+    series (API, DAGs, dashboard) reuse one fit.
 
     Returns:
       - rt0_est
-      - history_qXX arrays
-      - forecast_qXX arrays
+      - history_pred array (fitted cases over the observed window)
+      - forecast array (horizon_days values)
     """
     daily_cases = daily_cases.fillna(0).astype(float)
-    calib = calibrate_seir_to_cases(daily_cases, pop=pop)
+    calib = _calibrate(daily_cases, pop, cache)
+    y = daily_cases.values
+
+    sim = simulate_seir(
+        pop=calib.pop,
+        S0=calib.s0, E0=calib.e0, I0=calib.i0, R0=calib.r0,
+        params=calib.params,
+        days=(len(y) - 1) + horizon_days
+    )
+    I = sim["I"]
+    I_hist = I[: len(y)]
+    k = (y @ I_hist) / (I_hist @ I_hist + 1e-9)
+    pred = k * I
+
+    return {
+        "rt0_est": rt_from_params(calib.params),
+        "history_pred": pred[: len(y)],
+        "forecast": pred[len(y):],
+    }
+
+def _uncertainty_setup(daily_cases: pd.Series, pop: int, horizon_days: int, n_samples: int,
+                       beta_sd_frac: float, cache: CalibrationCache | None):
+    """Shared by the batch and progressive forecasters: (calib, y, total_days, k, betas)."""
+    daily_cases = daily_cases.fillna(0).astype(float)
+    calib = _calibrate(daily_cases, pop, cache)
 
     # Base sim length
     total_days = (len(daily_cases) - 1) + horizon_days
@@ -39,36 +84,270 @@ def forecast_cases_seir_with_uncertainty(
     I_hist = I_base[: len(y)]
     k = (y @ I_hist) / (I_hist @ I_hist + 1e-9)
 
-    # Sample betas
-    beta0 = float(calib.params.beta)
-    sd = max(1e-6, abs(beta0) * beta_sd_frac)
-
-    preds = []
-    rng = np.random.RandomState(123)
-    for _ in range(int(n_samples)):
-        beta_s = max(1e-6, float(rng.normal(loc=beta0, scale=sd)))
-        params_s = type(calib.params)(beta=beta_s, sigma=calib.params.sigma, gamma=calib.params.gamma)
-
-        sim = simulate_seir(
-            pop=calib.pop,
-            S0=calib.s0, E0=calib.e0, I0=calib.i0, R0=calib.r0,
-            params=params_s,
-            days=total_days
-        )
-        I = sim["I"]
-        pred = k * I
-        preds.append(pred)
+    betas = sample_betas(calib.params.beta, n_samples, beta_sd_frac)
+    return calib, y, total_days, k, betas
 
-    preds = np.stack(preds, axis=0)  # (S, T)
+def _simulate_preds(calib, k: float, betas: np.ndarray, total_days: int) -> np.ndarray:
+    # All samples are integrated together in one vectorized time loop
+    sim = simulate_seir_batch(
+        pop=calib.pop,
+        S0=calib.s0, E0=calib.e0, I0=calib.i0, R0=calib.r0,
+        beta=betas, sigma=calib.params.sigma, gamma=calib.params.gamma,
+        days=total_days
+    )
+    return k * sim["I"]  # (S, T)
 
+def _band_output(calib, preds: np.ndarray, n_hist: int, quantiles) -> dict:
     qs = {}
     for q in quantiles:
         qs[q] = np.quantile(preds, q=q, axis=0)
 
-    out = {
+    return {
         "rt0_est": rt_from_params(calib.params),
+        "calib_n_sims": calib.n_sims,
         "quantiles": quantiles,
-        "history": {q: qs[q][: len(y)] for q in quantiles},
-        "forecast": {q: qs[q][len(y):] for q in quantiles},
+        "history": {q: qs[q][: n_hist] for q in quantiles},
+        "forecast": {q: qs[q][n_hist:] for q in quantiles},
     }
-    return out
\ No newline at end of file
+
+def forecast_cases_seir_with_uncertainty(
+    daily_cases: pd.Series,
+    pop: int,
+    horizon_days: int = 28,
+    n_samples: int = 200,
+    beta_sd_frac: float = 0.15,
+    quantiles=(0.1, 0.5, 0.9),
+    cache: CalibrationCache | None = default_calibration_cache,
+) -> dict:
+    """
+    Uncertainty bands via sampling beta around calibrated beta.
+    This is a lightweight, portfolio-safe approach that gives useful bands.
+
+    Returns:
+      - rt0_est
+      - history_qXX arrays
+      - forecast_qXX arrays
+    """
+    calib, y, total_days, k, betas = _uncertainty_setup(daily_cases, pop, horizon_days, n_samples,
+                                                        beta_sd_frac, cache)
+    preds = _simulate_preds(calib, k, betas, total_days)
+    return _band_output(calib, preds, len(y), quantiles)
+
+def iter_forecast_cases_seir_with_uncertainty(
+    daily_cases: pd.Series,
+    pop: int,
+    horizon_days: int = 28,
+    n_samples: int = 200,
+    beta_sd_frac: float = 0.15,
+    quantiles=(0.1, 0.5, 0.9),
+    first_batch: int = 50,
+    tol: float | None = 0.05,
+    cache: CalibrationCache | None = default_calibration_cache,
+) -> Iterator[dict]:
+    """
+    Progressive forecast_cases_seir_with_uncertainty: simulates the same beta
+    samples in growing batches (first_batch, then doubling: 50, 100, 200, ...)
+    and yields the bands after each, so callers can render early estimates
+    and refine them in place.
+
+    Each yield has the forecast_cases_seir_with_uncertainty keys plus
+      - n_samples_used
+      - band_change: max change of the forecast quantiles since the previous
+        yield, relative to the previous bands' peak (None on the first)
+      - converged: band_change <= tol
+    Sampling stops early once converged (tol=None always runs all samples);
+    the last yield over all n_samples equals the non-progressive result.
+    """
+    calib, y, total_days, k, betas = _uncertainty_setup(daily_cases, pop, horizon_days, n_samples,
+                                                        beta_sd_frac, cache)
+    n_hist = len(y)
+    preds = np.empty((len(betas), total_days + 1))
+    done = 0
+    prev = None
+    batch = max(1, int(first_batch))
+    while done < len(betas):
+        upto = min(len(betas), done + batch)
+        preds[done:upto] = _simulate_preds(calib, k, betas[done:upto], total_days)
+        done = upto
+        batch = done  # doubling schedule
+
+        out = _band_output(calib, preds[:done], n_hist, quantiles)
+        bands = np.stack([out["forecast"][q] for q in quantiles])
+        change = None
+        if prev is not None:
+            change = float(np.max(np.abs(bands - prev)) / (np.max(np.abs(prev)) + 1e-9)) if bands.size else 0.0
+        converged = change is not None and tol is not None and change <= tol
+        out.update({"n_samples_used": done, "band_change": change, "converged": converged})
+        yield out
+        if converged:
+            return
+        prev = bands
+
+def _region_matrix(master: pd.DataFrame, value_col: str):
+    """(regions, y (R, T) zero-padded per region, lengths, last_date) from a long table."""
+    df = master[["date", "region", value_col]].copy()
+    df["date"] = pd.to_datetime(df["date"])
+    df = df.sort_values(["region", "date"], kind="stable")
+
+    codes, regions = pd.factorize(df["region"], sort=True)
+    n_regions = len(regions)
+    lengths = np.bincount(codes, minlength=n_regions)
+    pos = df.groupby("region", sort=True, observed=True).cumcount().to_numpy()
+    t_max = int(lengths.max()) if n_regions else 0
+
+    y = np.zeros((n_regions, t_max))
+    y[codes, pos] = df[value_col].fillna(0).astype(float).to_numpy()
+    last_date = df.groupby("region", sort=True, observed=True)["date"].max().to_numpy()
+    return regions, y, lengths, last_date
+
+
+def _region_pops(regions, pop) -> np.ndarray:
+    if isinstance(pop, dict):
+        return np.array([float(pop[r]) for r in regions])
+    return np.full(len(regions), float(pop))
+
+
+def _calibrate_batch(y, lengths, pops, cache: CalibrationCache | None) -> BatchCalibResult:
+    if cache is None:
+        return calibrate_seir_batch(y, lengths, pops)
+    # only regions whose series changed since the last fit are recalibrated
+    n_regions = len(lengths)
+    keys = [calib_key(y[r, :lengths[r]], pops[r], method="golden") for r in range(n_regions)]
+    fits = [cache.get(k) for k in keys]
+    miss = np.array([r for r, f in enumerate(fits) if f is None], dtype=int)
+    if len(miss):
+        fresh = calibrate_seir_batch(y[miss], lengths[miss], pops[miss], method="golden")
+        for j, r in enumerate(miss):
+            fits[r] = fresh.region(j)
+            cache.put(keys[r], fits[r])
+    return BatchCalibResult.from_results(fits)
+
+
+def prime_calibration_cache(
+    master: pd.DataFrame,
+    pop=1_000_000,
+    value_col: str = "cases",
+    cache: CalibrationCache = default_calibration_cache,
+) -> int:
+    """
+    Batch-calibrate every region whose fit is not cached yet, so subsequent
+    per-region forecast_cases_seir calls are cache hits. Returns #regions.
+    """
+    regions, y, lengths, _ = _region_matrix(master, value_col)
+    if len(regions):
+        _calibrate_batch(y, lengths, _region_pops(regions, pop), cache)
+    return len(regions)
+
+
+def point_forecast_all_regions(
+    master: pd.DataFrame,
+    pop=1_000_000,
+    horizon_days: int = 28,
+    value_col: str = "cases",
+    cache: CalibrationCache | None = default_calibration_cache,
+) -> dict[str, dict]:
+    """
+    forecast_cases_seir for every region from one batched calibration and
+    base simulation, instead of filtering the table once per region.
+
+    Returns {region: {"rt0_est", "history_pred", "forecast"}} with the same
+    arrays forecast_cases_seir gives for that region's series.
+    """
+    regions, y, lengths, _ = _region_matrix(master, value_col)
+    n_regions = len(regions)
+    if not n_regions:
+        return {}
+    calib = _calibrate_batch(y, lengths, _region_pops(regions, pop), cache)
+
+    t_max = y.shape[1]
+    total_days = (t_max - 1) + horizon_days
+    out = {}
+    step = max(1, SIM_CHUNK_ELEMENTS // (total_days + 1))
+    for lo in range(0, n_regions, step):
+        sl = slice(lo, lo + step)
+        base = simulate_seir_batch(pop=calib.pop[sl], S0=calib.s0[sl], E0=calib.e0[sl], I0=calib.i0[sl],
+                                   R0=calib.r0[sl], beta=calib.beta[sl], sigma=calib.sigma[sl],
+                                   gamma=calib.gamma[sl], days=total_days)
+        I_hist = base["I"][:, :t_max] * (np.arange(t_max)[None, :] < lengths[sl, None])
+        k = np.einsum("rt,rt->r", y[sl], I_hist) / (np.einsum("rt,rt->r", I_hist, I_hist) + 1e-9)
+        for j, r in enumerate(range(lo, min(lo + step, n_regions))):
+            n = int(lengths[r])
+            pred = k[j] * base["I"][j, : n + horizon_days]
+            out[str(regions[r])] = {
+                "rt0_est": float(calib.beta[r] / calib.gamma[r]),
+                "history_pred": pred[:n],
+                "forecast": pred[n:],
+            }
+    return out
+
+
+def forecast_all_regions(
+    master: pd.DataFrame,
+    pop=1_000_000,
+    horizon_days: int = 28,
+    n_samples: int = 200,
+    beta_sd_frac: float = 0.15,
+    quantiles=(0.1, 0.5, 0.9),
+    value_col: str = "cases",
+    cache: CalibrationCache | None = default_calibration_cache,
+) -> pd.DataFrame:
+    """
+    Multi-region version of forecast_cases_seir_with_uncertainty.
+    Every region is calibrated and sampled together as one
+    (regions, samples, time) array computation (chunked over regions),
+    instead of a groupby("region") loop.
+
+    pop: scalar population or a {region: population} mapping.
+
+    Returns a tidy table with one row per region and day:
+      region, date, t, kind ("history"|"forecast"), rt0_est, q10, q50, q90, ...
+    """
+    regions, y, lengths, last_date = _region_matrix(master, value_col)
+    n_regions = len(regions)
+    t_max = int(lengths.max()) if n_regions else 0
+    pops = _region_pops(regions, pop)
+
+    calib = _calibrate_batch(y, lengths, pops, cache)
+
+    total_days = (t_max - 1) + horizon_days
+    n_steps = total_days + 1
+    hist_mask = np.arange(t_max)[None, :] < lengths[:, None]
+
+    # Same sampling stream as the single-region forecaster
+    betas_all = sample_betas(calib.beta, n_samples, beta_sd_frac)  # (regions, samples)
+
+    qs = np.empty((len(quantiles), n_regions, n_steps))
+    col = (slice(None), None)
+    step = max(1, SIM_CHUNK_ELEMENTS // (max(int(n_samples), 1) * n_steps))
+    for lo in range(0, n_regions, step):
+        sl = slice(lo, lo + step)
+
+        # fit constant mapping I->cases using base beta (history only)
+        base = simulate_seir_batch(pop=calib.pop[sl], S0=calib.s0[sl], E0=calib.e0[sl], I0=calib.i0[sl],
+                                   R0=calib.r0[sl], beta=calib.beta[sl], sigma=calib.sigma[sl],
+                                   gamma=calib.gamma[sl], days=total_days)
+        I_hist = base["I"][:, :t_max] * hist_mask[sl]
+        k = np.einsum("rt,rt->r", y[sl], I_hist) / (np.einsum("rt,rt->r", I_hist, I_hist) + 1e-9)
+
+        sim = simulate_seir_batch(pop=calib.pop[sl][col], S0=calib.s0[sl][col], E0=calib.e0[sl][col],
+                                  I0=calib.i0[sl][col], R0=calib.r0[sl][col], beta=betas_all[sl],
+                                  sigma=calib.sigma[sl][col], gamma=calib.gamma[sl][col], days=total_days)
+        preds = k[:, None, None] * sim["I"]  # (regions, samples, T)
+        qs[:, sl, :] = np.quantile(preds, q=list(quantiles), axis=1)
+
+    # Each region keeps its own history length plus the horizon
+    t_idx = np.arange(n_steps)[None, :]
+    keep = t_idx < (lengths[:, None] + horizon_days)
+    region_idx, t_keep = np.nonzero(keep)
+    first_date = last_date - (lengths - 1).astype("timedelta64[D]")
+
+    out = pd.DataFrame({
+        "region": regions[region_idx],
+        "date": first_date[region_idx] + t_keep.astype("timedelta64[D]"),
+        "t": t_keep,
+        "kind": np.where(t_keep < lengths[region_idx], "history", "forecast"),
+        "rt0_est": (calib.beta / calib.gamma)[region_idx],
+    })
+    for j, q in enumerate(quantiles):
+        out[quantile_label(q)] = qs[j][region_idx, t_keep]
+    return out
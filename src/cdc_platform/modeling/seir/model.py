@@ -36,3 +36,35 @@ def simulate_seir(pop: int, S0: float, E0: float, I0: float, R0: float,
 def rt_from_params(params: SEIRParams) -> float:
     # In classic SIR/SEIR with constant params, R0 approx beta/gamma
     return float(params.beta / params.gamma)
+
+def simulate_seir_batch(pop, S0, E0, I0, R0, beta, sigma, gamma,
+                        days: int, dt: float = 1.0) -> dict[str, np.ndarray]:
+    """
+    Vectorized Euler integration over many parameter sets at once.
+    pop/S0/E0/I0/R0/beta/sigma/gamma may be scalars or arrays that broadcast
+    to a common shape P (e.g. (n_samples,) or (n_regions, n_samples)).
+    Returns arrays for S, E, I, R with shape P + (n_steps,); each trajectory
+    matches simulate_seir for the same scalar inputs.
+    """
+    pop, S0, E0, I0, R0, beta, sigma, gamma = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (pop, S0, E0, I0, R0, beta, sigma, gamma))
+    )
+    n_steps = int(days / dt) + 1
+    shape = (n_steps,) + beta.shape
+    S = np.zeros(shape); E = np.zeros(shape); I = np.zeros(shape); R = np.zeros(shape)
+    S[0], E[0], I[0], R[0] = S0, E0, I0, R0
+
+    for t in range(1, n_steps):
+        s, e, i, r = S[t-1], E[t-1], I[t-1], R[t-1]
+
+        new_exposed = beta * s * i / pop
+        new_infectious = sigma * e
+        new_recovered = gamma * i
+
+        np.maximum(0.0, s - new_exposed * dt, out=S[t])
+        np.maximum(0.0, e + (new_exposed - new_infectious) * dt, out=E[t])
+        np.maximum(0.0, i + (new_infectious - new_recovered) * dt, out=I[t])
+        np.maximum(0.0, r + new_recovered * dt, out=R[t])
+
+    # time-major while integrating; expose time as the last axis
+    return {k: np.moveaxis(v, 0, -1) for k, v in (("S", S), ("E", E), ("I", I), ("R", R))}
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import base64
+import json
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Composite sort key: region code * DAY_SPAN + day number, where day number
+# counts from ~1435 years before the epoch so historic dates stay positive
+DAY_SPAN = np.int64(1 << 20)
+DAY_OFFSET = np.int64(1 << 19)
+
+class InvalidCursor(ValueError):
+    pass
+
+def encode_cursor(region: str, date: str) -> str:
+    raw = json.dumps([region, date], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        region, date = json.loads(raw)
+        pd.Timestamp(date)
+        return str(region), str(date)
+    except Exception as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+def _days(dates) -> np.ndarray:
+    return pd.to_datetime(pd.Series(dates)).to_numpy(dtype="datetime64[D]").astype(np.int64) + DAY_OFFSET
+
+@dataclass
+class AlertIndex:
+    """
+    Alerts sorted by (region, date) with an int64 composite key per row, so a
+    (regions x date range) query is two vectorized searchsorted calls and the
+    result is a set of contiguous row ranges. Cursors are the last returned
+    (region, date), which stays meaningful across snapshot versions.
+    """
+    frame: pd.DataFrame
+    regions: np.ndarray  # sorted unique region names; index = region code
+    keys: np.ndarray     # sorted composite keys aligned with frame
+    levels: np.ndarray   # frame["level"] as a plain array, for cheap row masks
+
+    @classmethod
+    def build(cls, alerts: pd.DataFrame) -> "AlertIndex":
+        frame = alerts.sort_values(["region", "date"], kind="stable").reset_index(drop=True)
+        codes, regions = pd.factorize(frame["region"], sort=True)
+        keys = codes.astype(np.int64) * DAY_SPAN + _days(frame["date"]) if len(frame) else np.empty(0, np.int64)
+        return cls(frame=frame, regions=np.asarray(regions, dtype=object), keys=keys,
+                   levels=frame["level"].to_numpy(dtype=object))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def query(
+        self,
+        regions: list[str] | None = None,
+        levels: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[pd.DataFrame, str | None]:
+        """(page, next_cursor); next_cursor is None on the last page."""
+        if regions is None:
+            codes = np.arange(len(self.regions), dtype=np.int64)
+        else:
+            wanted = np.array(sorted(set(regions)), dtype=object)
+            pos = np.searchsorted(self.regions, wanted)
+            ok = pos < len(self.regions)
+            ok[ok] = self.regions[pos[ok]] == wanted[ok]
+            codes = pos[ok].astype(np.int64)
+
+        lo_day = _days([start])[0] if start else 0
+        hi_day = _days([end])[0] if end else DAY_SPAN - 1
+        base = codes * DAY_SPAN
+        lo = np.searchsorted(self.keys, base + lo_day, side="left")
+        hi = np.searchsorted(self.keys, base + hi_day, side="right")
+
+        if cursor is not None:
+            c_region, c_date = decode_cursor(cursor)
+            c_code = np.searchsorted(self.regions, c_region)
+            # resume strictly after (c_region, c_date), even if c_region has no alerts now
+            exact = c_code < len(self.regions) and self.regions[c_code] == c_region
+            after_key = (np.int64(c_code) * DAY_SPAN + _days([c_date])[0] + 1) if exact \
+                else np.int64(c_code) * DAY_SPAN
+            lo = np.maximum(lo, np.searchsorted(self.keys, after_key, side="left"))
+
+        lengths = np.maximum(hi - lo, 0)
+        rows = np.repeat(lo - np.r_[0, np.cumsum(lengths)[:-1]], lengths) + np.arange(lengths.sum())
+        if levels is not None:
+            rows = rows[np.isin(self.levels[rows], list(levels))]
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = self.frame.iloc[rows[-1]]
+            next_cursor = encode_cursor(str(last["region"]), str(last["date"])[:10])
+        return self.frame.iloc[rows].reset_index(drop=True), next_cursor
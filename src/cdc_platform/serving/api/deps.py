@@ -0,0 +1,67 @@
+from __future__ import annotations
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+import pandas as pd
+from fastapi import HTTPException, Request, Response
+
+from ..snapshot import MasterSnapshot, master_state
+from .encoding import compress, encode_frame, negotiate_coding, negotiate_media
+from .executor import PoolSaturated
+from .results import result_cache
+
+RETRY_AFTER_SECONDS = 1
+
+def etag(snapshot: MasterSnapshot) -> str:
+    return f'W/"{snapshot.version}"'
+
+async def current_snapshot(response: Response) -> MasterSnapshot:
+    """
+    The master snapshot for this request, taken once so a hot swap mid-request
+    cannot mix versions. Its version is echoed as ETag / X-Data-Version.
+    """
+    snapshot = master_state.get()
+    if snapshot is None:
+        raise HTTPException(500, "Master snapshot not loaded. Run pipeline first.")
+    response.headers["ETag"] = etag(snapshot)
+    response.headers["X-Data-Version"] = snapshot.version
+    return snapshot
+
+def check_not_modified(request: Request, snapshot: MasterSnapshot) -> None:
+    """304 when the client already holds the response for this snapshot version."""
+    tag = etag(snapshot)
+    if request.headers.get("if-none-match") == tag:
+        raise HTTPException(304, headers={"ETag": tag, "X-Data-Version": snapshot.version})
+
+def table_response(request: Request, snapshot: MasterSnapshot, route: str, params: Hashable,
+                   frame: pd.DataFrame) -> Response:
+    """
+    Encode a result table as the client negotiated: columnar JSON (orjson when
+    installed), Arrow IPC or Parquet, then gzip/zstd. The frame is trusted
+    internal data, so it bypasses response-model validation; encoded bodies
+    are cached per (snapshot version, route, params, format, coding).
+    """
+    media = negotiate_media(request.headers.get("accept"))
+    if media is None:
+        raise HTTPException(406, "Supported formats: application/json, Arrow IPC and Parquet (with pyarrow).")
+    coding = negotiate_coding(request.headers.get("accept-encoding"))
+    key = (snapshot.version, route, params, media, coding)
+    encoded = result_cache.get(key)
+    if encoded is None:
+        encoded = compress(encode_frame(frame, media), coding)
+        result_cache.put(key, encoded)
+    body, applied = encoded
+
+    headers = {"ETag": etag(snapshot), "X-Data-Version": snapshot.version, "Vary": "Accept, Accept-Encoding"}
+    if applied != "identity":
+        headers["Content-Encoding"] = applied
+    return Response(body, media_type=media, headers=headers)
+
+@asynccontextmanager
+async def backpressure() -> AsyncIterator[None]:
+    """Turn a full compute pool into 503 + Retry-After instead of queueing without bound."""
+    try:
+        yield
+    except PoolSaturated:
+        raise HTTPException(503, "Server busy, retry shortly.",
+                            headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import gzip
+import io
+import json
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+try:  # optional: pip install "cdc-surveillance-forecasting-platform[parquet]"
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_ARROW = True
+except ImportError:  # pragma: no cover - depends on environment
+    pa = pq = None
+    HAS_ARROW = False
+
+try:  # optional: pip install "cdc-surveillance-forecasting-platform[fast-api]"
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    HAS_ORJSON = False
+
+try:  # optional: pip install "cdc-surveillance-forecasting-platform[fast-api]"
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+    HAS_ZSTD = False
+
+JSON_MEDIA = "application/json"
+NDJSON_MEDIA = "application/x-ndjson"
+ARROW_STREAM_MEDIA = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA = "application/vnd.apache.parquet"
+
+# Bodies smaller than this are sent uncompressed (header overhead outweighs the gain)
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+def wants(accept: str | None, media_type: str) -> bool:
+    return bool(accept) and media_type in accept
+
+def _accepted(header: str | None) -> list[str]:
+    """Header values in preference order (q-weights honoured, q=0 dropped)."""
+    if not header:
+        return []
+    ranked = []
+    for i, part in enumerate(header.split(",")):
+        value, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for p in params:
+            if p.startswith("q="):
+                try:
+                    q = float(p[2:])
+                except ValueError:
+                    q = 0.0
+        if value and q > 0:
+            ranked.append((-q, i, value.lower()))
+    return [v for _, _, v in sorted(ranked)]
+
+def negotiate_media(accept: str | None) -> str | None:
+    """
+    Body format for a columnar table: JSON unless the client prefers Arrow IPC
+    or Parquet and pyarrow is available. None if nothing acceptable is offered.
+    """
+    offered = [JSON_MEDIA] + ([ARROW_STREAM_MEDIA, PARQUET_MEDIA] if HAS_ARROW else [])
+    accepted = _accepted(accept)
+    if not accepted:
+        return JSON_MEDIA
+    for value in accepted:
+        if value in offered:
+            return value
+        if value in ("*/*", "application/*"):
+            return JSON_MEDIA
+    return None
+
+def negotiate_coding(accept_encoding: str | None) -> str:
+    accepted = _accepted(accept_encoding)
+    for coding in accepted:
+        if coding == "zstd" and HAS_ZSTD:
+            return "zstd"
+        if coding == "gzip":
+            return "gzip"
+    return "identity"
+
+def _json_columns(df: pd.DataFrame) -> dict[str, list]:
+    out = {}
+    for c in df.columns:
+        s = df[c]
+        if pd.api.types.is_datetime64_any_dtype(s):
+            s = s.dt.strftime("%Y-%m-%d")
+        values = s.to_numpy(dtype=object) if s.dtype == object or isinstance(s.dtype, pd.CategoricalDtype) \
+            else s.to_numpy()
+        out[str(c)] = values.tolist()
+    return out
+
+def encode_json(df: pd.DataFrame) -> bytes:
+    """Columnar JSON ({column: [values]}); NaN/None become null."""
+    cols = _json_columns(df)
+    if HAS_ORJSON:
+        return orjson.dumps(cols)
+    clean = {c: [None if isinstance(v, float) and np.isnan(v) else v for v in vals] for c, vals in cols.items()}
+    return json.dumps(clean, separators=(",", ":")).encode()
+
+def encode_frame(df: pd.DataFrame, media: str) -> bytes:
+    if media == ARROW_STREAM_MEDIA:
+        return b"".join(arrow_stream([df]))
+    if media == PARQUET_MEDIA:
+        sink = io.BytesIO()
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink)
+        return sink.getvalue()
+    return encode_json(df)
+
+def compress(body: bytes, coding: str) -> tuple[bytes, str]:
+    """(body, content-coding actually applied)."""
+    if coding == "identity" or len(body) < MIN_COMPRESS_BYTES:
+        return body, "identity"
+    if coding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body), "zstd"
+    return gzip.compress(body, compresslevel=GZIP_LEVEL), "gzip"
+
+def ndjson_lines(records: Iterable[dict]) -> Iterator[bytes]:
+    for rec in records:
+        if HAS_ORJSON:
+            yield orjson.dumps(rec) + b"\n"
+        else:
+            yield json.dumps(rec, separators=(",", ":")).encode() + b"\n"
+
+def arrow_stream(frames: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """Arrow IPC stream, one record batch per frame; the first frame fixes the schema."""
+    sink = io.BytesIO()
+    writer = None
+    for df in frames:
+        batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+        if writer is None:
+            writer = pa.ipc.new_stream(sink, batch.schema)
+        writer.write_batch(batch)
+        yield _drain(sink)
+    if writer is not None:
+        writer.close()
+        yield _drain(sink)
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+from ...config.settings import settings
+from ..snapshot import MasterSnapshot, open_snapshot
+
+
+class PoolSaturated(RuntimeError):
+    """More distinct computations in flight than the pool accepts."""
+
+
+# ---- worker-process side -------------------------------------------------
+
+_WORKER_SNAPSHOTS: OrderedDict[tuple[str, str], MasterSnapshot] = OrderedDict()
+
+
+def _init_worker() -> None:
+    from ...modeling.seir.cache import default_calibration_cache
+    from ..registry.model_registry import seir_calibration_cache_path
+    default_calibration_cache.load(seir_calibration_cache_path())
+
+
+def _run_on_snapshot(root: str, version: str, fn: Callable[..., Any], *args) -> Any:
+    """Map the published snapshot in this worker (once per version) and run fn(frame, *args)."""
+    key = (root, version)
+    snap = _WORKER_SNAPSHOTS.get(key)
+    if snap is None:
+        snap = open_snapshot(Path(root), version)
+        _WORKER_SNAPSHOTS[key] = snap
+        while len(_WORKER_SNAPSHOTS) > 2:
+            _WORKER_SNAPSHOTS.popitem(last=False)
+    return fn(snap.frame, *args)
+
+
+# ---- API-process side ----------------------------------------------------
+
+class ComputePool:
+    """
+    Bounded pool for CPU-bound request work.
+
+    Published snapshots run in worker processes that map the snapshot by
+    version (nothing large is pickled per call); in-process frames (tests,
+    embedded use) run on a thread pool of the same size. Identical keys in
+    flight share one future, and more than `max_pending` distinct
+    computations raise PoolSaturated.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, int(workers))
+        self.max_pending = int(max_pending)
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self._processes: Executor | None = None
+        self._threads: Executor | None = None
+        self.coalesced = 0
+
+    def _executor(self, snapshot: MasterSnapshot) -> Executor:
+        if snapshot.root is not None:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="compute")
+        return self._threads
+
+    def submit(self, key: Hashable, snapshot: MasterSnapshot, fn: Callable[..., Any], *args,
+               bounded: bool = True) -> Future:
+        """
+        Run fn(snapshot.frame, *args) in the pool; fn must be a module-level
+        function. bounded=False (background warm-up) skips the pending cap.
+        """
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.coalesced += 1
+                return fut
+            if bounded and len(self._inflight) >= self.max_pending:
+                raise PoolSaturated(f"{len(self._inflight)} computations pending")
+            if snapshot.root is not None:
+                fut = self._executor(snapshot).submit(
+                    _run_on_snapshot, str(snapshot.root), snapshot.version, fn, *args)
+            else:
+                fut = self._executor(snapshot).submit(fn, snapshot.frame, *args)
+            self._inflight[key] = fut
+        fut.add_done_callback(lambda f: self._done(key, f))
+        return fut
+
+    def _done(self, key: Hashable, fut: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    def shutdown(self) -> None:
+        for ex in (self._processes, self._threads):
+            if ex is not None:
+                ex.shutdown(wait=False, cancel_futures=True)
+        self._processes = self._threads = None
+
+
+compute_pool = ComputePool(workers=settings.api_compute_workers, max_pending=settings.api_max_pending)
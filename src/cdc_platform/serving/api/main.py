@@ -1,20 +1,59 @@
 from __future__ import annotations
+import threading
+from contextlib import asynccontextmanager
+
 import pandas as pd
 from fastapi import FastAPI
 
+from ...config.settings import settings
+from ...modeling.seir.cache import default_calibration_cache
+from ..registry.model_registry import ml_artifacts_path, seir_calibration_cache_path
+from ..snapshot import MasterSnapshot, SnapshotWatcher, master_state
+from .executor import compute_pool
+from .results import warm_up
 from .routes.health import router as health_router
-from .routes.forecasts import router as forecasts_router, set_master as set_master_forecasts
-from .routes.alerts import router as alerts_router, set_master as set_master_alerts
-from .routes.risk_scores import router as risk_router, set_master as set_master_risk
+from .routes.forecasts import router as forecasts_router
+from .routes.alerts import router as alerts_router
+from .routes.risk_scores import router as risk_router
+
+def _warm_in_background(snapshot: MasterSnapshot) -> None:
+    # precompute polled results off the request path; requests that arrive
+    # first simply compute (and cache) their own result
+    threading.Thread(target=warm_up, args=(snapshot, ml_artifacts_path()),
+                     name="result-warm-up", daemon=True).start()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # reuse SEIR fits produced by the forecast DAG / earlier runs
+    default_calibration_cache.load(seir_calibration_cache_path())
+    master_state.add_listener(_warm_in_background)
+    # each worker maps the published snapshot (shared page cache, no private copy)
+    if not master_state.refresh() and master_state.get() is not None:
+        _warm_in_background(master_state.get())
+    # hot-swap snapshots published by the nightly job without a restart
+    watcher = SnapshotWatcher(master_state, settings.snapshot_poll_seconds)
+    watcher.start()
+    try:
+        yield
+    finally:
+        watcher.stop()
+        master_state.remove_listener(_warm_in_background)
+        compute_pool.shutdown()
 
-app = FastAPI(title="CDC Surveillance Forecasting API", version="0.1.0")
+app = FastAPI(title="CDC Surveillance Forecasting API", version="0.1.0", lifespan=lifespan)
 
 app.include_router(health_router)
 app.include_router(forecasts_router)
 app.include_router(alerts_router)
 app.include_router(risk_router)
 
-def wire_master_cache(master: pd.DataFrame) -> None:
-    set_master_forecasts(master)
-    set_master_alerts(master)
-    set_master_risk(master)
+def wire_master_cache(master: pd.DataFrame, publish: bool = False) -> None:
+    """
+    Point all routes at master. With publish=True it is written as the shared
+    memory-mapped snapshot that every worker process maps; otherwise it is
+    served from this process only.
+    """
+    if publish:
+        master_state.publish(master)
+    else:
+        master_state.set_frame(master)
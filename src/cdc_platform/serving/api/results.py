@@ -0,0 +1,190 @@
+from __future__ import annotations
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from ...common.cache import LRUCache
+from ...config.settings import settings
+from ...modeling.early_warning.alert_rules import generate_alerts
+from ...modeling.risk_scoring.sklearn_models import score_latest
+from ...modeling.seir.forecasting import forecast_all_regions, forecast_cases_seir, point_forecast_all_regions
+from ..registry.artifact_manager import artifact_manager
+from ..registry.artifacts_ml import get_ml_artifacts
+from ..snapshot import MasterSnapshot
+from .alert_index import AlertIndex
+from .executor import compute_pool
+from .schemas import BatchForecastRequest, ForecastRequest
+
+# Responses are pure functions of (snapshot version, route, params), so entries
+# never go stale; LRU/TTL only bound memory.
+result_cache = LRUCache(maxsize=settings.result_cache_size, ttl_seconds=settings.result_cache_ttl_seconds)
+
+_MISSING = object()
+
+# ---- pure computations (run in the compute pool; must return picklable values)
+
+def compute_alerts(master: pd.DataFrame) -> AlertIndex:
+    """All alerts for the snapshot, indexed by (region, date) for filtered queries."""
+    alerts = generate_alerts(master)
+    frame = pd.DataFrame([a.__dict__ for a in alerts], columns=["date", "region", "level", "reason"])
+    return AlertIndex.build(frame)
+
+def compute_forecast(master: pd.DataFrame, region: str, horizon_days: int, population: float) -> dict | None:
+    """None when the region is unknown."""
+    df = master[master["region"] == region].sort_values("date")
+    if df.empty:
+        return None
+    out = forecast_cases_seir(df["cases"], pop=population, horizon_days=horizon_days)
+    return {
+        "region": region,
+        "rt0_est": float(out["rt0_est"]),
+        "history_pred": [float(x) for x in out["history_pred"]],
+        "forecast": [float(x) for x in out["forecast"]],
+    }
+
+def compute_all_forecasts(master: pd.DataFrame, horizon_days: int, population: float) -> dict[str, dict | None]:
+    # one batched calibration + simulation for every region (fits land in the
+    # shared cache, so later per-region requests hit them too)
+    out = point_forecast_all_regions(master, pop=population, horizon_days=horizon_days)
+    return {
+        region: {
+            "region": region,
+            "rt0_est": fc["rt0_est"],
+            "history_pred": [float(x) for x in fc["history_pred"]],
+            "forecast": [float(x) for x in fc["forecast"]],
+        }
+        for region, fc in out.items()
+    }
+
+def compute_forecast_bands(
+    master: pd.DataFrame,
+    regions: tuple[str, ...] | None,
+    horizon_days: int,
+    population: float,
+    n_samples: int,
+    quantiles: tuple[float, ...],
+) -> pd.DataFrame:
+    """
+    Forecast-window quantile bands for many regions in one vectorized pass.
+    Shorter horizons are prefixes of the longest one, so a single run at the
+    maximum horizon serves every requested horizon.
+    Columns: region, date (ISO), step (1..horizon_days), rt0_est, q10, q50, ...
+    """
+    if regions is not None:
+        master = master[master["region"].isin(regions)]
+    out = forecast_all_regions(master, pop=population, horizon_days=horizon_days,
+                               n_samples=n_samples, quantiles=quantiles)
+    fc = out[out["kind"] == "forecast"].drop(columns=["kind", "t"]).reset_index(drop=True)
+    fc.insert(2, "step", fc.groupby("region", sort=False).cumcount().to_numpy() + 1)
+    fc["region"] = fc["region"].astype(str)
+    fc["date"] = fc["date"].dt.strftime("%Y-%m-%d")
+    return fc
+
+def compute_risk_scores(master: pd.DataFrame, artifacts_path: str) -> pd.DataFrame:
+    scores = score_latest(master, get_ml_artifacts(Path(artifacts_path))).reset_index(drop=True)
+    scores["date"] = pd.to_datetime(scores["date"]).dt.strftime("%Y-%m-%d")
+    scores["region"] = scores["region"].astype(str)
+    return scores
+
+# ---- cached, pool-backed accessors used by the routes
+
+async def cached(snapshot: MasterSnapshot, route: str, params: Hashable, fn: Callable[..., Any], *args) -> Any:
+    """
+    Cached result of fn(snapshot.frame, *args). Misses run in the compute pool
+    so the event loop stays free; concurrent identical misses share one job.
+    Raises PoolSaturated when the pool's backlog is full.
+    """
+    key = (snapshot.version, route, params)
+    value = result_cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = await asyncio.wrap_future(compute_pool.submit(key, snapshot, fn, *args))
+        result_cache.put(key, value)
+    return value
+
+async def alerts_result(snapshot: MasterSnapshot) -> AlertIndex:
+    return await cached(snapshot, "alerts", (), compute_alerts)
+
+async def forecast_result(snapshot: MasterSnapshot, req: ForecastRequest) -> dict | None:
+    """None when the region is unknown."""
+    params = (req.region, req.horizon_days, req.population)
+    return await cached(snapshot, "forecasts", params, compute_forecast, *params)
+
+async def forecast_bands_result(snapshot: MasterSnapshot, req: BatchForecastRequest) -> pd.DataFrame:
+    regions = None if req.regions == "all" else tuple(sorted(set(req.regions)))
+    params = (regions, max(req.horizons), req.population, req.n_samples, tuple(req.quantiles))
+    return await cached(snapshot, "forecasts-batch", params, compute_forecast_bands, *params)
+
+def _band_columns(bands: pd.DataFrame) -> list[str]:
+    return [c for c in bands.columns if c.startswith("q")]
+
+def iter_band_records(bands: pd.DataFrame, horizons: list[int]) -> Iterator[dict]:
+    """One ForecastBands-shaped dict per (region, horizon), regions in order."""
+    qcols = _band_columns(bands)
+    regions = bands["region"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, regions[1:] != regions[:-1]]) if len(bands) else []
+    ends = np.r_[starts[1:], len(bands)] if len(bands) else []
+    dates = bands["date"].to_numpy()
+    rt0 = bands["rt0_est"].to_numpy()
+    values = {c: bands[c].to_numpy() for c in qcols}
+    for lo, hi in zip(starts, ends):
+        for h in horizons:
+            sl = slice(lo, min(hi, lo + h))
+            yield {
+                "region": regions[lo],
+                "horizon_days": h,
+                "rt0_est": float(rt0[lo]),
+                "dates": dates[sl].tolist(),
+                "bands": {c: values[c][sl].tolist() for c in qcols},
+            }
+
+def iter_band_frames(bands: pd.DataFrame, horizons: list[int]) -> Iterator[pd.DataFrame]:
+    """Long-format frames (one per horizon) with a horizon_days column, for columnar encoders."""
+    for h in horizons:
+        frame = bands[bands["step"] <= h]
+        yield frame.assign(horizon_days=np.full(len(frame), h, dtype=np.int32))
+
+def risk_scores_params(artifacts_path: Path) -> str:
+    """
+    Cache params for risk scores: the artifact's content hash, so retraining
+    invalidates them. Only the file is hashed; the artifacts themselves are
+    loaded by the pool workers that score.
+    """
+    return artifact_manager.content_hash(artifacts_path)
+
+async def risk_scores_result(snapshot: MasterSnapshot, artifacts_path: Path) -> pd.DataFrame:
+    params = risk_scores_params(artifacts_path)
+    return await cached(snapshot, "risk-scores", params, compute_risk_scores, str(artifacts_path))
+
+def warm_up(snapshot: MasterSnapshot, artifacts_path: Path | None = None) -> dict:
+    """
+    Precompute the all-region results dashboards poll for a freshly loaded
+    snapshot: the alert index, risk scores (if artifacts exist) and default-parameter
+    forecasts for every region (one batched fit and simulation). Runs in the
+    compute pool, outside its request backlog limit.
+    """
+    result_cache.clear()  # entries of older versions can no longer be hit
+
+    def run(route: str, params: Hashable, fn: Callable[..., Any], *args) -> Any:
+        key = (snapshot.version, route, params)
+        return compute_pool.submit(key, snapshot, fn, *args, bounded=False).result()
+
+    result_cache.put((snapshot.version, "alerts", ()), run("alerts", (), compute_alerts))
+    done = {"alerts": 1, "risk-scores": 0, "forecasts": 0}
+
+    if artifacts_path is not None and artifacts_path.exists():
+        artifact_version = risk_scores_params(artifacts_path)
+        scores = run("risk-scores", artifact_version, compute_risk_scores, str(artifacts_path))
+        result_cache.put((snapshot.version, "risk-scores", artifact_version), scores)
+        done["risk-scores"] = 1
+
+    defaults = ForecastRequest(region="")
+    forecasts = run("forecasts-all", (defaults.horizon_days, defaults.population),
+                    compute_all_forecasts, defaults.horizon_days, defaults.population)
+    for region, out in forecasts.items():
+        key = (snapshot.version, "forecasts", (region, defaults.horizon_days, defaults.population))
+        result_cache.put(key, out)
+        done["forecasts"] += 1
+    return done
@@ -1,20 +1,57 @@
 from __future__ import annotations
-import pandas as pd
-from fastapi import APIRouter, HTTPException
+import datetime as dt
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from ...snapshot import MasterSnapshot
+from ..alert_index import InvalidCursor
+from ..deps import backpressure, check_not_modified, current_snapshot, table_response
+from ..results import alerts_result
 from ..schemas import AlertsResponse
-from ....modeling.early_warning.alert_rules import generate_alerts
 
 router = APIRouter()
 
-MASTER_CACHE: pd.DataFrame | None = None
+MAX_PAGE_SIZE = 50_000
+
+@router.get(
+    "/alerts",
+    response_model=AlertsResponse,
+    responses={200: {"headers": {"X-Next-Cursor": {"description": "Pass as `cursor` for the next page; "
+                                                                  "absent on the last page."}}}},
+)
+async def alerts(
+    request: Request,
+    region: Optional[List[str]] = Query(None, description="Repeat for several regions."),
+    level: Optional[List[Literal["watch", "warning"]]] = Query(None),
+    start: Optional[dt.date] = Query(None, description="First date (inclusive)."),
+    end: Optional[dt.date] = Query(None, description="Last date (inclusive)."),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(1000, ge=1, le=MAX_PAGE_SIZE),
+    snapshot: MasterSnapshot = Depends(current_snapshot),
+):
+    # alerts depend on the data only, so clients can revalidate by version
+    check_not_modified(request, snapshot)
+    async with backpressure():
+        index = await alerts_result(snapshot)
 
-def set_master(df: pd.DataFrame) -> None:
-    global MASTER_CACHE
-    MASTER_CACHE = df.copy()
+    params = (
+        tuple(sorted(set(region))) if region else None,
+        tuple(sorted(set(level))) if level else None,
+        start.isoformat() if start else None,
+        end.isoformat() if end else None,
+        cursor,
+        limit,
+    )
+    try:
+        page, next_cursor = index.query(
+            regions=list(params[0]) if params[0] else None,
+            levels=list(params[1]) if params[1] else None,
+            start=params[2], end=params[3], cursor=cursor, limit=limit,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(400, str(e))
 
-@router.get("/alerts", response_model=AlertsResponse)
-def alerts():
-    if MASTER_CACHE is None:
-        raise HTTPException(500, "MASTER_CACHE not initialized. Run pipeline first.")
-    alerts = generate_alerts(MASTER_CACHE)
-    return AlertsResponse(alerts=[a.__dict__ for a in alerts])
+    response = table_response(request, snapshot, "alerts", params, page)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
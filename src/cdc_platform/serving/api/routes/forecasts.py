@@ -1,31 +1,52 @@
 from __future__ import annotations
-import pandas as pd
-from fastapi import APIRouter, HTTPException
-from ..schemas import ForecastRequest, ForecastResponse
-from ....modeling.seir.forecasting import forecast_cases_seir
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from ...snapshot import MasterSnapshot
+from ..deps import backpressure, current_snapshot, etag
+from ..encoding import ARROW_STREAM_MEDIA, HAS_ARROW, NDJSON_MEDIA, arrow_stream, ndjson_lines, wants
+from ..results import forecast_bands_result, forecast_result, iter_band_frames, iter_band_records
+from ..schemas import BatchForecastRequest, ForecastBands, ForecastRequest, ForecastResponse
 
 router = APIRouter()
 
-# In a real system this comes from processed storage.
-# For demo, we keep it in-memory via dependency injection or cached global.
-MASTER_CACHE: pd.DataFrame | None = None
-
-def set_master(df: pd.DataFrame) -> None:
-    global MASTER_CACHE
-    MASTER_CACHE = df.copy()
-
 @router.post("/forecasts", response_model=ForecastResponse)
-def forecasts(req: ForecastRequest):
-    if MASTER_CACHE is None:
-        raise HTTPException(500, "MASTER_CACHE not initialized. Run pipeline first.")
-    df = MASTER_CACHE[MASTER_CACHE["region"] == req.region].sort_values("date")
-    if df.empty:
+async def forecasts(req: ForecastRequest, snapshot: MasterSnapshot = Depends(current_snapshot)):
+    async with backpressure():
+        out = await forecast_result(snapshot, req)
+    if out is None:
         raise HTTPException(404, f"Unknown region: {req.region}")
+    return out
+
+@router.post(
+    "/forecasts/batch",
+    response_class=StreamingResponse,
+    responses={200: {
+        "description": f"{NDJSON_MEDIA} lines shaped like ForecastBands (default), "
+                       f"or an Arrow IPC stream with Accept: {ARROW_STREAM_MEDIA}",
+        "content": {NDJSON_MEDIA: {"schema": ForecastBands.model_json_schema()},
+                    ARROW_STREAM_MEDIA: {}},
+    }},
+)
+async def forecasts_batch(
+    req: BatchForecastRequest, request: Request, snapshot: MasterSnapshot = Depends(current_snapshot),
+):
+    """Quantile-band forecasts for many regions and horizons from one vectorized run."""
+    if req.regions != "all":
+        known = set(snapshot.frame["region"].astype(str).unique())
+        unknown = sorted(set(req.regions) - known)
+        if unknown:
+            raise HTTPException(404, f"Unknown regions: {', '.join(unknown[:20])}")
+    arrow = wants(request.headers.get("accept"), ARROW_STREAM_MEDIA)
+    if arrow and not HAS_ARROW:
+        raise HTTPException(406, "Arrow output requires pyarrow on the server.")
+
+    async with backpressure():
+        bands = await forecast_bands_result(snapshot, req)
 
-    out = forecast_cases_seir(df["cases"], pop=req.population, horizon_days=req.horizon_days)
-    return ForecastResponse(
-        region=req.region,
-        rt0_est=float(out["rt0_est"]),
-        history_pred=[float(x) for x in out["history_pred"]],
-        forecast=[float(x) for x in out["forecast"]],
-    )
+    # returned responses bypass the dependency's headers, so set them here
+    headers = {"ETag": etag(snapshot), "X-Data-Version": snapshot.version}
+    if arrow:
+        return StreamingResponse(arrow_stream(iter_band_frames(bands, req.horizons)),
+                                 media_type=ARROW_STREAM_MEDIA, headers=headers)
+    return StreamingResponse(ndjson_lines(iter_band_records(bands, req.horizons)),
+                             media_type=NDJSON_MEDIA, headers=headers)
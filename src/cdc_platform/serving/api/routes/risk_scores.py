@@ -1,28 +1,20 @@
 from __future__ import annotations
-import pandas as pd
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
+from ...snapshot import MasterSnapshot
+from ..deps import backpressure, current_snapshot, table_response
+from ..results import risk_scores_params, risk_scores_result
 from ..schemas import RiskScoresResponse
 from ...registry.model_registry import ml_artifacts_path
-from ...registry.artifacts_ml import load_ml_artifacts
-from ....modeling.risk_scoring.sklearn_models import score_latest
 
 router = APIRouter()
-MASTER_CACHE: pd.DataFrame | None = None
-
-def set_master(df: pd.DataFrame) -> None:
-    global MASTER_CACHE
-    MASTER_CACHE = df.copy()
 
 @router.get("/risk-scores", response_model=RiskScoresResponse)
-def risk_scores():
-    if MASTER_CACHE is None:
-        raise HTTPException(500, "MASTER_CACHE not initialized. Run pipeline first.")
-
+async def risk_scores(request: Request, snapshot: MasterSnapshot = Depends(current_snapshot)):
     path = ml_artifacts_path()
     if not path.exists():
         raise HTTPException(500, "ML artifacts missing. Train them via CLI: `cdc train-ml`.")
 
-    artifacts = load_ml_artifacts(path)
-    scores = score_latest(MASTER_CACHE, artifacts)
-    return RiskScoresResponse(scores=scores.to_dict(orient="records"))
+    async with backpressure():
+        frame = await risk_scores_result(snapshot, path)
+    return table_response(request, snapshot, "risk-scores", risk_scores_params(path), frame)
@@ -1,6 +1,8 @@
 from __future__ import annotations
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Literal, Optional, Union
+
+from ...modeling.seir.forecasting import quantile_label
 
 class ForecastRequest(BaseModel):
     region: str
@@ -13,8 +15,52 @@ class ForecastResponse(BaseModel):
     history_pred: List[float]
     forecast: List[float]
 
+# Table responses are columnar (one array per field). They are built from
+# trusted internal frames and encoded directly, so these models document the
+# JSON shape without validating it per element.
+
 class AlertsResponse(BaseModel):
-    alerts: List[dict]
+    date: List[str]
+    region: List[str]
+    level: List[str]
+    reason: List[str]
 
 class RiskScoresResponse(BaseModel):
-    scores: List[dict]
+    date: List[str]
+    region: List[str]
+    surge_prob_gb: List[Optional[float]]
+    surge_prob_rf: List[Optional[float]]
+    hosp_next7_pred: List[Optional[float]]
+
+class BatchForecastRequest(BaseModel):
+    regions: Union[List[str], Literal["all"]] = "all"
+    horizons: List[int] = Field(default_factory=lambda: [28], min_length=1)
+    population: int = 1_000_000
+    n_samples: int = Field(200, ge=1, le=5000)
+    quantiles: List[float] = Field(default_factory=lambda: [0.1, 0.5, 0.9], min_length=1)
+
+    @field_validator("horizons")
+    @classmethod
+    def _horizons_positive(cls, v: List[int]) -> List[int]:
+        if any(h < 1 or h > 365 for h in v):
+            raise ValueError("horizons must be within 1..365 days")
+        return sorted(set(v))
+
+    @field_validator("quantiles")
+    @classmethod
+    def _quantiles_open_unit(cls, v: List[float]) -> List[float]:
+        if any(not 0.0 < q < 1.0 for q in v):
+            raise ValueError("quantiles must be within (0, 1)")
+        v = sorted(set(v))
+        labels = [quantile_label(q) for q in v]
+        if len(set(labels)) != len(labels):
+            raise ValueError("quantiles must map to distinct band names (at most 6 decimal places of a percent)")
+        return v
+
+class ForecastBands(BaseModel):
+    """One line of a batch forecast stream: a region's forecast for one horizon."""
+    region: str
+    horizon_days: int
+    rt0_est: float
+    dates: List[str]
+    bands: Dict[str, List[float]]  # "q10" -> values aligned with dates
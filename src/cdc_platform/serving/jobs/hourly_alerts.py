@@ -1,9 +1,12 @@
 # src/cdc_platform/serving/jobs/hourly_alerts.py
 from __future__ import annotations
 
+from pathlib import Path
+
 import pandas as pd
 
 from ...modeling.early_warning.alert_rules import generate_alerts
+from ...modeling.early_warning.incremental import AlertState, ChangepointState, update_alerts, update_changepoints
 
 
 def run_hourly_alerts(master: pd.DataFrame) -> pd.DataFrame:
@@ -13,3 +16,23 @@ def run_hourly_alerts(master: pd.DataFrame) -> pd.DataFrame:
     """
     alerts = generate_alerts(master)
     return pd.DataFrame([a.__dict__ for a in alerts])
+
+
+def run_hourly_alerts_incremental(master: pd.DataFrame, state_path: Path) -> pd.DataFrame:
+    """
+    Latest-window variant: only new or revised dates are re-scored against the
+    per-region state stored at state_path. Returns the alert delta
+    (see modeling.early_warning.incremental.update_alerts).
+    """
+    state = AlertState.load(state_path)
+    delta, state = update_alerts(master, state)
+    state.save(state_path)
+    return delta
+
+
+def run_hourly_changepoints(master: pd.DataFrame, state_path: Path) -> pd.DataFrame:
+    """Feed newly arrived days through the per-region online changepoint detectors."""
+    state = ChangepointState.load(state_path)
+    flags, state = update_changepoints(master, state)
+    state.save(state_path)
+    return flags
@@ -7,8 +7,18 @@ from ...data.ingest.pull_mobility import pull_mobility
 from ...data.features.build_features import build_master_table
 from ...data.cleaning.backfill_delays import simple_delay_adjustment
 from ...config.settings import settings
+from ...common.schema import MASTER_SCHEMA
+from ...data.storage.master_store import MasterStore, default_master_store
+
+# Days before the first changed date needed to rebuild features (longest lag: cases_lag14)
+FEATURE_CONTEXT_DAYS = 14
 
 def run_nightly_pipeline(start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Pull, adjust and join every source into the master table, plus ML
+    scores when artifacts exist. Returned in MASTER_SCHEMA's typed form
+    (datetime64 dates, categorical regions, 32-bit values).
+    """
     cases = pull_cases(start_date, end_date)
     hosp = pull_hosp(start_date, end_date)
     ww = pull_wastewater(start_date, end_date)
@@ -20,12 +30,12 @@ def run_nightly_pipeline(start_date: str, end_date: str) -> pd.DataFrame:
     master = build_master_table(cases, hosp, ww, mob)
     try:
         from ..registry.model_registry import ml_artifacts_path
-        from ..registry.artifacts_ml import load_ml_artifacts
+        from ..registry.artifacts_ml import get_ml_artifacts
         from ...modeling.risk_scoring.sklearn_models import score_latest
 
         path = ml_artifacts_path()
         if path.exists():
-            artifacts = load_ml_artifacts(path)
+            artifacts = get_ml_artifacts(path)
             latest_scores = score_latest(master, artifacts)
             # Join latest scores back onto master for the latest day only
             # We'll merge on region and date, leaving historical rows unchanged.
@@ -34,5 +44,45 @@ def run_nightly_pipeline(start_date: str, end_date: str) -> pd.DataFrame:
         # Keep pipeline resilient; ML is optional.
         pass
 
-    return master
+    return MASTER_SCHEMA.to_internal(master)
+
+
+def run_incremental_nightly(
+    end_date: str,
+    store: MasterStore | None = None,
+    initial_days: int = 180,
+    revision_days: int | None = None,
+) -> dict:
+    """
+    Upsert the day's delta into the partitioned master store.
+
+    Only dates after the store's max_date, plus the last `revision_days`
+    already stored (reporting-delay revisions, default
+    settings.nowcast_reporting_delay_days), are rewritten. The pipeline runs
+    on that window plus FEATURE_CONTEXT_DAYS of history so lags and rollups
+    of the rewritten rows are complete; the context rows are not written.
+    An empty store is seeded with `initial_days`.
+    """
+    store = store or default_master_store()
+    end = pd.Timestamp(end_date).normalize()
+    last = store.max_date()
+    if last is None:
+        dirty_start = end - pd.Timedelta(days=initial_days)
+        pull_start = dirty_start
+    else:
+        revision_days = settings.nowcast_reporting_delay_days if revision_days is None else revision_days
+        dirty_start = pd.Timestamp(last) - pd.Timedelta(days=revision_days - 1)
+        pull_start = dirty_start - pd.Timedelta(days=FEATURE_CONTEXT_DAYS)
+
+    if dirty_start > end:
+        return {"rows": 0, "months": [], "start": None, "end": end.date().isoformat()}
 
+    master = run_nightly_pipeline(pull_start.date().isoformat(), end.date().isoformat())
+    delta = master[master["date"] >= dirty_start]
+    months = store.upsert(delta)
+    return {
+        "rows": int(len(delta)),
+        "months": months,
+        "start": dirty_start.date().isoformat(),
+        "end": end.date().isoformat(),
+    }
@@ -0,0 +1,103 @@
+# src/cdc_platform/serving/registry/artifact_manager.py
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from ...config.settings import settings
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class _Entry:
+    stamp: tuple[int, int]  # (mtime_ns, size)
+    sha256: str
+    value: Any
+
+
+class ArtifactManager:
+    """
+    Keeps loaded model artifacts resident. Each get() costs one stat(); the
+    file is hashed only when its mtime/size change, and reloaded only when the
+    hash changes too (a re-copy of identical bytes keeps the loaded object).
+    """
+
+    def __init__(self, mmap_mode: str | None = None):
+        self.mmap_mode = mmap_mode
+        self._entries: dict[Path, _Entry] = {}
+        self._hashes: dict[Path, tuple[tuple[int, int], str]] = {}  # path -> (stamp, sha256)
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int]:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    def _sha256(self, path: Path, stamp: tuple[int, int]) -> str:
+        """File hash for this stamp, computed once per change (caller holds the lock)."""
+        hashed = self._hashes.get(path)
+        if hashed is None or hashed[0] != stamp:
+            hashed = (stamp, _sha256_file(path))
+            self._hashes[path] = hashed
+        return hashed[1]
+
+    def _current(self, path: Path, loader: Callable[..., Any]) -> _Entry:
+        stamp = self._stamp(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry.stamp == stamp:
+            return entry
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                return entry
+            sha = self._sha256(path, stamp)
+            if entry is not None and entry.sha256 == sha:
+                entry = _Entry(stamp, sha, entry.value)
+            else:
+                entry = _Entry(stamp, sha, loader(path, mmap_mode=self.mmap_mode))
+                self.loads += 1
+            self._entries[path] = entry
+            return entry
+
+    def get(self, path: Path, loader: Callable[..., Any]) -> Any:
+        """The loaded artifact at path; loader(path, mmap_mode=...) runs on change only."""
+        return self._current(path, loader).value
+
+    def version(self, path: Path, loader: Callable[..., Any]) -> str:
+        """Content hash of the artifact currently served (loads it if needed)."""
+        return self._current(path, loader).sha256
+
+    def content_hash(self, path: Path) -> str:
+        """
+        Content hash of the artifact file without loading it, for cache keys in
+        processes that never use the artifact itself (one stat() when unchanged).
+        """
+        stamp = self._stamp(path)
+        hashed = self._hashes.get(path)
+        if hashed is not None and hashed[0] == stamp:
+            return hashed[1]
+        with self._lock:
+            return self._sha256(path, stamp)
+
+    def invalidate(self, path: Path | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._hashes.clear()
+            else:
+                self._entries.pop(path, None)
+                self._hashes.pop(path, None)
+
+
+artifact_manager = ArtifactManager(mmap_mode=settings.artifact_mmap_mode)
@@ -6,6 +6,7 @@ import joblib
 
 from ...common.io import ensure_dir
 from ...modeling.risk_scoring.sklearn_models import MLArtifacts
+from .artifact_manager import artifact_manager
 
 
 def save_ml_artifacts(path: Path, artifacts: MLArtifacts) -> None:
@@ -14,5 +15,11 @@ def save_ml_artifacts(path: Path, artifacts: MLArtifacts) -> None:
     joblib.dump(artifacts, path)
 
 
-def load_ml_artifacts(path: Path) -> MLArtifacts:
-    return joblib.load(path)
+def load_ml_artifacts(path: Path, mmap_mode: str | None = None) -> MLArtifacts:
+    # mmap_mode="r" maps the fitted arrays instead of copying them (uncompressed dumps only)
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def get_ml_artifacts(path: Path) -> MLArtifacts:
+    """Resident artifacts: loaded once per process, reloaded when the file changes."""
+    return artifact_manager.get(path, load_ml_artifacts)
@@ -14,4 +14,7 @@ def ml_artifacts_path() -> Path:
     return registry_dir() / "ml_artifacts.joblib"
 
 def bayes_artifacts_path() -> Path:
-    return registry_dir() / "bayes_hierarchical.joblib"
\ No newline at end of file
+    return registry_dir() / "bayes_hierarchical.joblib"
+
+def seir_calibration_cache_path() -> Path:
+    return registry_dir() / "seir_calibrations.json"
@@ -0,0 +1,230 @@
+# src/cdc_platform/serving/snapshot.py
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from ..common.io import ensure_dir
+from ..config.settings import settings
+
+META = "meta.json"
+CURRENT = "CURRENT"
+KEEP_SNAPSHOTS = 2  # current + previous, so workers still mapping it are unaffected
+
+
+@dataclass(frozen=True)
+class MasterSnapshot:
+    version: str
+    frame: pd.DataFrame
+    root: Path | None = None  # snapshot directory; None for in-process frames
+
+
+def snapshot_root() -> Path:
+    return settings.processed_dir / "snapshots"
+
+
+def write_snapshot(df: pd.DataFrame, root: Path) -> str:
+    """
+    Write df as a read-only columnar snapshot: one raw .bin file per column
+    (numbers as-is, datetimes as int64 ns, everything else dictionary-encoded
+    to integer codes + categories in meta.json), then point CURRENT at it.
+    Returns the new version id.
+    """
+    ensure_dir(root)
+    version = f"v{time.time_ns()}"
+    tmp = root / f".{version}.tmp"
+    ensure_dir(tmp)
+
+    columns = []
+    for i, name in enumerate(df.columns):
+        s = df[name]
+        col = {"name": str(name), "file": f"c{i}.bin"}
+        if pd.api.types.is_datetime64_any_dtype(s):
+            values = s.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            col["kind"] = "datetime"
+        elif pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+            values = s.to_numpy()
+            col["kind"] = "number"
+        else:
+            cat = s.astype("category")
+            values = cat.cat.codes.to_numpy()
+            col["kind"] = "category"
+            col["categories"] = [str(c) for c in cat.cat.categories]
+        col["dtype"] = values.dtype.str
+        np.ascontiguousarray(values).tofile(tmp / col["file"])
+        columns.append(col)
+
+    (tmp / META).write_text(json.dumps({"version": version, "rows": int(len(df)), "columns": columns}))
+    tmp.rename(root / version)
+
+    pointer = root / f".{CURRENT}.tmp"
+    pointer.write_text(version)
+    pointer.replace(root / CURRENT)
+
+    for old in sorted(p for p in root.glob("v*") if p.is_dir())[:-KEEP_SNAPSHOTS]:
+        shutil.rmtree(old, ignore_errors=True)
+    return version
+
+
+def current_version(root: Path) -> str | None:
+    pointer = root / CURRENT
+    return pointer.read_text().strip() if pointer.exists() else None
+
+
+def open_snapshot(root: Path, version: str | None = None) -> MasterSnapshot | None:
+    """
+    Map a snapshot read-only. Columns are views over np.memmap, so every
+    process opening the same version shares one copy in the page cache.
+    """
+    version = version or current_version(root)
+    if version is None:
+        return None
+    path = root / version
+    meta = json.loads((path / META).read_text())
+    rows = meta["rows"]
+
+    data = {}
+    for col in meta["columns"]:
+        dtype = np.dtype(col["dtype"])
+        if rows:
+            # plain ndarray view over the map: zero-copy, no memmap subclass in pandas
+            values = np.asarray(np.memmap(path / col["file"], dtype=dtype, mode="r", shape=(rows,)))
+        else:
+            values = np.empty(0, dtype=dtype)
+        if col["kind"] == "datetime":
+            data[col["name"]] = values.view("datetime64[ns]")
+        elif col["kind"] == "category":
+            data[col["name"]] = pd.Categorical.from_codes(values, categories=col["categories"], validate=False)
+        else:
+            data[col["name"]] = values
+    frame = pd.DataFrame(data, copy=False)
+    return MasterSnapshot(version=meta["version"], frame=frame, root=root)
+
+
+class MasterState:
+    """
+    The master table all API routes read from: one shared, read-only frame
+    per process instead of a private copy per route. Swapping is a single
+    reference assignment, so requests in flight keep the frame they started
+    with.
+    """
+
+    def __init__(self, root: Path | None = None):
+        self._root = root
+        self._lock = threading.Lock()
+        self._snapshot: MasterSnapshot | None = None
+        self._mem_versions = 0
+        self._listeners: list[Callable[[MasterSnapshot], None]] = []
+
+    @property
+    def root(self) -> Path:
+        return self._root or snapshot_root()
+
+    def add_listener(self, fn: Callable[[MasterSnapshot], None]) -> None:
+        """fn(snapshot) runs after every swap (e.g. to warm result caches)."""
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[MasterSnapshot], None]) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def _swap(self, snapshot: MasterSnapshot) -> None:
+        self._snapshot = snapshot
+        for fn in self._listeners:
+            fn(snapshot)
+
+    def get(self) -> MasterSnapshot | None:
+        return self._snapshot
+
+    def frame(self) -> pd.DataFrame | None:
+        snap = self._snapshot
+        return None if snap is None else snap.frame
+
+    def set_frame(self, df: pd.DataFrame) -> None:
+        """Serve an in-process frame directly (tests, embedded use); not shared across workers."""
+        with self._lock:
+            self._mem_versions += 1
+            self._swap(MasterSnapshot(version=f"mem{self._mem_versions}", frame=df))
+
+    def publish(self, df: pd.DataFrame) -> str:
+        """Write df as the new on-disk snapshot and switch to it."""
+        version = write_snapshot(df, self.root)
+        self.refresh(force=True)
+        return version
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Map the snapshot CURRENT points at if it differs from ours; True if
+        swapped. A frame set via set_frame is kept unless force.
+        """
+        version = current_version(self.root)
+        snap = self._snapshot
+        if version is None or (snap is not None and snap.version == version):
+            return False
+        if snap is not None and snap.version.startswith("mem") and not force:
+            return False
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.version == version:
+                return False
+            self._swap(open_snapshot(self.root, version))
+        return True
+
+
+class SnapshotWatcher:
+    """
+    Background thread that polls the snapshot pointer and hot-swaps `state`
+    when a new version is published. Only CURRENT's mtime is checked each
+    tick; the new snapshot is mapped outside the request path.
+    """
+
+    def __init__(self, state: MasterState, interval_seconds: float):
+        self.state = state
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._seen_mtime: int | None = None
+
+    def check(self) -> bool:
+        """One poll; True if a new snapshot was swapped in."""
+        pointer = self.state.root / CURRENT
+        try:
+            mtime = pointer.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._seen_mtime:
+            return False
+        self._seen_mtime = mtime
+        return self.state.refresh()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.check()
+            except Exception:
+                # a half-written or pruned snapshot must not kill the watcher;
+                # the next tick retries and requests keep the current frame
+                self._seen_mtime = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + 1)
+            self._thread = None
+
+
+master_state = MasterState()
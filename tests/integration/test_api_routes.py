@@ -21,3 +21,194 @@ def test_api_alerts():
     client = TestClient(app)
     r = client.get("/alerts")
     assert r.status_code == 200
+
+def test_api_forecasts():
+    df = pd.DataFrame({
+        "date": pd.date_range("2026-01-01", periods=30).date.astype(str),
+        "region": ["A"] * 30,
+        "cases": [10 + i for i in range(30)],
+    })
+    wire_master_cache(df)
+    client = TestClient(app)
+    r = client.post("/forecasts", json={"region": "A", "horizon_days": 7})
+    assert r.status_code == 200
+    body = r.json()
+    assert len(body["history_pred"]) == 30
+    assert len(body["forecast"]) == 7
+    assert client.post("/forecasts", json={"region": "Z"}).status_code == 404
+
+def test_master_snapshot_is_shared_and_swappable(tmp_path):
+    import numpy as np
+    from cdc_platform.serving.snapshot import MasterState, open_snapshot
+
+    df = pd.DataFrame({
+        "date": pd.date_range("2026-01-01", periods=30).date.astype(str),
+        "region": ["A"] * 15 + ["B"] * 15,
+        "cases": np.arange(30),
+        "hosp": np.linspace(0, 1, 30),
+    })
+    state = MasterState(tmp_path)
+    v1 = state.publish(df)
+    snap = state.get()
+    assert snap.version == v1
+    pd.testing.assert_frame_equal(snap.frame.astype({"date": str, "region": str}), df)
+    base = snap.frame["cases"].to_numpy()
+    while base.base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
+
+    # another process (here: a second holder) maps the same files
+    other = MasterState(tmp_path)
+    assert other.refresh() and other.get().version == v1
+    assert not other.refresh()
+
+    v2 = state.publish(df.assign(cases=df["cases"] * 2))
+    assert other.refresh() and other.frame()["cases"].iloc[-1] == 58
+    assert snap.frame["cases"].iloc[-1] == 29  # old frame stays valid for in-flight requests
+    assert open_snapshot(tmp_path).version == v2
+
+def test_snapshot_hot_swap_and_etag(tmp_path, monkeypatch):
+    from cdc_platform.serving.snapshot import MasterState, SnapshotWatcher
+
+    df = pd.DataFrame({
+        "date": pd.date_range("2026-01-01", periods=30).date.astype(str),
+        "region": ["A"] * 30,
+        "cases": [10 + i for i in range(30)],
+    })
+    state = MasterState(tmp_path)
+    monkeypatch.setattr("cdc_platform.serving.api.deps.master_state", state)
+    writer = MasterState(tmp_path)  # stands in for the nightly job's process
+    v1 = writer.publish(df)
+
+    watcher = SnapshotWatcher(state, interval_seconds=60)
+    assert watcher.check() and not watcher.check()
+    client = TestClient(app)
+    r = client.get("/alerts")
+    assert r.status_code == 200 and r.headers["X-Data-Version"] == v1
+    assert client.get("/alerts", headers={"If-None-Match": r.headers["ETag"]}).status_code == 304
+
+    in_flight = state.get()
+    v2 = writer.publish(df.assign(cases=df["cases"] * 3))
+    assert watcher.check()
+    r2 = client.get("/alerts", headers={"If-None-Match": r.headers["ETag"]})
+    assert r2.status_code == 200 and r2.headers["X-Data-Version"] == v2
+    assert in_flight.version == v1 and in_flight.frame["cases"].iloc[0] == 10
+
+def test_results_cached_per_snapshot_and_warmed():
+    from cdc_platform.serving.api import results
+    from cdc_platform.serving.snapshot import master_state
+
+    df = pd.DataFrame({
+        "date": list(pd.date_range("2026-01-01", periods=30).date.astype(str)) * 2,
+        "region": ["A"] * 30 + ["B"] * 30,
+        "cases": [10 + i for i in range(30)] + [50 - i for i in range(30)],
+    })
+    wire_master_cache(df)
+    snap = master_state.get()
+    assert results.warm_up(snap) == {"alerts": 1, "risk-scores": 0, "forecasts": 2}
+
+    hits = results.result_cache.hits
+    client = TestClient(app)
+    assert client.get("/alerts").status_code == 200
+    r = client.post("/forecasts", json={"region": "B"})
+    assert r.status_code == 200 and len(r.json()["forecast"]) == 28
+    assert results.result_cache.hits == hits + 2
+
+    # a new snapshot version never serves the previous version's results
+    wire_master_cache(df.assign(cases=df["cases"] + 100))
+    r2 = client.post("/forecasts", json={"region": "B"})
+    assert r2.json()["history_pred"] != r.json()["history_pred"]
+
+def test_saturated_pool_returns_503(monkeypatch):
+    from cdc_platform.serving.api.executor import compute_pool
+
+    df = pd.DataFrame({"date": ["2026-01-01"], "region": ["A"], "cases": [1]})
+    wire_master_cache(df)
+    monkeypatch.setattr(compute_pool, "max_pending", 0)
+    r = TestClient(app).get("/alerts")
+    assert r.status_code == 503 and r.headers["Retry-After"] == "1"
+
+def test_forecasts_batch_streams_ndjson_bands():
+    import json
+
+    df = pd.DataFrame({
+        "date": list(pd.date_range("2026-01-01", periods=30).date.astype(str)) * 3,
+        "region": ["A"] * 30 + ["B"] * 30 + ["C"] * 30,
+        "cases": [10 + i for i in range(30)] + [50 - i for i in range(30)] + [20] * 30,
+    })
+    wire_master_cache(df)
+    client = TestClient(app)
+    r = client.post("/forecasts/batch", json={"regions": ["C", "A"], "horizons": [14, 7], "n_samples": 50})
+    assert r.status_code == 200 and r.headers["content-type"].startswith("application/x-ndjson")
+    assert "X-Data-Version" in r.headers
+    lines = [json.loads(l) for l in r.text.splitlines()]
+    assert [(l["region"], l["horizon_days"]) for l in lines] == [("A", 7), ("A", 14), ("C", 7), ("C", 14)]
+    assert lines[1]["dates"][0] == "2026-01-31" and len(lines[1]["dates"]) == 14
+    assert lines[0]["bands"]["q50"] == lines[1]["bands"]["q50"][:7]
+    assert all(lo <= hi for lo, hi in zip(lines[1]["bands"]["q10"], lines[1]["bands"]["q90"]))
+
+    assert len(client.post("/forecasts/batch", json={}).text.splitlines()) == 3
+    assert client.post("/forecasts/batch", json={"regions": ["Z"]}).status_code == 404
+
+def test_forecasts_batch_band_names_are_exact_and_distinct():
+    import json
+
+    df = pd.DataFrame({
+        "date": list(pd.date_range("2026-01-01", periods=30).date.astype(str)),
+        "region": ["A"] * 30,
+        "cases": [10 + i for i in range(30)],
+    })
+    wire_master_cache(df)
+    client = TestClient(app)
+    r = client.post("/forecasts/batch", json={"horizons": [7], "n_samples": 20, "quantiles": [0.29, 0.5, 0.71, 0.005]})
+    assert r.status_code == 200
+    assert set(json.loads(r.text.splitlines()[0])["bands"]) == {"q0.5", "q29", "q50", "q71"}
+
+    r = client.post("/forecasts/batch", json={"quantiles": [0.5, 0.10000000001, 0.1]})
+    assert r.status_code == 422
+
+def test_alerts_columnar_json_negotiation_and_compression():
+    df = pd.DataFrame({
+        "date": list(pd.date_range("2025-01-01", periods=120).date.astype(str)) * 20,
+        "region": [f"R{i}" for i in range(20) for _ in range(120)],
+        "cases": [float((d % 17) * (1 + i % 3) + (d > 90) * d) for i in range(20) for d in range(120)],
+    })
+    wire_master_cache(df)
+    client = TestClient(app)
+
+    r = client.get("/alerts", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200 and r.headers["content-encoding"] == "gzip"
+    body = r.json()
+    assert set(body) == {"date", "region", "level", "reason"}
+    assert len(body["date"]) == len(body["level"]) > 0
+
+    plain = client.get("/alerts", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers and plain.json() == body
+    assert client.get("/alerts", headers={"Accept": "text/csv"}).status_code == 406
+
+def test_alerts_filters_and_cursor_pagination():
+    df = pd.DataFrame({
+        "date": list(pd.date_range("2025-01-01", periods=120).date.astype(str)) * 4,
+        "region": [r for r in ["CA", "NY", "TX", "WA"] for _ in range(120)],
+        "cases": [float((d % 13) * 3 + (d > 80) * d * (1 + i)) for i in range(4) for d in range(120)],
+    })
+    wire_master_cache(df)
+    client = TestClient(app)
+    full = client.get("/alerts", params={"region": ["NY", "TX"], "limit": 50_000}).json()
+    assert set(full["region"]) <= {"NY", "TX"} and len(full["date"]) > 5
+
+    dates, cursor = [], None
+    while True:
+        params = {"region": ["NY", "TX"], "limit": 5, **({"cursor": cursor} if cursor else {})}
+        r = client.get("/alerts", params=params)
+        dates += list(zip(r.json()["region"], r.json()["date"]))
+        cursor = r.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert dates == list(zip(full["region"], full["date"]))
+
+    recent = client.get("/alerts", params={"level": "warning", "start": "2025-04-15", "end": "2025-04-20"}).json()
+    assert set(recent["level"]) <= {"warning"}
+    assert all("2025-04-15" <= d <= "2025-04-20" for d in recent["date"])
+    assert client.get("/alerts", params={"cursor": "!!"}).status_code == 400
+    assert client.get("/alerts", params={"level": "panic"}).status_code == 422
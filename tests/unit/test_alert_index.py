@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cdc_platform.serving.api.alert_index import AlertIndex, InvalidCursor
+
+
+def _alerts(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("1965-06-01", "2026-01-01", freq="7D").strftime("%Y-%m-%d")
+    df = pd.DataFrame({
+        "date": rng.choice(dates, n),
+        "region": rng.choice([f"S{i:02d}" for i in range(40)], n),
+        "level": rng.choice(["watch", "warning"], n),
+        "reason": "x",
+    })
+    return df.drop_duplicates(["region", "date"]).reset_index(drop=True)
+
+
+def test_query_matches_pandas_filter():
+    df = _alerts()
+    index = AlertIndex.build(df)
+    page, cursor = index.query(regions=["S03", "S17", "nope"], levels=["warning"],
+                               start="1969-01-01", end="2020-06-30")
+    expected = df[df["region"].isin(["S03", "S17"]) & (df["level"] == "warning")
+                  & (df["date"] >= "1969-01-01") & (df["date"] <= "2020-06-30")]
+    expected = expected.sort_values(["region", "date"]).reset_index(drop=True)
+    assert cursor is None
+    pd.testing.assert_frame_equal(page, expected)
+
+
+def test_cursor_pages_cover_result_exactly_once():
+    df = _alerts()
+    index = AlertIndex.build(df)
+    pages, cursor = [], None
+    while True:
+        page, cursor = index.query(levels=["watch"], cursor=cursor, limit=97)
+        pages.append(page)
+        if cursor is None:
+            break
+    got = pd.concat(pages, ignore_index=True)
+    full, _ = index.query(levels=["watch"])
+    pd.testing.assert_frame_equal(got, full)
+    assert len(pages) == -(-len(full) // 97)
+
+    with pytest.raises(InvalidCursor):
+        index.query(cursor="not-a-cursor")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from cdc_platform.modeling.early_warning.alert_rules import generate_alerts
 
@@ -12,3 +13,144 @@ def test_generate_alerts_runs():
     })
     alerts = generate_alerts(df)
     assert isinstance(alerts, list)
+
+def _reference_alerts(master):
+    """Previous row-by-row implementation, kept as the parity oracle."""
+    from cdc_platform.modeling.early_warning.alert_rules import Alert
+    from cdc_platform.modeling.early_warning.changepoints import simple_changepoint_flags, rolling_growth_rate
+    from cdc_platform.modeling.early_warning.anomalies import anomaly_flags
+
+    alerts = []
+    df = master.copy()
+    df["date"] = pd.to_datetime(df["date"])
+    has_ml = ("surge_prob_gb" in df.columns) and ("hosp_next7_pred" in df.columns)
+    for region, g in df.groupby("region"):
+        g = g.sort_values("date")
+        cases = g["cases"].astype(float)
+        growth = rolling_growth_rate(cases, window=7)
+        cp = simple_changepoint_flags(cases)
+        anom = anomaly_flags(cases, threshold=3.0)
+        for i in range(len(g)):
+            d = g.iloc[i]["date"].date().isoformat()
+            level = None
+            reasons = []
+            if anom.iloc[i]:
+                level = "watch"
+                reasons.append("cases_anomaly")
+            if cp.iloc[i]:
+                level = "warning"
+                reasons.append("changepoint_growth_shift")
+            if pd.notna(growth.iloc[i]) and growth.iloc[i] > 0.05:
+                level = "warning" if level in (None, "watch") else level
+                reasons.append("sustained_growth")
+            if has_ml:
+                surge_prob = float(g.iloc[i]["surge_prob_gb"]) if pd.notna(g.iloc[i]["surge_prob_gb"]) else None
+                hosp_pred = float(g.iloc[i]["hosp_next7_pred"]) if pd.notna(g.iloc[i]["hosp_next7_pred"]) else None
+                if surge_prob is not None:
+                    if surge_prob >= 0.70:
+                        level = "warning"
+                        reasons.append("ml_surge_prob>= 0.70")
+                    elif surge_prob >= 0.55 and level is None:
+                        level = "watch"
+                        reasons.append("ml_surge_prob>= 0.55")
+                if hosp_pred is not None and hosp_pred >= 25.0:
+                    level = "warning"
+                    reasons.append("ml_hosp_next7_pred>= 25")
+            if level:
+                alerts.append(Alert(date=d, region=region, level=level, reason=";".join(reasons)))
+    dedup = {(a.date, a.region, a.level, a.reason): a for a in alerts}
+    return list(dedup.values())
+
+def test_generate_alerts_matches_reference():
+    rs = np.random.RandomState(1)
+    dates = pd.date_range("2025-01-01", periods=200).date.astype(str)
+    frames = []
+    for r in ["R3", "R1", "R2"]:
+        cases = np.maximum(0, 50 * rs.uniform(0.99, 1.02) ** np.arange(200) + rs.normal(0, 6, 200))
+        cases[rs.randint(0, 200, 5)] *= 4  # spikes
+        frames.append(pd.DataFrame({
+            "date": dates, "region": r, "cases": cases.round(),
+            "surge_prob_gb": np.where(rs.uniform(size=200) < 0.3, rs.uniform(size=200), np.nan),
+            "hosp_next7_pred": rs.uniform(0, 40, 200),
+        }))
+    df = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=0)
+
+    assert generate_alerts(df) == _reference_alerts(df)
+    base = df.drop(columns=["surge_prob_gb", "hosp_next7_pred"])
+    assert generate_alerts(base) == _reference_alerts(base)
+
+def test_incremental_alerts_match_full_run(tmp_path):
+    from cdc_platform.modeling.early_warning.incremental import (
+        REVISION_ROWS, TAIL_ROWS, AlertState, update_alerts,
+    )
+
+    rs = np.random.RandomState(2)
+    dates = pd.date_range("2025-01-01", periods=120).date.astype(str)
+    df = pd.concat([
+        pd.DataFrame({
+            "date": dates, "region": r,
+            "cases": np.maximum(0, rs.normal(100, 20, 120)).round(),
+            "surge_prob_gb": rs.uniform(size=120),
+            "hosp_next7_pred": rs.uniform(0, 30, 120),
+        })
+        for r in ["A", "B", "C"]
+    ], ignore_index=True)
+
+    _, state = update_alerts(df[df["date"] <= "2025-04-20"])
+    state.save(tmp_path / "state.json")
+    state = AlertState.load(tmp_path / "state.json")
+
+    revised = df.copy()
+    revised.loc[revised["date"] == "2025-04-18", "cases"] *= 5
+    delta, state = update_alerts(revised, state)
+    assert set(delta["change"]) <= {"new", "changed", "cleared"}
+    assert (delta["date"] >= "2025-04-18").all()
+
+    full = pd.DataFrame([a.__dict__ for a in generate_alerts(revised)])
+    full = full[full["date"] >= "2025-04-18"].sort_values(["region", "date"]).reset_index(drop=True)
+    got = state.alerts.assign(date=state.alerts["date"].dt.strftime("%Y-%m-%d"))
+    got = got[got["date"] >= "2025-04-18"].sort_values(["region", "date"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(got[full.columns], full)
+
+    delta, _ = update_alerts(revised, state)
+    assert delta.empty
+
+    # an edit to the oldest stored row is context only: the revision window
+    # (last REVISION_ROWS dates) is re-scored against full history, older
+    # dates are not evaluated on a cut-off window
+    stored = state.tail[state.tail["region"] == "A"]["date"].dt.strftime("%Y-%m-%d").tolist()
+    assert len(stored) == TAIL_ROWS
+    window_start = stored[-REVISION_ROWS]
+    oldest = revised.copy()
+    oldest.loc[(oldest["region"] == "A") & (oldest["date"] == stored[0]), "cases"] *= 5
+    delta, new_state = update_alerts(oldest, state)
+    assert (delta["date"] >= window_start).all()
+
+    full = pd.DataFrame([a.__dict__ for a in generate_alerts(oldest)])
+    full = full[full["date"] >= window_start].sort_values(["region", "date"]).reset_index(drop=True)
+    got = new_state.alerts.assign(date=new_state.alerts["date"].dt.strftime("%Y-%m-%d"))
+    got = got[got["date"] >= window_start].sort_values(["region", "date"]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(got[full.columns], full)
+
+def test_online_changepoints_match_batch(tmp_path):
+    from cdc_platform.modeling.early_warning.changepoints import simple_changepoint_flags
+    from cdc_platform.modeling.early_warning.incremental import ChangepointState, update_changepoints
+
+    rs = np.random.RandomState(3)
+    dates = pd.date_range("2025-01-01", periods=300).date.astype(str)
+    frames = []
+    for r in ["A", "B"]:
+        cases = np.maximum(0, 50 * rs.uniform(0.99, 1.02) ** np.arange(300) + rs.normal(0, 6, 300)).round()
+        cases[rs.randint(0, 300, 4)] *= 4
+        cases[rs.randint(0, 300, 3)] = np.nan
+        frames.append(pd.DataFrame({"date": dates, "region": r, "cases": cases}))
+    df = pd.concat(frames, ignore_index=True)
+
+    first, state = update_changepoints(df[df["date"] < "2025-06-01"])
+    state.save(tmp_path / "cp.json")
+    second, _ = update_changepoints(df, ChangepointState.load(tmp_path / "cp.json"))
+    got = pd.concat([first, second], ignore_index=True)
+
+    want = df[simple_changepoint_flags(df["cases"], by=df["region"]).to_numpy()][["date", "region"]]
+    assert got.sort_values(["region", "date"]).values.tolist() == want.sort_values(["region", "date"]).values.tolist()
+    assert len(got) > 0
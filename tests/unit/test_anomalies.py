@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from cdc_platform.modeling.early_warning.windows import RollingQuartiles, rolling_quartiles
+
+
+def _pandas_quartiles(s, window, min_periods, by):
+    g = s.groupby(by, sort=False).rolling(window, min_periods=min_periods)
+    return tuple(r.droplevel(0).reindex(s.index) for r in (g.median(), g.quantile(0.25), g.quantile(0.75)))
+
+
+def test_rolling_quartiles_match_pandas():
+    rs = np.random.RandomState(0)
+    s = pd.Series(rs.normal(100, 20, 600).round())
+    s[rs.randint(0, 600, 40)] = np.nan
+    by = pd.Series(np.tile(["A", "B", "C"], 200))  # interleaved groups
+
+    for got, want in zip(rolling_quartiles(s, 28, 10, by), _pandas_quartiles(s, 28, 10, by)):
+        np.testing.assert_array_equal(got.to_numpy(), want.to_numpy())
+
+    med, q1, q3 = rolling_quartiles(s, 7, 3)
+    np.testing.assert_array_equal(q3.to_numpy(), s.rolling(7, min_periods=3).quantile(0.75).to_numpy())
+
+
+def test_rolling_quartiles_streaming_matches_batch():
+    rs = np.random.RandomState(1)
+    s = pd.Series(rs.normal(0, 1, 200))
+    s[[5, 50, 51]] = np.nan
+    batch = np.column_stack([v.to_numpy() for v in rolling_quartiles(s, 28, 10)])
+
+    rq = RollingQuartiles(28, 10)
+    stream = [rq.update(v) for v in s[:120]]
+    rq = RollingQuartiles.from_dict(rq.to_dict())
+    stream += [rq.update(v) for v in s[120:]]
+    np.testing.assert_array_equal(np.array(stream), batch)
@@ -0,0 +1,44 @@
+import os
+
+import joblib
+import numpy as np
+
+from cdc_platform.serving.registry.artifact_manager import ArtifactManager
+
+
+def _load(path, mmap_mode=None):
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def test_artifact_loaded_once_and_reloaded_on_change(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump({"w": np.arange(100_000, dtype=float)}, path)
+    mgr = ArtifactManager(mmap_mode="r")
+
+    first = mgr.get(path, _load)
+    assert mgr.get(path, _load) is first and mgr.loads == 1
+    assert isinstance(first["w"], np.memmap)
+    version = mgr.version(path, _load)
+
+    # same bytes with a new mtime: hashed, not reloaded
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert mgr.get(path, _load) is first and mgr.loads == 1
+
+    joblib.dump({"w": np.zeros(3)}, path)
+    assert mgr.get(path, _load)["w"].tolist() == [0.0, 0.0, 0.0]
+    assert mgr.loads == 2 and mgr.version(path, _load) != version
+
+
+def test_content_hash_does_not_load(tmp_path):
+    path = tmp_path / "model.joblib"
+    joblib.dump({"w": np.arange(10)}, path)
+    mgr = ArtifactManager()
+
+    sha = mgr.content_hash(path)
+    assert mgr.loads == 0 and mgr.content_hash(path) == sha
+    mgr.get(path, _load)
+    assert mgr.loads == 1 and mgr.version(path, _load) == sha
+
+    joblib.dump({"w": np.zeros(3)}, path)
+    assert mgr.content_hash(path) != sha and mgr.loads == 1
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from cdc_platform.modeling.evaluation.backtesting import rolling_backtest_seir, incremental_backtest_seir
+from cdc_platform.modeling.evaluation.forecast_metrics import coverage, wis
+
+def test_incremental_backtest_matches_rolling_mae():
+    rs = np.random.RandomState(0)
+    df = pd.DataFrame({
+        "date": pd.date_range("2025-01-01", periods=120).date.astype(str),
+        "region": "A",
+        "cases": np.maximum(0, 60 * 1.01 ** np.arange(120) + rs.normal(0, 5, 120)).round(),
+    })
+    ref = rolling_backtest_seir(df, pop=1_000_000, horizon_days=14)
+    out = incremental_backtest_seir(df, pop=1_000_000, horizon_days=14, n_samples=50)
+    assert list(out["cutoff_date"]) == list(ref["cutoff_date"])
+    assert np.allclose(out["mae"], ref["mae"], rtol=1e-6)
+    assert out["coverage_80"].between(0, 1).all()
+    assert (out["wis"] >= 0).all()
+
+def test_incremental_backtest_bands_match_served_forecaster():
+    from cdc_platform.modeling.seir.forecasting import forecast_cases_seir_with_uncertainty
+
+    rs = np.random.RandomState(1)
+    y = np.maximum(0, 40 * 1.015 ** np.arange(100) + rs.normal(0, 4, 100)).round()
+    df = pd.DataFrame({"date": pd.date_range("2025-01-01", periods=100).date.astype(str), "region": "A", "cases": y})
+    quantiles = (0.1, 0.5, 0.9)
+    out = incremental_backtest_seir(df, pop=1_000_000, horizon_days=14, cutoff_indices=[60, 81],
+                                    n_samples=40, quantiles=quantiles)
+    for row, cutoff in zip(out.itertuples(), [60, 81]):
+        served = forecast_cases_seir_with_uncertainty(pd.Series(y[:cutoff]), pop=1_000_000, horizon_days=14,
+                                                      n_samples=40, quantiles=quantiles, cache=None)
+        fut = y[cutoff : cutoff + 14]
+        band = {q: served["forecast"][q] for q in quantiles}
+        assert np.isclose(row.coverage_80, coverage(fut, band[0.1], band[0.9]))
+        assert np.isclose(row.wis, wis(fut, band), rtol=1e-6)
+
+def _sweep_master():
+    rs = np.random.RandomState(2)
+    return pd.DataFrame({
+        "date": list(pd.date_range("2025-01-01", periods=100).date.astype(str)) * 2,
+        "region": ["A"] * 100 + ["B"] * 100,
+        "cases": np.maximum(0, 30 * 1.01 ** np.tile(np.arange(100), 2) + rs.normal(0, 3, 200)).round(),
+    })
+
+def test_plan_backtest_tasks_chunks_cover_grid():
+    from cdc_platform.modeling.evaluation.parallel_backtest import plan_backtest_tasks
+
+    tasks, series = plan_backtest_tasks(_sweep_master(), populations=(1_000, 1_000_000), horizons=(7, 14),
+                                        min_history_days=60, step_days=7, chunk_size=2)
+    assert set(series) == {"A", "B"}
+    assert all(1 <= len(t.cutoff_indices) <= 2 for t in tasks)
+    for region in ("A", "B"):
+        for pop in (1_000, 1_000_000):
+            for h in (7, 14):
+                got = [c for t in tasks if (t.region, t.population, t.horizon_days) == (region, pop, h)
+                       for c in t.cutoff_indices]
+                assert got == list(range(60, 100 - h, 7))
+
+    whole, _ = plan_backtest_tasks(_sweep_master(), horizons=(7, 14), min_history_days=60, step_days=7)
+    assert len(whole) == 2 * 2
+
+def test_iter_backtests_parallel_matches_serial():
+    from cdc_platform.modeling.evaluation.parallel_backtest import iter_backtests
+
+    def run(workers):
+        frames = [r for _, r, _ in iter_backtests(_sweep_master(), horizons=(7, 14), workers=workers, chunk_size=2)]
+        cols = ["region", "population", "horizon_days", "cutoff_date"]
+        return pd.concat(frames).sort_values(cols).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(run(2), run(1))
+
+def test_iter_backtests_warm_starts_later_chunks():
+    from cdc_platform.modeling.evaluation.parallel_backtest import iter_backtests, plan_backtest_tasks, run_backtest_task
+
+    master = _sweep_master()[lambda d: d["region"] == "A"]
+    runs = list(iter_backtests(master, horizons=(7,), chunk_size=2))
+    tasks, series = plan_backtest_tasks(master, horizons=(7,), chunk_size=2)
+    assert [t for t, _, _ in runs] == tasks
+    for (task, bt, _), (prev_task, prev, _) in zip(runs[1:], runs):
+        cold = run_backtest_task(task, series["A"])
+        warm = run_backtest_task(task, series["A"], beta_init=float(prev["beta"].iloc[-1]))
+        pd.testing.assert_frame_equal(bt, warm)
+        assert bt["n_sims"].sum() < cold["n_sims"].sum()
+        assert np.allclose(bt["beta"], cold["beta"], atol=1e-3)
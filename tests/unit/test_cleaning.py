@@ -12,4 +12,23 @@ def test_impute_missing_daily():
     df = pd.DataFrame({"date": ["2026-01-01","2026-01-03"], "region": ["A","A"], "cases": [10,30]})
     out = impute_missing_daily(df, value_cols=["cases"])
     assert len(out) == 3
-    assert out.iloc[1]["cases"] == 20
\ No newline at end of file
+    assert out.iloc[1]["cases"] == 20
+
+def test_impute_missing_daily_grid_per_region():
+    df = pd.DataFrame({
+        "date": ["2026-01-05", "2026-01-01", "2026-01-04", "2026-01-02", "2026-01-06"],
+        "region": ["A", "A", "B", "B", "B"],
+        "cases": [50, 10, 40, 20, 60],
+        "hosp": [None, 1.0, 4.0, None, None],
+        "source": ["x", "x", "y", "y", "y"],
+    })
+    out = impute_missing_daily(df, value_cols=["cases", "hosp"])
+    assert pd.api.types.is_datetime64_any_dtype(out["date"])
+    assert list(out.columns) == ["date", "region", "cases", "hosp", "source"]
+    assert out["region"].tolist() == ["A"] * 5 + ["B"] * 5
+    assert out["date"].dt.day.tolist() == [1, 2, 3, 4, 5, 2, 3, 4, 5, 6]
+    # linear inside a region, never across regions
+    assert out["cases"].tolist() == [10, 20, 30, 40, 50, 20, 30, 40, 50, 60]
+    # leading/trailing gaps take the nearest value in the same region
+    assert out["hosp"].tolist() == [1.0] * 5 + [4.0] * 5
+    assert out["source"].isna().tolist() == [False, True, True, True, False, False, True, False, True, False]
@@ -0,0 +1,46 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from cdc_platform.serving.api.executor import ComputePool, PoolSaturated
+from cdc_platform.serving.snapshot import MasterSnapshot, open_snapshot, write_snapshot
+
+gate = threading.Event()
+
+
+def _blocked_sum(frame, col):
+    gate.wait(5)
+    return float(frame[col].sum())
+
+
+def _sum(frame, col):
+    return float(frame[col].sum())
+
+
+def test_identical_requests_coalesce_and_backlog_is_bounded():
+    gate.clear()
+    pool = ComputePool(workers=1, max_pending=2)
+    snap = MasterSnapshot(version="mem1", frame=pd.DataFrame({"cases": [1.0, 2.0]}))
+
+    a = pool.submit(("mem1", "sum"), snap, _blocked_sum, "cases")
+    b = pool.submit(("mem1", "sum"), snap, _blocked_sum, "cases")
+    assert a is b and pool.coalesced == 1
+    pool.submit(("mem1", "other"), snap, _blocked_sum, "cases")
+    with pytest.raises(PoolSaturated):
+        pool.submit(("mem1", "third"), snap, _blocked_sum, "cases")
+
+    gate.set()
+    assert a.result(timeout=5) == 3.0
+    pool.shutdown()
+    assert pool.pending() == 0
+
+
+def test_published_snapshot_runs_in_worker_process(tmp_path):
+    version = write_snapshot(pd.DataFrame({"cases": [1.0, 2.0, 4.0]}), tmp_path)
+    pool = ComputePool(workers=1, max_pending=4)
+    try:
+        fut = pool.submit((version, "sum"), open_snapshot(tmp_path), _sum, "cases")
+        assert fut.result(timeout=60) == 7.0
+    finally:
+        pool.shutdown()
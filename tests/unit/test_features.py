@@ -11,3 +11,26 @@ def test_add_lags():
     assert "cases_lag1" in out.columns
     assert pd.isna(out.loc[0,"cases_lag1"])
     assert out.loc[1,"cases_lag1"] == 10
+
+def test_build_master_table_stays_typed():
+    import numpy as np
+    from cdc_platform.common.schema import MASTER_SCHEMA
+    from cdc_platform.data.features.build_features import build_master_table
+
+    def src(col, values):
+        return pd.DataFrame({
+            "date": ["2026-01-01", "2026-01-02", "2026-01-04"],
+            "region": ["A", "A", "A"],
+            col: values,
+        })
+
+    master = build_master_table(src("cases", [10, 20, 40]), src("hosp", [1, 2, 4]),
+                                src("ww_viral_load", [0.5, 0.6, 0.7]), src("mobility_index", [1.0, 0.9, 0.8]))
+    assert pd.api.types.is_datetime64_any_dtype(master["date"])
+    assert isinstance(master["region"].dtype, pd.CategoricalDtype)
+    assert master["cases"].dtype == np.int32
+    assert master["cases_lag1"].dtype == np.float32
+    assert master["cases"].tolist() == [10, 20, 30, 40]
+    # already typed: a second pass changes nothing; export is still ISO strings
+    pd.testing.assert_frame_equal(MASTER_SCHEMA.to_internal(master), master)
+    assert MASTER_SCHEMA.coerce(master)["date"].tolist()[-1] == "2026-01-04"
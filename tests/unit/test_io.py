@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from cdc_platform.common import io
+from cdc_platform.common.schema import MASTER_SCHEMA
+
+
+def _master():
+    return pd.DataFrame({
+        "date": ["2026-01-01", "2026-01-02"],
+        "region": ["A", "A"],
+        "cases": [10, 12],
+        "ww_viral_load": [1.0, None],
+    })
+
+
+def test_write_read_table_csv_projection(tmp_path):
+    path = io.write_table(_master(), tmp_path / "master", fmt="csv")
+    assert path.suffix == ".csv"
+    assert io.resolve_table(tmp_path / "master") == path
+
+    df = io.read_table(tmp_path / "master", columns=["date", "cases", "surge_prob_gb"])
+    assert list(df.columns) == ["date", "cases"]
+    assert df["cases"].dtype == "int64"
+    assert df["date"].tolist() == ["2026-01-01", "2026-01-02"]
+
+    parsed = io.read_table(path, columns=["date"], parse_dates=True)
+    assert pd.api.types.is_datetime64_any_dtype(parsed["date"])
+
+
+@pytest.mark.skipif(not io.HAS_PARQUET, reason="pyarrow not installed")
+def test_migrate_table_to_parquet(tmp_path):
+    io.write_table(_master(), tmp_path / "master.csv")
+    dst = io.migrate_table(tmp_path / "master", fmt="parquet")
+    assert dst.suffix == ".parquet" and not (tmp_path / "master.csv").exists()
+    assert io.resolve_table(tmp_path / "master") == dst
+    pd.testing.assert_frame_equal(io.read_table(dst), MASTER_SCHEMA.coerce(_master()))
+
+
+def test_fractional_counts_round_trip(tmp_path):
+    df = _master().assign(cases=[10, 12.5])
+    io.write_table(df, tmp_path / "master", fmt="csv")
+    assert io.read_table(tmp_path / "master")["cases"].tolist() == [10.0, 12.5]
+    assert MASTER_SCHEMA.coerce(df)["cases"].tolist() == [10.0, 12.5]
@@ -0,0 +1,52 @@
+import pandas as pd
+
+from cdc_platform.data.storage.master_store import MasterStore
+from cdc_platform.serving.jobs.nightly_pipeline import run_incremental_nightly
+
+
+def _rows(dates, cases):
+    return pd.DataFrame({"date": dates, "region": "A", "cases": cases})
+
+
+def test_upsert_rewrites_only_touched_months(tmp_path):
+    store = MasterStore(tmp_path / "store")
+    assert store.upsert(_rows(["2026-01-30", "2026-01-31", "2026-02-01"], [1, 2, 3])) == ["2026-01", "2026-02"]
+    jan = store.manifest()["partitions"]["2026-01"]
+
+    # revise Feb 1, append Feb 2: January's file is untouched
+    assert store.upsert(_rows(["2026-02-01", "2026-02-02"], [30, 4])) == ["2026-02"]
+    manifest = store.manifest()
+    assert manifest["partitions"]["2026-01"] == jan
+    assert manifest["max_date"] == "2026-02-02"
+
+    df = store.read()
+    assert df["cases"].tolist() == [1, 2, 30, 4]
+    assert store.read(columns=["cases"], start="2026-02-01")["cases"].tolist() == [30, 4]
+
+
+def test_incremental_nightly_only_writes_delta(tmp_path):
+    store = MasterStore(tmp_path / "store")
+    first = run_incremental_nightly("2026-01-31", store=store, initial_days=40)
+    second = run_incremental_nightly("2026-02-02", store=store, revision_days=3)
+
+    assert second["start"] == "2026-01-29"
+    assert second["rows"] == 3 * 5  # 3 regions x (3 revised + 2 new days)
+    df = store.read()
+    assert not df.duplicated(["region", "date"]).any()
+    assert df["date"].max() == "2026-02-02"
+    assert len(df) == first["rows"] + 3 * 2
+    # features of the delta rows are complete despite the short pull window
+    assert df[df["date"] >= "2026-01-29"]["cases_lag14"].notna().all()
+
+
+def test_load_master_window_and_version(tmp_path):
+    from cdc_platform.data.storage.master_store import load_master, master_version
+
+    store = MasterStore(tmp_path / "store")
+    store.upsert(_rows(["2026-01-30", "2026-01-31", "2026-02-01"], [1, 2, 3]))
+    v1 = master_version(store)
+    window = load_master(start="2026-01-31", end="2026-01-31", store=store)
+    assert window["cases"].tolist() == [2]
+
+    store.upsert(_rows(["2026-02-02"], [4]))
+    assert master_version(store) != v1
@@ -0,0 +1,52 @@
+import threading
+
+import pandas as pd
+
+from cdc_platform.dashboard.memo import RegionMemo
+
+
+def _frame():
+    return pd.DataFrame({
+        "date": list(pd.date_range("2026-01-01", periods=5).date.astype(str)) * 3,
+        "region": ["A"] * 5 + ["B"] * 5 + ["C"] * 5,
+        "cases": list(range(15)),
+    })
+
+
+def test_memo_hits_evicts_and_prefetches_most_viewed():
+    calls = []
+
+    def total(region_frame, params):
+        calls.append(region_frame["region"].iloc[0])
+        return int(region_frame["cases"].sum()) * params[0]
+
+    memo = RegionMemo(total, maxsize=2, prefetch_top=0)
+    frame = _frame()
+    assert memo.get(frame, "B", (2,), context="v1") == 2 * sum(range(5, 10))
+    assert memo.get(frame, "B", (2,), context="v1") == 70 and calls == ["B"]
+    memo.get(frame, "B", (2,), context="v2")  # new data version: recomputed
+    memo.get(frame, "A", (2,), context="v2")  # evicts (v1, B)
+    memo.get(frame, "B", (2,), context="v1")
+    assert calls == ["B", "B", "A", "B"]
+
+    memo.views.update({"C": 5})
+    for fut in memo.prefetch(frame, memo.most_viewed(2), (1,), context="v2"):
+        fut.result()
+    assert ("v2", "C", (1,)) in memo.cache and ("v2", "B", (1,)) in memo.cache
+    n = len(calls)
+    assert memo.get(frame, "C", (1,), context="v2") == sum(range(10, 15)) and len(calls) == n
+
+
+def test_get_waits_for_inflight_prefetch():
+    gate = threading.Event()
+    calls = []
+
+    def slow(region_frame, params):
+        calls.append(1)
+        gate.wait(5)
+        return len(region_frame)
+
+    memo = RegionMemo(slow, prefetch_top=0)
+    (fut,) = memo.prefetch(_frame(), ["A"])
+    threading.Timer(0.05, gate.set).start()
+    assert memo.get(_frame(), "A") == 5 and fut.result() == 5 and calls == [1]
@@ -1,5 +1,11 @@
 import numpy as np
-from cdc_platform.modeling.seir.model import SEIRParams, simulate_seir
+import pandas as pd
+from cdc_platform.modeling.seir.model import SEIRParams, simulate_seir, simulate_seir_batch
+from cdc_platform.modeling.seir.calibration import calibrate_seir_to_cases
+from cdc_platform.modeling.seir.forecasting import (
+    forecast_cases_seir, forecast_cases_seir_with_uncertainty, forecast_all_regions, point_forecast_all_regions,
+)
+from cdc_platform.modeling.seir.cache import CalibrationCache, calib_key
 
 def test_seir_conserves_population():
     pop = 1_000_000
@@ -7,3 +13,120 @@ def test_seir_conserves_population():
     sim = simulate_seir(pop=pop, S0=pop-10, E0=5, I0=5, R0=0, params=params, days=30)
     total = sim["S"] + sim["E"] + sim["I"] + sim["R"]
     assert np.allclose(total, pop, atol=1e-3)
+
+def test_seir_batch_matches_scalar():
+    pop = 1_000_000
+    betas = np.array([0.1, 0.3, 0.8])
+    batch = simulate_seir_batch(pop=pop, S0=pop-10, E0=5, I0=5, R0=0,
+                                beta=betas, sigma=1/4, gamma=1/6, days=60)
+    assert batch["I"].shape == (3, 61)
+    for j, beta in enumerate(betas):
+        sim = simulate_seir(pop=pop, S0=pop-10, E0=5, I0=5, R0=0,
+                            params=SEIRParams(beta=float(beta), sigma=1/4, gamma=1/6), days=60)
+        for comp in ("S", "E", "I", "R"):
+            assert np.allclose(batch[comp][j], sim[comp], rtol=1e-12)
+
+def test_uncertainty_forecast_matches_scalar_sampling():
+    cases = pd.Series(np.round(50 * 1.02 ** np.arange(40)))
+    out = forecast_cases_seir_with_uncertainty(cases, pop=1_000_000, horizon_days=10, n_samples=30)
+
+    # reference: one scalar simulation per beta sample
+    calib = calibrate_seir_to_cases(cases, pop=1_000_000)
+    y = cases.values
+    base = simulate_seir(pop=calib.pop, S0=calib.s0, E0=calib.e0, I0=calib.i0, R0=calib.r0,
+                         params=calib.params, days=len(y) - 1 + 10)["I"][: len(y)]
+    k = (y @ base) / (base @ base + 1e-9)
+    rng = np.random.RandomState(123)
+    sd = max(1e-6, calib.params.beta * 0.15)
+    preds = []
+    for _ in range(30):
+        beta_s = max(1e-6, float(rng.normal(loc=calib.params.beta, scale=sd)))
+        p = SEIRParams(beta=beta_s, sigma=calib.params.sigma, gamma=calib.params.gamma)
+        preds.append(k * simulate_seir(pop=calib.pop, S0=calib.s0, E0=calib.e0, I0=calib.i0,
+                                       R0=calib.r0, params=p, days=len(y) - 1 + 10)["I"])
+    ref = np.quantile(np.stack(preds), q=0.5, axis=0)
+    assert np.allclose(out["forecast"][0.5], ref[len(y):], rtol=1e-9)
+
+def test_forecast_all_regions_matches_per_region():
+    dates = pd.date_range("2026-01-01", periods=40, freq="D")
+    master = pd.concat([
+        pd.DataFrame({"date": dates, "region": "A", "cases": np.round(50 * 1.02 ** np.arange(40))}),
+        pd.DataFrame({"date": dates[10:], "region": "B", "cases": np.round(80 * 0.99 ** np.arange(30))}),
+    ])
+    out = forecast_all_regions(master, pop=1_000_000, horizon_days=7, n_samples=40)
+    for region, g in master.groupby("region"):
+        ref = forecast_cases_seir_with_uncertainty(g["cases"], pop=1_000_000, horizon_days=7, n_samples=40)
+        fut = out[(out["region"] == region) & (out["kind"] == "forecast")]
+        assert len(fut) == 7
+        assert fut["date"].min() == g["date"].max() + pd.Timedelta(days=1)
+        assert np.allclose(fut["q50"].values, ref["forecast"][0.5], rtol=1e-9)
+
+def test_point_forecast_all_regions_matches_per_region():
+    dates = pd.date_range("2026-01-01", periods=40, freq="D")
+    master = pd.concat([
+        pd.DataFrame({"date": dates, "region": "A", "cases": np.round(50 * 1.02 ** np.arange(40))}),
+        pd.DataFrame({"date": dates[10:], "region": "B", "cases": np.round(80 * 0.99 ** np.arange(30))}),
+    ])
+    out = point_forecast_all_regions(master, pop=1_000_000, horizon_days=7, cache=None)
+    assert set(out) == {"A", "B"}
+    for region, g in master.groupby("region"):
+        ref = forecast_cases_seir(g["cases"], pop=1_000_000, horizon_days=7, cache=None)
+        assert np.isclose(out[region]["rt0_est"], ref["rt0_est"])
+        assert np.allclose(out[region]["history_pred"], ref["history_pred"], rtol=1e-9)
+        assert np.allclose(out[region]["forecast"], ref["forecast"], rtol=1e-9)
+
+def test_golden_calibration_beats_grid_with_fewer_sims():
+    cases = pd.Series(np.round(50 * 1.02 ** np.arange(60)))
+    grid = calibrate_seir_to_cases(cases, pop=1_000_000, method="grid")
+    golden = calibrate_seir_to_cases(cases, pop=1_000_000)
+    warm = calibrate_seir_to_cases(cases, pop=1_000_000, beta_init=golden.params.beta)
+    assert golden.loss <= grid.loss
+    assert golden.n_sims < grid.n_sims
+    assert warm.n_sims < golden.n_sims
+    assert abs(warm.params.beta - golden.params.beta) < 1e-3
+
+    joint = calibrate_seir_to_cases(cases, pop=1_000_000, fit_periods=True, fit_initial=True)
+    assert joint.loss <= golden.loss
+
+def test_calibration_cache_reuses_fit(tmp_path):
+    cache = CalibrationCache()
+    cases = pd.Series(np.round(50 * 1.02 ** np.arange(40)))
+    a = forecast_cases_seir(cases, pop=1_000_000, horizon_days=7, cache=cache)
+    assert len(cache) == 1
+    b = forecast_cases_seir(cases, pop=1_000_000, horizon_days=14, cache=cache)
+    assert len(cache) == 1
+    assert np.allclose(a["forecast"], b["forecast"][:7])
+
+    cache.save(tmp_path / "calib.json")
+    other = CalibrationCache()
+    assert other.load(tmp_path / "calib.json") == 1
+    assert other.get(calib_key(cases.values, 1_000_000)) == cache.get(calib_key(cases.values, 1_000_000))
+
+def test_calibration_cache_keys_fit_method():
+    cases = pd.Series(np.round(50 * 1.02 ** np.arange(40)))
+    cache = CalibrationCache()
+    grid = cache.calibrate(cases, pop=1_000_000, method="grid")
+    joint = cache.calibrate(cases, pop=1_000_000, fit_periods=True)
+    golden = cache.calibrate(cases, pop=1_000_000)
+    assert len(cache) == 3
+    assert golden == calibrate_seir_to_cases(cases, pop=1_000_000)
+    assert grid == calibrate_seir_to_cases(cases, pop=1_000_000, method="grid")
+    assert joint.params != golden.params
+    assert calib_key(cases.values, 1_000_000) != calib_key(cases.values, 1_000_000, beta_bounds=(0.1, 2.0))
+
+def test_progressive_uncertainty_refines_to_batch_result():
+    from cdc_platform.modeling.seir.forecasting import iter_forecast_cases_seir_with_uncertainty
+
+    cases = pd.Series(np.round(50 * 1.02 ** np.arange(40)))
+    full = forecast_cases_seir_with_uncertainty(cases, pop=1_000_000, horizon_days=14, n_samples=300, cache=None)
+    steps = list(iter_forecast_cases_seir_with_uncertainty(
+        cases, pop=1_000_000, horizon_days=14, n_samples=300, tol=None, cache=None))
+    assert [s["n_samples_used"] for s in steps] == [50, 100, 200, 300]
+    assert steps[0]["band_change"] is None and not any(s["converged"] for s in steps)
+    for q in (0.1, 0.5, 0.9):
+        np.testing.assert_array_equal(steps[-1]["forecast"][q], full["forecast"][q])
+        np.testing.assert_array_equal(steps[-1]["history"][q], full["history"][q])
+
+    early = list(iter_forecast_cases_seir_with_uncertainty(
+        cases, pop=1_000_000, horizon_days=14, n_samples=300, tol=0.5, cache=None))
+    assert early[-1]["converged"] and early[-1]["n_samples_used"] < 300